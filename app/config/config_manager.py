@@ -6,6 +6,7 @@ import os
 import sys
 import json
 import time
+import hashlib
 from datetime import datetime
 from pathlib import Path
 
@@ -98,6 +99,17 @@ class ConfigManager:
     def get_last_scan(self) -> str | None:
         return self._config.get("last_scan")
 
+    def get_scan_cache(self) -> dict:
+        """Cached scan result and the library fingerprint it was taken at."""
+        return {
+            "fingerprint": self._config.get("scan_fingerprint", ""),
+            "games": self.get_games(),
+        }
+
+    def set_scan_cache(self, fingerprint: str, games: dict):
+        self._config["scan_fingerprint"] = fingerprint
+        self.set_games(games)
+
     # ------------------------------------------------------------------
     # Nexus OAuth
     # ------------------------------------------------------------------
@@ -142,9 +154,38 @@ class ConfigManager:
         self._config["nexus_user"] = info
         self.save()
 
+    @staticmethod
+    def _token_digest(access_token: str) -> str:
+        return hashlib.blake2b(access_token.encode(), digest_size=16).hexdigest()
+
+    def get_nexus_last_validated(self) -> float:
+        """When the current access token last passed validation, or 0."""
+        entry = self._config.get("nexus_validated", {})
+        token = self.get_nexus_access_token()
+        if not token or entry.get("token") != self._token_digest(token):
+            return 0
+        return entry.get("at", 0)
+
+    def set_nexus_last_validated(self, ts: float):
+        # Keyed by a digest so a second copy of the token is never stored
+        self._config["nexus_validated"] = {
+            "token": self._token_digest(self.get_nexus_access_token()),
+            "at": ts,
+        }
+        self.save()
+
+    def get_nexus_version_cache(self) -> dict:
+        """Latest Nexus versions seen: "domain:mod_id" → {"version", "checked"}."""
+        return self._config.get("nexus_version_cache", {})
+
+    def set_nexus_version_cache(self, cache: dict):
+        self._config["nexus_version_cache"] = cache
+        self.save()
+
     def clear_nexus_auth(self):
         self._config.pop("nexus_tokens", None)
         self._config.pop("nexus_user", None)
+        self._config.pop("nexus_validated", None)
         self.save()
 
     # ------------------------------------------------------------------
@@ -259,3 +300,8 @@ class ConfigManager:
     def set(self, key: str, value):
         self._config[key] = value
         self.save()
+
+    def update(self, values: dict):
+        """Set several top-level keys with a single write to disk."""
+        self._config.update(values)
+        self.save()
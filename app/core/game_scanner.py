@@ -3,6 +3,7 @@ Steam library scanning and game detection.
 Ported from server.py.
 """
 
+import hashlib
 import os
 import re
 import sys
@@ -106,6 +107,26 @@ def find_steam_libraries() -> list[str]:
     return list(library_dirs)
 
 
+def library_fingerprint(libraries: list[str] | None = None) -> str:
+    """Cheap digest of the Steam library layout.
+
+    Changes when a library is added or removed (libraryfolders.vdf) or a
+    game is installed or uninstalled in one (steamapps gains/loses a
+    manifest), so a cached scan can be reused while it stays the same.
+    """
+    if libraries is None:
+        libraries = find_steam_libraries()
+    parts = []
+    for lib in sorted(libraries):
+        for rel in ("steamapps", os.path.join("steamapps", "libraryfolders.vdf")):
+            try:
+                mtime = os.stat(os.path.join(lib, rel)).st_mtime_ns
+            except OSError:
+                continue
+            parts.append(f"{lib}|{rel}|{mtime}")
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
 def detect_save_dir(appdata_folder: str) -> str | None:
     appdata = os.environ.get("APPDATA", "")
     if not appdata:
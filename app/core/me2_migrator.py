@@ -416,19 +416,24 @@ def migrate_selected(
     selected_game_ids: set[str],
     me3_exe_path: str,
     config,
+    progress_callback=None,
 ) -> dict:
     """Migrate selected games' mods to ME3 profiles and register in app config.
 
     game_configs: merged dict from merge_scan_results() keyed by game_id
     selected_game_ids: set of game_ids the user chose to import
+    progress_callback(message: str, percent: int)
     """
     games_migrated = []
     mods_imported = []
+    total = len(selected_game_ids) or 1
 
-    for game_id in selected_game_ids:
+    for idx, game_id in enumerate(selected_game_ids):
         gc = game_configs.get(game_id)
         if not gc or game_id not in ME3_GAME_MAP:
             continue
+        if progress_callback:
+            progress_callback(f"Importing mods for {game_id}…", 5 + idx * 90 // total)
 
         existing_mods = config.get_game_mods(game_id)
         existing_paths = {os.path.normpath(m.get("path", "")).lower()
@@ -476,6 +481,9 @@ def migrate_selected(
             game_had_new = True
 
         if game_had_new:
+            if progress_callback:
+                progress_callback(f"Writing ME3 profile for {game_id}…",
+                                  5 + (idx * 90 + 60) // total)
             _rebuild_me3_profile(game_id, me3_exe_path, config)
             games_migrated.append(game_id)
 
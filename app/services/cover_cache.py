@@ -0,0 +1,99 @@
+"""
+Cover art cache — SQLite store for downloaded Steam covers.
+
+Covers are kept as blobs with a soft size cap and least-recently-used
+eviction. Missing covers (HTTP 404) are remembered for a day so games
+without Steam art are not re-requested on every start.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+CACHE_DB = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "resources", "cache", "covers.sqlite")
+MAX_BYTES = 25 * 1024 * 1024
+NEGATIVE_TTL = 24 * 3600
+
+# Returned by get() for a cover that is known not to exist
+NEGATIVE = object()
+
+# One connection shared by every thread; _lock serialises its use
+_lock = threading.Lock()
+_conn: sqlite3.Connection | None = None
+
+
+def _connect() -> sqlite3.Connection:
+    """Return the shared connection, opening it and creating the schema once.
+
+    Must be called with _lock held.
+    """
+    global _conn
+    if _conn is None:
+        os.makedirs(os.path.dirname(CACHE_DB), exist_ok=True)
+        conn = sqlite3.connect(CACHE_DB, timeout=5, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS covers ("
+            "app_id INTEGER PRIMARY KEY, blob BLOB, mtime REAL, "
+            "status INTEGER, last_access REAL)"
+        )
+        _conn = conn
+    return _conn
+
+
+def get(app_id: int):
+    """Return cover bytes, NEGATIVE for a recent 404, or None on a miss."""
+    try:
+        with _lock:
+            conn = _connect()
+            row = conn.execute(
+                "SELECT blob, mtime, status FROM covers WHERE app_id = ?",
+                (app_id,)).fetchone()
+            if row is None:
+                return None
+            blob, mtime, status = row
+            if status != 200:
+                return NEGATIVE if time.time() - mtime < NEGATIVE_TTL else None
+            with conn:
+                conn.execute("UPDATE covers SET last_access = ? WHERE app_id = ?",
+                             (time.time(), app_id))
+            return blob
+    except sqlite3.Error:
+        return None
+
+
+def put(app_id: int, data: bytes | None, status: int = 200):
+    """Store a downloaded cover (status 200) or a negative entry (e.g. 404)."""
+    now = time.time()
+    try:
+        with _lock:
+            conn = _connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO covers "
+                    "(app_id, blob, mtime, status, last_access) VALUES (?, ?, ?, ?, ?)",
+                    (app_id, data if status == 200 else None, now, status, now))
+            if status == 200:
+                _evict(conn)
+    except sqlite3.Error:
+        pass
+
+
+def _evict(conn: sqlite3.Connection):
+    """Drop least-recently-used covers until the total is under MAX_BYTES."""
+    total = conn.execute(
+        "SELECT COALESCE(SUM(LENGTH(blob)), 0) FROM covers").fetchone()[0]
+    if total <= MAX_BYTES:
+        return
+    victims = []
+    for app_id, size in conn.execute(
+            "SELECT app_id, LENGTH(blob) FROM covers "
+            "WHERE blob IS NOT NULL ORDER BY last_access"):
+        if total <= MAX_BYTES:
+            break
+        victims.append((app_id,))
+        total -= size
+    with conn:
+        conn.executemany("DELETE FROM covers WHERE app_id = ?", victims)
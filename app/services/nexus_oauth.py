@@ -250,16 +250,15 @@ class NexusOAuthClient:
     """OAuth 2.0 PKCE client for Nexus Mods desktop authorization.
 
     Usage:
-        client = NexusOAuthClient()
+        client = NexusOAuthClient(on_done)
         client.start()          # opens browser + starts localhost server
-        # poll periodically:
-        tokens, err = client.poll()
-        if tokens:  ...         # got tokens dict
-        if err:     ...         # something went wrong
+        # on_done(tokens, err) is called from the server thread once
+        # tokens arrive or the flow fails; poll() returns the same pair
         client.stop()           # clean up
     """
 
-    def __init__(self):
+    def __init__(self, on_done=None):
+        self._on_done = on_done
         self._tokens: dict | None = None
         self._error: str | None = None
         self._code_verifier: str = ""
@@ -314,6 +313,7 @@ class NexusOAuthClient:
 
     def stop(self):
         """Shut down the callback server and clean up."""
+        self._on_done = None
         self._done.set()
         if self._server:
             try:
@@ -358,3 +358,7 @@ class NexusOAuthClient:
                     self._tokens = tokens
                 self._done.set()
                 break
+
+        on_done = self._on_done
+        if on_done and (self._tokens or self._error):
+            on_done(self._tokens, self._error)
@@ -5,6 +5,7 @@ Nexus Mods API service — mod info, updates, downloads.
 import json
 import os
 import sys
+import threading
 import urllib.request
 import urllib.error
 import urllib.parse
@@ -30,6 +31,14 @@ def _read_version() -> str:
 
 APPLICATION_VERSION = _read_version()
 
+# Serialises OAuth refreshes so concurrent requests don't spend the same
+# refresh token twice.
+_token_lock = threading.Lock()
+
+
+class _Cancelled(Exception):
+    """Raised inside download_file when its cancel event is set."""
+
 
 def parse_nexus_url(url: str) -> "tuple[str, int] | None":
     """Extract (domain, mod_id) from a Nexus Mods URL, or None if not parseable."""
@@ -49,19 +58,24 @@ class NexusService:
             return
         if not self._config.is_nexus_token_expired():
             return
-        tokens = self._config.get_nexus_tokens()
-        refresh_token = tokens.get("refresh_token", "")
-        if not refresh_token:
-            return
-        from app.services.nexus_oauth import refresh_access_token
-        new_tokens = refresh_access_token(refresh_token)
-        if "error" in new_tokens:
-            # Token revoked — clear auth so UI shows login button
-            self._config.clear_nexus_auth()
-            self.access_token = ""
-            return
-        self._config.set_nexus_tokens(new_tokens)
-        self.access_token = new_tokens.get("access_token", "")
+        with _token_lock:
+            if not self._config.is_nexus_token_expired():
+                # Another request refreshed while we waited
+                self.access_token = self._config.get_nexus_access_token()
+                return
+            tokens = self._config.get_nexus_tokens()
+            refresh_token = tokens.get("refresh_token", "")
+            if not refresh_token:
+                return
+            from app.services.nexus_oauth import refresh_access_token
+            new_tokens = refresh_access_token(refresh_token)
+            if "error" in new_tokens:
+                # Token revoked — clear auth so UI shows login button
+                self._config.clear_nexus_auth()
+                self.access_token = ""
+                return
+            self._config.set_nexus_tokens(new_tokens)
+            self.access_token = new_tokens.get("access_token", "")
 
     def _headers(self) -> dict:
         h = {
@@ -100,6 +114,21 @@ class NexusService:
         """Get mod metadata including latest version."""
         return self._get(f"/games/{game_domain}/mods/{mod_id}.json")
 
+    def get_updated_mods(self, game_domain: str, period: str = "1m") -> dict:
+        """Mods changed within *period* ("1d", "1w" or "1m").
+
+        Returns {"updated": {mod_id: unix time of the latest file or page
+        change}} from a single request, or a dict with "error".
+        """
+        result = self._get(f"/games/{game_domain}/mods/updated.json?period={period}")
+        if isinstance(result, dict):
+            return result if "error" in result else {"error": "Unexpected response"}
+        return {"updated": {
+            m["mod_id"]: max(m.get("latest_file_update") or 0,
+                             m.get("latest_mod_activity") or 0)
+            for m in result if "mod_id" in m
+        }}
+
     def get_game_categories(self, game_domain: str) -> list[dict]:
         """Fetch mod categories for a game. Each has category_id, name."""
         result = self._get(f"/games/{game_domain}.json")
@@ -181,10 +210,16 @@ class NexusService:
         game_def: dict,
         temp_dir: str,
         progress_callback=None,
+        cancel=None,
+        fetch_api_version: bool = True,
     ) -> dict:
         """
         Download the latest mod file from Nexus to temp_dir.
         Requires Premium API key for direct download links.
+        ``cancel`` is an optional threading.Event; once set, the download
+        stops at the next step or chunk and its partial file is removed.
+        Pass ``fetch_api_version=False`` when the caller already has the mod
+        info; "api_version" is then returned empty.
         Returns:
           {"success": True, "zip_path": ..., "version": ..., "file_name": ...}
           {"success": False, "error": ..., "nexus_url": ..., "requires_premium": bool}
@@ -210,6 +245,9 @@ class NexusService:
         if progress_callback:
             progress_callback(10, f"Getting download link for {file_name}…")
 
+        if cancel is not None and cancel.is_set():
+            return {"success": False, "error": "Cancelled", "nexus_url": nexus_url}
+
         links = self.get_download_links(domain, mod_id, file_id)
         if not links:
             return {
@@ -224,6 +262,9 @@ class NexusService:
         if not download_url:
             return {"success": False, "error": "No download URL returned", "nexus_url": nexus_url}
 
+        if cancel is not None and cancel.is_set():
+            return {"success": False, "error": "Cancelled", "nexus_url": nexus_url}
+
         os.makedirs(temp_dir, exist_ok=True)
         dest_path = os.path.join(temp_dir, file_name)
 
@@ -235,7 +276,8 @@ class NexusService:
                 # Map download progress (0-100) into 15-95 range
                 progress_callback(15 + int(pct * 0.80), f"Downloading… {pct}%")
 
-        result = self.download_file(download_url, dest_path, progress_callback=_inner_progress)
+        result = self.download_file(download_url, dest_path,
+                                    progress_callback=_inner_progress, cancel=cancel)
         if not result.get("success"):
             return {"success": False, "error": result.get("message", "Download failed"), "nexus_url": nexus_url}
 
@@ -244,8 +286,10 @@ class NexusService:
 
         # Fetch the canonical mod-page version from the Nexus API so callers
         # can store it as the single source of truth for version comparison.
-        mod_info = self.get_mod_info(domain, mod_id)
-        api_version = mod_info.get("version", "") if "error" not in mod_info else ""
+        api_version = ""
+        if fetch_api_version:
+            mod_info = self.get_mod_info(domain, mod_id)
+            api_version = mod_info.get("version", "") if "error" not in mod_info else ""
 
         return {
             "success": True,
@@ -255,9 +299,15 @@ class NexusService:
             "api_version": api_version,
         }
 
-    def download_file(self, url: str, dest_path: str, progress_callback=None) -> dict:
-        """Download a file from a URL with progress reporting."""
+    def download_file(self, url: str, dest_path: str, progress_callback=None,
+                      cancel=None) -> dict:
+        """Download a file from a URL with progress reporting.
+
+        A partial file is removed if the download fails or ``cancel``
+        (a threading.Event) is set between chunks.
+        """
         self._ensure_token()
+        opened = False
         try:
             # Encode any non-ASCII / space characters in the URL path+query while
             # leaving the scheme, host, and already-encoded sequences intact.
@@ -268,16 +318,30 @@ class NexusService:
             with urllib.request.urlopen(req, timeout=60) as resp:
                 total = int(resp.headers.get('Content-Length', 0))
                 downloaded = 0
+                last_pct = -1
                 os.makedirs(os.path.dirname(dest_path), exist_ok=True)
                 with open(dest_path, 'wb') as f:
+                    opened = True
                     while True:
+                        if cancel is not None and cancel.is_set():
+                            raise _Cancelled()
                         chunk = resp.read(65536)
                         if not chunk:
                             break
                         f.write(chunk)
                         downloaded += len(chunk)
                         if progress_callback and total:
-                            progress_callback(int(downloaded / total * 100))
+                            # One callback per percent, not per chunk
+                            pct = int(downloaded / total * 100)
+                            if pct != last_pct:
+                                last_pct = pct
+                                progress_callback(pct)
             return {"success": True, "path": dest_path}
         except Exception as e:
-            return {"success": False, "message": str(e)}
+            if opened:
+                try:
+                    os.remove(dest_path)
+                except OSError:
+                    pass
+            message = "Cancelled" if isinstance(e, _Cancelled) else str(e)
+            return {"success": False, "message": message}
@@ -3,23 +3,138 @@ Steam API service — player counts and cover art.
 """
 
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import time
+import urllib.error
 import urllib.request
 from pathlib import Path
 
 STEAM_API_BASE = "https://api.steampowered.com"
 STEAM_CDN = "https://cdn.cloudflare.steamstatic.com/steam/apps"
 
+# Player counts are shared process-wide: concurrent callers for the same
+# app id wait on one in-flight request. The TTL sits below the UI's 60 s
+# refresh interval so each timer tick actually refetches.
+PLAYER_COUNT_TTL = 55
+_player_count_cache: dict[int, tuple[float, int]] = {}
+_player_count_inflight: dict[int, threading.Event] = {}
+_player_count_lock = threading.Lock()
+
+# Circuit breaker: after _FAILURE_THRESHOLD consecutive network failures,
+# stop calling Steam for an exponentially growing window (5 s up to 5 min).
+_FAILURE_THRESHOLD = 3
+_failures = 0
+_next_retry = 0.0
+
+# get_player_count_async collects app ids for a short window, then fetches
+# them in parallel and fans each result out to every waiting callback.
+_BATCH_DELAY = 0.25
+_batch: dict[int, list] = {}
+_batch_timer: threading.Timer | None = None
+_batch_lock = threading.Lock()
+_batch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="steam")
+
+
+def get_fresh_player_count(steam_app_id: int) -> int | None:
+    """Return the in-memory count if it is younger than the TTL, else None."""
+    cached = _player_count_cache.get(steam_app_id)
+    if cached and time.monotonic() - cached[0] < PLAYER_COUNT_TTL:
+        return cached[1]
+    return None
+
+
+def player_counts_suspended() -> bool:
+    """True while the circuit breaker is holding off after repeated failures."""
+    return time.monotonic() < _next_retry
+
+
+def _record_result(ok: bool):
+    global _failures, _next_retry
+    with _player_count_lock:
+        if ok:
+            _failures = 0
+            _next_retry = 0.0
+            return
+        _failures += 1
+        if _failures >= _FAILURE_THRESHOLD:
+            delay = min(300, 5 * 2 ** (_failures - _FAILURE_THRESHOLD))
+            _next_retry = time.monotonic() + delay
+
 
 def get_player_count(steam_app_id: int) -> int | None:
     if not steam_app_id:
         return None
+    fresh = get_fresh_player_count(steam_app_id)
+    if fresh is not None:
+        return fresh
+    if player_counts_suspended():
+        return None
+
+    with _player_count_lock:
+        event = _player_count_inflight.get(steam_app_id)
+        owner = event is None
+        if owner:
+            event = _player_count_inflight[steam_app_id] = threading.Event()
+    if not owner:
+        event.wait(10)
+        return get_fresh_player_count(steam_app_id)
+
+    try:
+        started = time.monotonic()
+        count = _fetch_player_count(steam_app_id)
+        if count is not None:
+            _player_count_cache[steam_app_id] = (started, count)
+        return count
+    finally:
+        with _player_count_lock:
+            _player_count_inflight.pop(steam_app_id, None)
+        event.set()
+
+
+def get_player_count_async(steam_app_id: int, callback):
+    """Call ``callback(count)`` with the player count, from a worker thread
+    unless the cached value is still fresh. Requests made within
+    _BATCH_DELAY of each other go out together."""
+    global _batch_timer
+    fresh = get_fresh_player_count(steam_app_id)
+    if fresh is not None:
+        callback(fresh)
+        return
+    with _batch_lock:
+        _batch.setdefault(steam_app_id, []).append(callback)
+        if _batch_timer is None:
+            _batch_timer = threading.Timer(_BATCH_DELAY, _flush_batch)
+            _batch_timer.daemon = True
+            _batch_timer.start()
+
+
+def _flush_batch():
+    global _batch_timer
+    with _batch_lock:
+        batch = dict(_batch)
+        _batch.clear()
+        _batch_timer = None
+    app_ids = list(batch)
+    for app_id, count in zip(app_ids, _batch_executor.map(get_player_count, app_ids)):
+        for callback in batch[app_id]:
+            try:
+                callback(count)
+            except Exception:
+                pass
+
+
+def _fetch_player_count(steam_app_id: int) -> int | None:
     try:
         url = f"{STEAM_API_BASE}/ISteamUserStats/GetNumberOfCurrentPlayers/v1/?appid={steam_app_id}"
         req = urllib.request.Request(url, headers={"User-Agent": "FromSoftModManager/2.0"})
         with urllib.request.urlopen(req, timeout=5) as resp:
             data = json.loads(resp.read().decode())
-            if data.get("response", {}).get("result") == 1:
-                return data["response"].get("player_count", 0)
+        _record_result(True)
+        if data.get("response", {}).get("result") == 1:
+            return data["response"].get("player_count", 0)
+    except (urllib.error.URLError, OSError):
+        _record_result(False)
     except Exception:
         pass
     return None
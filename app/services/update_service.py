@@ -4,21 +4,30 @@ App self-update service — check GitHub releases and download the installer.
 
 import os
 import sys
+import functools
 import subprocess
 import tempfile
+import time
 import urllib.request
+from pathlib import Path
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 GITHUB_API = "https://api.github.com/repos/spikehockey75/FromSoftModManager/releases/latest"
 USER_AGENT = "FromSoftModManager/2.0"
 
 
+@functools.lru_cache(maxsize=1)
 def get_current_version() -> str:
     """Read the app version from the bundled VERSION file."""
     if getattr(sys, "frozen", False):
-        base = os.path.join(sys._MEIPASS)
+        base = Path(sys._MEIPASS)
     else:
-        base = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    version_file = os.path.join(base, "VERSION")
+        base = Path(__file__).resolve().parents[2]
+    version_file = base / "VERSION"
     try:
         with open(version_file, "r", encoding="utf-8") as f:
             return f.read().strip()
@@ -41,7 +50,6 @@ def get_latest_release() -> dict:
     or {"error": str} on failure.
     """
     try:
-        import json
         req = urllib.request.Request(
             GITHUB_API,
             headers={
@@ -50,7 +58,7 @@ def get_latest_release() -> dict:
             },
         )
         with urllib.request.urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read().decode())
+            data = _json.loads(resp.read())
 
         tag = data.get("tag_name", "")
         assets = data.get("assets", [])
@@ -122,6 +130,8 @@ def download_and_run_installer(download_url: str, progress_callback=None) -> dic
              open(installer_path, "wb") as f:
             total = int(resp.headers.get("Content-Length", 0))
             downloaded = 0
+            last_emit = 0.0
+            last_pct = -1
             while True:
                 chunk = resp.read(65536)
                 if not chunk:
@@ -130,9 +140,14 @@ def download_and_run_installer(download_url: str, progress_callback=None) -> dic
                 downloaded += len(chunk)
                 if total and progress_callback:
                     pct = 5 + int((downloaded / total) * 85)
-                    progress_callback(
-                        f"Downloading… {downloaded // 1024}KB / {total // 1024}KB", pct
-                    )
+                    now = time.monotonic()
+                    # Cap updates at ~30/s so the UI isn't flooded per chunk
+                    if pct != last_pct and now - last_emit >= 0.033:
+                        last_emit = now
+                        last_pct = pct
+                        progress_callback(
+                            f"Downloading… {downloaded // 1024}KB / {total // 1024}KB", pct
+                        )
     except Exception as e:
         return {"success": False, "message": f"Download failed: {e}"}
 
@@ -0,0 +1,39 @@
+"""Runs blocking UI helpers (downloads, Steam lookups) on the shared QThreadPool.
+
+Results are delivered to a slot on a QObject via a queued invokeMethod,
+so callers never poll and never touch widgets from a worker thread.
+"""
+
+import logging
+from PySide6.QtCore import QMetaObject, QThreadPool, Qt, Q_ARG
+
+log = logging.getLogger(__name__)
+
+
+def submit(fn, receiver, slot: str):
+    """Run ``fn()`` on the shared pool and post its result to ``receiver.slot``.
+
+    The slot must be declared ``@Slot("QVariant")``. If ``fn`` raises, the
+    slot receives ``None`` so the caller can clear any in-flight state.
+    """
+    def _run():
+        try:
+            result = fn()
+        except Exception:
+            log.exception("Background task for %s failed", slot)
+            result = None
+        post(receiver, slot, result)
+
+    QThreadPool.globalInstance().start(_run)
+
+
+def post(receiver, slot: str, result):
+    """Queue ``receiver.slot(result)`` on the receiver's thread.
+
+    Safe to call from any thread, including after the receiver is deleted.
+    """
+    try:
+        QMetaObject.invokeMethod(receiver, slot, Qt.QueuedConnection,
+                                 Q_ARG("QVariant", result))
+    except RuntimeError:
+        pass  # receiver deleted before the task finished
@@ -7,10 +7,56 @@ import os
 import threading
 import webbrowser
 import queue as _queue
+from pathlib import Path
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                                 QPushButton, QLineEdit, QFileDialog,
                                 QProgressBar, QWidget)
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QRunnable, QThreadPool, QCoreApplication
+from app.core.me3_service import slugify, ME3_GAME_MAP
+from app.core.mod_installer import install_mod_from_zip
+from app.services.nexus_service import NexusService, parse_nexus_url
+
+
+# Seconds to wait for the mod-info lookup once the download has finished
+_INFO_TIMEOUT = 30
+
+
+class _InstallRunnable(QRunnable):
+    """Runs an install worker on the install pool."""
+
+    def __init__(self, work):
+        super().__init__()
+        self._work = work
+        self.setAutoDelete(True)
+
+    def run(self):
+        self._work()
+
+
+# Installs get a pool of their own rather than the global one: Qt waits
+# for the global pool at exit, which would hold the app open until a big
+# download finished. On quit, queued installs are dropped and running
+# ones are cancelled through their events.
+_install_pool = QThreadPool()
+# A Nexus install waits on its own info lookup, so leave room for both
+_install_pool.setMaxThreadCount(max(2, _install_pool.maxThreadCount()))
+_install_cancels: set[threading.Event] = set()
+_quit_hooked = False
+
+
+def _start_install(work, cancel: threading.Event):
+    global _quit_hooked
+    if not _quit_hooked:
+        QCoreApplication.instance().aboutToQuit.connect(_cancel_installs)
+        _quit_hooked = True
+    _install_cancels.add(cancel)
+    _install_pool.start(_InstallRunnable(work))
+
+
+def _cancel_installs():
+    _install_pool.clear()
+    for cancel in list(_install_cancels):
+        cancel.set()
 
 
 class AddModDialog(QDialog):
@@ -33,8 +79,15 @@ class AddModDialog(QDialog):
         self._gdef = gdef
         self._queue = _queue.SimpleQueue()
         self._poll_timer = None
+        # Set when the dialog closes so a running download stops
+        self._cancel = threading.Event()
         self._build()
 
+    def done(self, result: int):
+        self._cancel.set()
+        _install_cancels.discard(self._cancel)
+        super().done(result)
+
     def _build(self):
         layout = QVBoxLayout(self)
         layout.setSpacing(14)
@@ -45,7 +98,7 @@ class AddModDialog(QDialog):
         layout.addWidget(title)
 
         desc = QLabel("Paste a Nexus Mods URL to download and install automatically.")
-        desc.setStyleSheet("font-size:11px;color:#8888aa;")
+        desc.setObjectName("muted")
         desc.setWordWrap(True)
         layout.addWidget(desc)
 
@@ -112,7 +165,7 @@ class AddModDialog(QDialog):
         pl.addWidget(self._progress_bar)
 
         self._status_lbl = QLabel("")
-        self._status_lbl.setStyleSheet("font-size:11px;color:#8888aa;")
+        self._status_lbl.setObjectName("muted")
         self._status_lbl.setWordWrap(True)
         pl.addWidget(self._status_lbl)
 
@@ -147,7 +200,7 @@ class AddModDialog(QDialog):
         )
 
     def _browse_zip(self):
-        downloads = os.path.join(os.path.expanduser("~"), "Downloads")
+        downloads = str(Path.home() / "Downloads")
         path, _ = QFileDialog.getOpenFileName(
             self, "Select mod archive", downloads,
             "Archives (*.zip *.7z *.rar);;All files (*)"
@@ -155,8 +208,7 @@ class AddModDialog(QDialog):
         if path:
             self._zip_edit.setText(path)
             if not self._zip_name_edit.text().strip():
-                base = os.path.splitext(os.path.basename(path))[0]
-                self._zip_name_edit.setText(base)
+                self._zip_name_edit.setText(Path(path).stem)
 
     # ── Install trigger ─────────────────────────────────────
 
@@ -180,7 +232,6 @@ class AddModDialog(QDialog):
             self._error_lbl.setVisible(True)
             return
 
-        from app.services.nexus_service import parse_nexus_url
         parsed = parse_nexus_url(nexus_url)
         if not parsed:
             self._error_lbl.setText(
@@ -207,6 +258,11 @@ class AddModDialog(QDialog):
         self._zip_toggle.setEnabled(False)
         self._zip_panel.setEnabled(False)
 
+        # Fresh event per attempt: a failed info lookup cancels its own
+        # download, and a retry must not inherit that
+        _install_cancels.discard(self._cancel)
+        self._cancel = threading.Event()
+
         self._mod_name_lbl.setText(mod_name)
         self._progress_bar.setValue(0)
         self._status_lbl.setText("Starting...")
@@ -218,28 +274,40 @@ class AddModDialog(QDialog):
 
     def _poll(self):
         """Drain the thread-safe queue and update UI."""
-        try:
-            while True:
+        progress = None
+        while True:
+            try:
                 msg = self._queue.get_nowait()
-                tag = msg[0]
-                if tag == "progress":
-                    _, pct, text = msg
-                    self._progress_bar.setValue(pct)
-                    self._status_lbl.setText(text)
-                elif tag == "mod_name":
-                    _, name = msg
-                    self._mod_name_lbl.setText(name)
-                elif tag == "done":
-                    _, result_dict = msg
-                    self._on_done(result_dict)
-                elif tag == "premium_fallback":
-                    _, mod_name, nexus_url = msg
-                    self._on_premium_fallback(mod_name, nexus_url)
-                elif tag == "error":
-                    _, error_msg = msg
-                    self._on_error(error_msg)
-        except _queue.Empty:
-            pass
+            except _queue.Empty:
+                break
+            tag = msg[0]
+            if tag == "progress":
+                # Only the latest progress in a batch is worth painting
+                progress = msg
+                continue
+            if progress:
+                self._apply_progress(progress)
+                progress = None
+            if tag == "mod_name":
+                _, name = msg
+                self._mod_name_lbl.setText(name)
+            elif tag == "done":
+                _, result_dict = msg
+                self._on_done(result_dict)
+            elif tag == "premium_fallback":
+                _, mod_name, nexus_url = msg
+                self._on_premium_fallback(mod_name, nexus_url)
+            elif tag == "error":
+                _, error_msg = msg
+                self._on_error(error_msg)
+        if progress:
+            self._apply_progress(progress)
+
+    def _apply_progress(self, msg: tuple):
+        _, pct, text = msg
+        if pct != self._progress_bar.value():
+            self._progress_bar.setValue(pct)
+        self._status_lbl.setText(text)
 
     def _on_done(self, result_dict: dict):
         """Install succeeded — store result and close."""
@@ -292,7 +360,6 @@ class AddModDialog(QDialog):
     # ── Nexus install flow ──────────────────────────────────
 
     def _start_nexus_install(self, access_token: str, domain: str, nexus_mod_id: int):
-        from app.core.me3_service import slugify, ME3_GAME_MAP
         slug = slugify(f"{domain}-{nexus_mod_id}")
         self._enter_installing(f"Fetching mod info...")
 
@@ -301,22 +368,33 @@ class AddModDialog(QDialog):
         config = self._config
         gdef = self._gdef
         q = self._queue
+        cancel = self._cancel
         is_me3 = game_id in ME3_GAME_MAP
 
         def _work():
-            from app.services.nexus_service import NexusService
-            from app.core.mod_installer import install_mod_from_zip
-
             svc = NexusService(access_token, config=config)
 
-            # 1. Fetch mod info for the name
+            # 1. Fetch mod info for the name alongside the download —
+            #    the name is only needed once the archive is on disk
             q.put(("progress", 2, "Fetching mod info from Nexus..."))
-            mod_info = svc.get_mod_info(domain, nexus_mod_id)
-            if "error" in mod_info:
-                q.put(("error", mod_info["error"]))
-                return
-            mod_name = mod_info.get("name", f"{domain}-{nexus_mod_id}")
-            q.put(("mod_name", mod_name))
+            info_q = _queue.Queue(maxsize=1)
+
+            def _fetch_info():
+                info = {"error": "Could not fetch mod info from Nexus"}
+                try:
+                    info = svc.get_mod_info(domain, nexus_mod_id)
+                except Exception as e:
+                    info = {"error": str(e)}
+                finally:
+                    info_q.put(info)
+                    if "error" in info:
+                        # No point finishing a download for a mod whose
+                        # info failed; the cancel also drops the partial file
+                        cancel.set()
+                    else:
+                        q.put(("mod_name", info.get("name", f"{domain}-{nexus_mod_id}")))
+
+            _install_pool.start(_InstallRunnable(_fetch_info))
 
             # 2. Download
             fake_gdef = dict(gdef)
@@ -328,8 +406,25 @@ class AddModDialog(QDialog):
             def _cb(pct, msg):
                 q.put(("progress", pct, msg))
 
+            # The version comes from mod_info, so skip the service's own lookup
             dl = svc.download_latest_mod(game_id, fake_gdef, temp_dir,
-                                         progress_callback=_cb)
+                                         progress_callback=_cb, cancel=cancel,
+                                         fetch_api_version=False)
+            try:
+                # Closed or quitting: the info may never arrive, don't wait
+                mod_info = info_q.get(block=not cancel.is_set(), timeout=_INFO_TIMEOUT)
+            except _queue.Empty:
+                mod_info = {"error": "Timed out fetching mod info from Nexus"}
+            if "error" in mod_info:
+                if dl.get("zip_path"):
+                    try:
+                        os.remove(dl["zip_path"])
+                    except OSError:
+                        pass
+                q.put(("error", mod_info["error"]))
+                return
+            mod_name = mod_info.get("name", f"{domain}-{nexus_mod_id}")
+
             if not dl.get("success"):
                 if dl.get("requires_premium"):
                     nexus_url = f"https://www.nexusmods.com/{domain}/mods/{nexus_mod_id}?tab=files"
@@ -341,6 +436,12 @@ class AddModDialog(QDialog):
             # 3. Extract / install
             q.put(("progress", 96, "Installing..."))
             zip_path = dl["zip_path"]
+            if cancel.is_set():
+                try:
+                    os.remove(zip_path)
+                except OSError:
+                    pass
+                return
             mod_id = slug
 
             me3_mod_dir = os.path.join(config.get_game_mod_dir(game_id), mod_id)
@@ -360,7 +461,7 @@ class AddModDialog(QDialog):
                 q.put(("error", result.get("message", "Install failed")))
                 return
 
-            version_hint = dl.get("api_version") or dl.get("version", "")
+            version_hint = mod_info.get("version") or dl.get("version", "")
             version = version_hint or result.get("version") or ""
 
             mod_dict = {
@@ -374,13 +475,11 @@ class AddModDialog(QDialog):
             }
             q.put(("done", mod_dict))
 
-        threading.Thread(target=_work, daemon=True).start()
+        _start_install(_work, self._cancel)
 
     # ── Zip install flow ────────────────────────────────────
 
     def _start_zip_install(self, zip_path: str, name: str):
-        from app.core.me3_service import slugify, ME3_GAME_MAP
-
         slug = slugify(name) or "mod"
         self._enter_installing(name)
 
@@ -392,8 +491,6 @@ class AddModDialog(QDialog):
         is_me3 = game_id in ME3_GAME_MAP
 
         def _work():
-            from app.core.mod_installer import install_mod_from_zip
-
             q.put(("progress", 50, f"Extracting {os.path.basename(zip_path)}..."))
 
             me3_mod_dir = os.path.join(config.get_game_mod_dir(game_id), slug)
@@ -425,4 +522,4 @@ class AddModDialog(QDialog):
             }
             q.put(("done", mod_dict))
 
-        threading.Thread(target=_work, daemon=True).start()
+        _start_install(_work, self._cancel)
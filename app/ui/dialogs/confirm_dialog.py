@@ -20,12 +20,12 @@ class ConfirmDialog(QDialog):
         layout.setContentsMargins(20, 20, 20, 20)
 
         lbl_title = QLabel(title)
-        lbl_title.setStyleSheet("font-size:14px;font-weight:700;color:#e0e0ec;")
+        lbl_title.setObjectName("dialog_title")
         layout.addWidget(lbl_title)
 
         lbl_msg = QLabel(message)
         lbl_msg.setWordWrap(True)
-        lbl_msg.setStyleSheet("color:#8888aa;font-size:12px;line-height:1.5;")
+        lbl_msg.setObjectName("dialog_message")
         layout.addWidget(lbl_msg)
 
         btn_row = QHBoxLayout()
@@ -11,7 +11,6 @@ class CoopPasswordDialog(QDialog):
         self.setWindowTitle("Set Co-op Password")
         self.setWindowFlag(Qt.WindowContextHelpButtonHint, False)
         self.setMinimumWidth(400)
-        self.password = ""
         self._build(game_name)
 
     def _build(self, game_name: str):
@@ -20,7 +19,7 @@ class CoopPasswordDialog(QDialog):
         layout.setContentsMargins(20, 20, 20, 20)
 
         title = QLabel("Co-op Password Required")
-        title.setStyleSheet("font-size:14px;font-weight:700;color:#e0e0ec;")
+        title.setObjectName("dialog_title")
         layout.addWidget(title)
 
         msg = QLabel(
@@ -28,7 +27,7 @@ class CoopPasswordDialog(QDialog):
             "Set a password that your friends will also use."
         )
         msg.setWordWrap(True)
-        msg.setStyleSheet("color:#8888aa;font-size:12px;line-height:1.5;")
+        msg.setObjectName("dialog_message")
         layout.addWidget(msg)
 
         self._input = QLineEdit()
@@ -61,5 +60,11 @@ class CoopPasswordDialog(QDialog):
         if not text:
             self._input.setStyleSheet("border:1px solid #e74c3c;")
             return
-        self.password = text
         self.accept()
+
+    @property
+    def password(self) -> str:
+        """The entered password, or empty if the dialog wasn't accepted."""
+        if self.result() != QDialog.Accepted:
+            return ""
+        return self._input.text().strip()
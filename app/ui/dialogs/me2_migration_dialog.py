@@ -6,12 +6,10 @@ Also handles loose mods found in game directories via scan_game_folders().
 """
 
 import os
-import threading
-import queue as _queue
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                                 QPushButton, QProgressBar, QFrame,
                                 QScrollArea, QWidget)
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QObject, QThread, Signal
 
 from app.config.config_manager import ConfigManager
 from app.config.game_definitions import GAME_DEFINITIONS
@@ -19,6 +17,30 @@ from app.core.me2_migrator import migrate_selected
 from app.ui.widgets.toggle_switch import ToggleSwitch
 
 
+class _ImportWorker(QObject):
+    progress = Signal(int, str)
+    finished = Signal(dict)
+
+    def __init__(self, game_configs: dict, selected: set, me3_path: str,
+                 config: ConfigManager):
+        super().__init__()
+        self._game_configs = game_configs
+        self._selected = selected
+        self._me3_path = me3_path
+        self._config = config
+
+    def run(self):
+        def _cb(msg, pct):
+            self.progress.emit(pct, msg)
+        try:
+            result = migrate_selected(self._game_configs, self._selected,
+                                      self._me3_path, self._config,
+                                      progress_callback=_cb)
+        except Exception as e:
+            result = {"success": False, "message": str(e)}
+        self.finished.emit(result)
+
+
 class ME2MigrationDialog(QDialog):
     """Dialog offering to import discovered mods into ME3 profiles.
 
@@ -31,20 +53,22 @@ class ME2MigrationDialog(QDialog):
         self._game_configs = game_configs
         self._me3_exe_path = me3_exe_path
         self._config = config
-        self._pending: _queue.SimpleQueue = _queue.SimpleQueue()
+        self._name_by_id = {gid: GAME_DEFINITIONS.get(gid, {}).get("name", gid)
+                            for gid in game_configs}
         self._toggles: dict[str, ToggleSwitch] = {}
+        self._importing = False
+        self._last_pct = -1
+        self._last_msg = None
 
         self.setWindowTitle("Import Mods")
         self.setWindowFlag(Qt.WindowContextHelpButtonHint, False)
         self.setMinimumWidth(500)
         self.setMinimumHeight(360)
-        self._build()
+        self._build_chrome()
+        # Fill the game list once the dialog has painted
+        QTimer.singleShot(0, self._populate_games)
 
-        self._poll_timer = QTimer(self)
-        self._poll_timer.timeout.connect(self._poll)
-        self._poll_timer.start(100)
-
-    def _build(self):
+    def _build_chrome(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(28, 24, 28, 24)
         layout.setSpacing(16)
@@ -52,10 +76,10 @@ class ME2MigrationDialog(QDialog):
         # Title row
         title_row = QHBoxLayout()
         icon_lbl = QLabel(">>")
-        icon_lbl.setStyleSheet("font-size:24px;font-weight:700;color:#7b8cde;")
+        icon_lbl.setObjectName("me2_title_icon")
         title_row.addWidget(icon_lbl)
         title = QLabel("Import Mods")
-        title.setStyleSheet("font-size:16px;font-weight:700;color:#e0e0ec;")
+        title.setObjectName("me2_title")
         title_row.addWidget(title)
         title_row.addStretch()
         layout.addLayout(title_row)
@@ -66,7 +90,7 @@ class ME2MigrationDialog(QDialog):
             "Select which games to import:"
         )
         desc.setWordWrap(True)
-        desc.setStyleSheet("font-size:12px;color:#a0a0c0;")
+        desc.setObjectName("me2_desc")
         layout.addWidget(desc)
 
         # Scrollable game list
@@ -74,54 +98,11 @@ class ME2MigrationDialog(QDialog):
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
         scroll.setStyleSheet("QScrollArea{background:transparent;}")
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout(scroll_widget)
-        scroll_layout.setContentsMargins(0, 0, 0, 0)
-        scroll_layout.setSpacing(12)
-
-        # Sort games by display name
-        sorted_games = sorted(
-            self._game_configs.items(),
-            key=lambda kv: GAME_DEFINITIONS.get(kv[0], {}).get("name", kv[0])
-        )
-
-        for game_id, gc in sorted_games:
-            game_name = GAME_DEFINITIONS.get(game_id, {}).get("name", game_id)
-            has_mods = bool(gc["packages"]) or bool(gc["natives"])
-
-            # Game row: toggle + name
-            game_row = QHBoxLayout()
-            game_row.setSpacing(10)
-            toggle = ToggleSwitch(checked=has_mods)
-            if not has_mods:
-                toggle.setEnabled(False)
-            self._toggles[game_id] = toggle
-            game_row.addWidget(toggle)
-
-            name_lbl = QLabel(game_name)
-            name_lbl.setStyleSheet("font-size:13px;font-weight:600;color:#e0e0ec;")
-            game_row.addWidget(name_lbl)
-            game_row.addStretch()
-            scroll_layout.addLayout(game_row)
-
-            # Mod list under this game
-            if has_mods:
-                for pkg in gc["packages"]:
-                    mod_lbl = QLabel(f"      {pkg['name']}  (asset mod)")
-                    mod_lbl.setStyleSheet("font-size:11px;color:#8888aa;")
-                    scroll_layout.addWidget(mod_lbl)
-                for dll in gc["natives"]:
-                    dll_name = _dll_display_name(dll)
-                    mod_lbl = QLabel(f"      {dll_name}  (DLL mod)")
-                    mod_lbl.setStyleSheet("font-size:11px;color:#8888aa;")
-                    scroll_layout.addWidget(mod_lbl)
-            else:
-                no_mods = QLabel("      (no additional mods found)")
-                no_mods.setStyleSheet("font-size:11px;color:#555570;")
-                scroll_layout.addWidget(no_mods)
-
-        scroll_layout.addStretch()
-        scroll.setWidget(scroll_widget)
+        self._scroll_widget = QWidget()
+        self._scroll_layout = QVBoxLayout(self._scroll_widget)
+        self._scroll_layout.setContentsMargins(0, 0, 0, 0)
+        self._scroll_layout.setSpacing(12)
+        scroll.setWidget(self._scroll_widget)
         layout.addWidget(scroll, 1)
 
         # Separator
@@ -161,6 +142,59 @@ class ME2MigrationDialog(QDialog):
 
         layout.addLayout(btn_row)
 
+    def _populate_games(self):
+        """Add a toggle row and mod summary for each discovered game."""
+        scroll_widget = self._scroll_widget
+        scroll_layout = self._scroll_layout
+        self.setUpdatesEnabled(False)
+        scroll_widget.setUpdatesEnabled(False)
+
+        # Sort games by display name
+        sorted_games = sorted(
+            self._game_configs.items(),
+            key=lambda kv: self._name_by_id[kv[0]]
+        )
+
+        with_mods = [(gid, gc) for gid, gc in sorted_games
+                     if gc["packages"] or gc["natives"]]
+        without_mods = [gid for gid, gc in sorted_games
+                        if not (gc["packages"] or gc["natives"])]
+
+        for game_id, gc in with_mods:
+            # Game row: toggle + name
+            game_row = QHBoxLayout()
+            game_row.setSpacing(10)
+            toggle = ToggleSwitch(checked=True)
+            self._toggles[game_id] = toggle
+            game_row.addWidget(toggle)
+
+            name_lbl = QLabel(self._name_by_id[game_id])
+            name_lbl.setObjectName("me2_game_name")
+            game_row.addWidget(name_lbl)
+            game_row.addStretch()
+            scroll_layout.addLayout(game_row)
+
+            # Mod list under this game — one label for the whole list
+            lines = [f"      {pkg['name']}  (asset mod)" for pkg in gc["packages"]]
+            lines += [f"      {_dll_display_name(dll)}  (DLL mod)"
+                      for dll in gc["natives"]]
+            mods_lbl = QLabel("\n".join(lines))
+            mods_lbl.setTextFormat(Qt.PlainText)
+            mods_lbl.setObjectName("me2_mod_list")
+            scroll_layout.addWidget(mods_lbl)
+
+        # Games with nothing to import share a single summary line
+        if without_mods:
+            no_mods = QLabel("No additional mods found for: "
+                             + ", ".join(self._name_by_id[g] for g in without_mods))
+            no_mods.setObjectName("me2_no_mods")
+            no_mods.setWordWrap(True)
+            scroll_layout.addWidget(no_mods)
+
+        scroll_layout.addStretch()
+        scroll_widget.setUpdatesEnabled(True)
+        self.setUpdatesEnabled(True)
+
     def _get_selected_ids(self) -> set[str]:
         return {gid for gid, toggle in self._toggles.items() if toggle.isChecked()}
 
@@ -179,44 +213,49 @@ class ME2MigrationDialog(QDialog):
         self._status_lbl.setText("Importing mods...")
         self._status_lbl.setStyleSheet("font-size:11px;color:#8888aa;")
 
-        game_configs = self._game_configs
-        me3_path = self._me3_exe_path
-        config = self._config
-        pending = self._pending
-
-        def _work():
-            pending.put(("progress", 30, "Importing mods..."))
-            result = migrate_selected(game_configs, selected, me3_path, config)
-            pending.put(("progress", 90, "Writing ME3 profiles..."))
-            pending.put(("done", result))
-
-        threading.Thread(target=_work, daemon=True).start()
-
-    def _poll(self):
-        try:
-            while True:
-                item = self._pending.get_nowait()
-                tag = item[0]
-                if tag == "progress":
-                    _, pct, msg = item
-                    self._progress.setValue(pct)
-                    self._status_lbl.setText(msg)
-                elif tag == "done":
-                    _, result = item
-                    self._on_done(result)
-        except _queue.Empty:
-            pass
+        self._importing = True
+        self._last_pct = -1
+        self._last_msg = None
+        self._thread = QThread()
+        self._worker = _ImportWorker(self._game_configs, selected,
+                                     self._me3_exe_path, self._config)
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.run)
+        self._worker.progress.connect(self._on_progress)
+        self._worker.finished.connect(self._on_done)
+        self._worker.finished.connect(self._thread.quit)
+        self._worker.finished.connect(self._worker.deleteLater)
+        self._thread.finished.connect(self._thread.deleteLater)
+        self._thread.start()
+
+    def _on_progress(self, pct: int, msg: str):
+        # Skip repaints when nothing visible changed
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self._progress.setValue(pct)
+        if msg != self._last_msg:
+            self._last_msg = msg
+            self._status_lbl.setText(msg)
+
+    def reject(self):
+        # Stay open until the import thread has finished
+        if self._importing:
+            return
+        super().reject()
 
     def _on_done(self, result: dict):
-        self._poll_timer.stop()
+        self._importing = False
         self._progress.setValue(100)
 
         imported = result.get("mods_imported", [])
         games = result.get("games_migrated", [])
 
-        if imported:
+        if not result.get("success", True):
+            self._status_lbl.setText(f"Import failed: {result.get('message', 'Unknown error')}")
+            self._status_lbl.setStyleSheet("font-size:11px;color:#e74c3c;")
+        elif imported:
             count = len(imported)
-            game_names = [GAME_DEFINITIONS.get(g, {}).get("name", g) for g in games]
+            game_names = [self._name_by_id.get(g, g) for g in games]
             self._status_lbl.setText(
                 f"Imported {count} mod{'s' if count != 1 else ''} "
                 f"for {', '.join(game_names)}"
@@ -235,7 +274,6 @@ class ME2MigrationDialog(QDialog):
 
 def _dll_display_name(dll_path: str) -> str:
     """Derive a friendly display name for a DLL mod."""
-    parent = os.path.basename(os.path.dirname(dll_path))
-    if parent:
-        return parent
-    return os.path.splitext(os.path.basename(dll_path))[0]
+    head, tail = os.path.split(dll_path)
+    parent = os.path.basename(head)
+    return parent or os.path.splitext(tail)[0]
@@ -3,23 +3,37 @@ ME3 setup dialog — shown on startup when ME3 is not installed.
 Blocks the main window until the user installs ME3 or cancels (which exits the app).
 """
 
-import threading
-import queue as _queue
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                                 QPushButton, QProgressBar, QFrame)
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QObject, QThread, Signal
 from PySide6.QtGui import QFont
 from app.core.me3_service import download_and_install_me3
 from app.config.config_manager import ConfigManager
 
 
+class _InstallWorker(QObject):
+    progress = Signal(int, str)
+    finished = Signal(dict)
+
+    def run(self):
+        def _cb(msg, pct):
+            self.progress.emit(pct, msg)
+        try:
+            result = download_and_install_me3(progress_callback=_cb)
+        except Exception as e:
+            result = {"success": False, "message": str(e)}
+        self.finished.emit(result)
+
+
 class ME3SetupDialog(QDialog):
     """Blocking dialog requiring ME3 installation before the app can proceed."""
 
     def __init__(self, config: ConfigManager, parent=None):
         super().__init__(parent)
         self._config = config
-        self._pending: _queue.SimpleQueue = _queue.SimpleQueue()
+        self._installing = False
+        self._last_pct = -1
+        self._last_msg = None
 
         self.setWindowTitle("Mod Engine 3 Required")
         self.setWindowFlag(Qt.WindowContextHelpButtonHint, False)
@@ -28,10 +42,6 @@ class ME3SetupDialog(QDialog):
         self.setMinimumHeight(280)
         self._build()
 
-        self._poll_timer = QTimer(self)
-        self._poll_timer.timeout.connect(self._poll)
-        self._poll_timer.start(100)
-
     def _build(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(28, 24, 28, 24)
@@ -41,11 +51,11 @@ class ME3SetupDialog(QDialog):
         title_row = QHBoxLayout()
         icon_lbl = QLabel("\uE713")
         icon_lbl.setFont(QFont("Segoe MDL2 Assets", 24))
-        icon_lbl.setStyleSheet("color:#e0e0ec;")
+        icon_lbl.setObjectName("me3_title_icon")
         title_row.addWidget(icon_lbl)
 
         title = QLabel("Mod Engine 3 Required")
-        title.setStyleSheet("font-size:16px;font-weight:700;color:#e0e0ec;")
+        title.setObjectName("me3_title")
         title_row.addWidget(title)
         title_row.addStretch()
         layout.addLayout(title_row)
@@ -57,7 +67,7 @@ class ME3SetupDialog(QDialog):
             "Click Install ME3 to download and install it automatically."
         )
         desc.setWordWrap(True)
-        desc.setStyleSheet("font-size:12px;color:#a0a0c0;line-height:1.5;")
+        desc.setObjectName("me3_desc")
         layout.addWidget(desc)
 
         # Separator
@@ -105,33 +115,37 @@ class ME3SetupDialog(QDialog):
         self._progress.setVisible(True)
         self._status_lbl.setText("Starting download…")
 
-        pending = self._pending
-
-        def _work():
-            def _cb(msg, pct):
-                pending.put(("progress", pct, msg))
-            result = download_and_install_me3(progress_callback=_cb)
-            pending.put(("done", result))
-
-        threading.Thread(target=_work, daemon=True).start()
-
-    def _poll(self):
-        try:
-            while True:
-                item = self._pending.get_nowait()
-                tag = item[0]
-                if tag == "progress":
-                    _, pct, msg = item
-                    self._progress.setValue(pct)
-                    self._status_lbl.setText(msg)
-                elif tag == "done":
-                    _, result = item
-                    self._on_install_done(result)
-        except _queue.Empty:
-            pass
+        self._installing = True
+        self._last_pct = -1
+        self._last_msg = None
+        self._thread = QThread()
+        self._worker = _InstallWorker()
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.run)
+        self._worker.progress.connect(self._on_progress)
+        self._worker.finished.connect(self._on_install_done)
+        self._worker.finished.connect(self._thread.quit)
+        self._worker.finished.connect(self._worker.deleteLater)
+        self._thread.finished.connect(self._thread.deleteLater)
+        self._thread.start()
+
+    def _on_progress(self, pct: int, msg: str):
+        # Skip repaints when nothing visible changed
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self._progress.setValue(pct)
+        if msg != self._last_msg:
+            self._last_msg = msg
+            self._status_lbl.setText(msg)
+
+    def reject(self):
+        # Stay open until the install thread has finished
+        if self._installing:
+            return
+        super().reject()
 
     def _on_install_done(self, result: dict):
-        self._poll_timer.stop()
+        self._installing = False
         if result.get("success"):
             self._progress.setValue(100)
             self._status_lbl.setText("ME3 installed successfully!")
@@ -2,16 +2,28 @@
 ME3 update dialog — downloads and installs the latest ME3 version.
 """
 
-import threading
-import queue as _queue
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                                 QPushButton, QProgressBar, QFrame)
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QObject, QThread, Signal
 from PySide6.QtGui import QFont
 from app.core.me3_service import download_and_install_me3
 from app.config.config_manager import ConfigManager
 
 
+class _UpdateWorker(QObject):
+    progress = Signal(int, str)
+    finished = Signal(dict)
+
+    def run(self):
+        def _cb(msg, pct):
+            self.progress.emit(pct, msg)
+        try:
+            result = download_and_install_me3(progress_callback=_cb)
+        except Exception as e:
+            result = {"success": False, "message": str(e)}
+        self.finished.emit(result)
+
+
 class ME3UpdateDialog(QDialog):
     """Dialog to update ME3 to the latest version."""
 
@@ -19,7 +31,9 @@ class ME3UpdateDialog(QDialog):
         super().__init__(parent)
         self._config = config
         self._latest_ver = latest_ver
-        self._pending: _queue.SimpleQueue = _queue.SimpleQueue()
+        self._updating = False
+        self._last_pct = -1
+        self._last_msg = None
 
         self.setWindowTitle("Update Mod Engine 3")
         self.setWindowFlag(Qt.WindowContextHelpButtonHint, False)
@@ -27,10 +41,6 @@ class ME3UpdateDialog(QDialog):
         self.setMinimumHeight(240)
         self._build()
 
-        self._poll_timer = QTimer(self)
-        self._poll_timer.timeout.connect(self._poll)
-        self._poll_timer.start(100)
-
     def _build(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(28, 24, 28, 24)
@@ -103,33 +113,37 @@ class ME3UpdateDialog(QDialog):
         self._progress.setVisible(True)
         self._status_lbl.setText("Starting download...")
 
-        pending = self._pending
-
-        def _work():
-            def _cb(msg, pct):
-                pending.put(("progress", pct, msg))
-            result = download_and_install_me3(progress_callback=_cb)
-            pending.put(("done", result))
-
-        threading.Thread(target=_work, daemon=True).start()
-
-    def _poll(self):
-        try:
-            while True:
-                item = self._pending.get_nowait()
-                tag = item[0]
-                if tag == "progress":
-                    _, pct, msg = item
-                    self._progress.setValue(pct)
-                    self._status_lbl.setText(msg)
-                elif tag == "done":
-                    _, result = item
-                    self._on_done(result)
-        except _queue.Empty:
-            pass
+        self._updating = True
+        self._last_pct = -1
+        self._last_msg = None
+        self._thread = QThread()
+        self._worker = _UpdateWorker()
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.run)
+        self._worker.progress.connect(self._on_progress)
+        self._worker.finished.connect(self._on_done)
+        self._worker.finished.connect(self._thread.quit)
+        self._worker.finished.connect(self._worker.deleteLater)
+        self._thread.finished.connect(self._thread.deleteLater)
+        self._thread.start()
+
+    def _on_progress(self, pct: int, msg: str):
+        # Skip repaints when nothing visible changed
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self._progress.setValue(pct)
+        if msg != self._last_msg:
+            self._last_msg = msg
+            self._status_lbl.setText(msg)
+
+    def reject(self):
+        # Stay open until the update thread has finished
+        if self._updating:
+            return
+        super().reject()
 
     def _on_done(self, result: dict):
-        self._poll_timer.stop()
+        self._updating = False
         if result.get("success"):
             self._progress.setValue(100)
             self._status_lbl.setText("ME3 updated successfully!")
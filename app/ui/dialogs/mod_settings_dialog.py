@@ -4,7 +4,7 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                                 QPushButton, QScrollArea, QFrame, QComboBox,
                                 QSpinBox, QLineEdit, QDialogButtonBox, QWidget,
                                 QMessageBox)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from app.core.ini_parser import parse_ini_file, save_ini_settings
 
 
@@ -19,6 +19,9 @@ class ModSettingsDialog(QDialog):
         self._widgets: dict = {}
         self._original: dict = {}
         self._rows: dict = {}     # key -> QFrame (for highlight updates)
+        self._widget_to_key: dict = {}  # input widget -> key (for change slots)
+        self._getters: dict = {}  # key -> callable returning the widget's value
+        self._pending_highlight: dict = {}  # key -> True while a text-edit refresh is queued
         self._sections: list = []
         self.setWindowTitle(f"{mod_name} — Settings")
         self.setWindowFlag(Qt.WindowContextHelpButtonHint, False)
@@ -32,7 +35,7 @@ class ModSettingsDialog(QDialog):
         layout.setContentsMargins(16, 16, 16, 16)
 
         title = QLabel(f"{self._mod_name} Settings")
-        title.setStyleSheet("font-size:14px;font-weight:700;color:#e0e0ec;")
+        title.setObjectName("dialog_title")
         layout.addWidget(title)
 
         import os
@@ -121,18 +124,9 @@ class ModSettingsDialog(QDialog):
 
         self._original[key] = value
 
-        _base_style = (
-            "QFrame#settings_row{background:transparent;"
-            "border-left:3px solid transparent;border-radius:2px;}"
-        )
-        _changed_style = (
-            "QFrame#settings_row{background:#201c0e;"
-            "border-left:3px solid #f39c12;border-radius:2px;}"
-        )
-
         row = QFrame()
-        row.setObjectName("settings_row")
-        row.setStyleSheet(_base_style)
+        row.setObjectName("mod_settings_row")
+        row.setProperty("changed", False)
         rl = QHBoxLayout(row)
         rl.setContentsMargins(10, 8, 10, 8)
         rl.setSpacing(12)
@@ -142,7 +136,7 @@ class ModSettingsDialog(QDialog):
         info.addWidget(QLabel(key))
         if description:
             dl = QLabel(description)
-            dl.setStyleSheet("font-size:11px;color:#8888aa;")
+            dl.setObjectName("muted")
             dl.setWordWrap(True)
             info.addWidget(dl)
         rl.addLayout(info, stretch=1)
@@ -168,58 +162,78 @@ class ModSettingsDialog(QDialog):
             widget.setFixedWidth(200)
 
         self._widgets[key] = widget
+        self._widget_to_key[widget] = key
+        if isinstance(widget, QComboBox):
+            self._getters[key] = widget.currentData
+        elif isinstance(widget, QSpinBox):
+            self._getters[key] = lambda w=widget: str(w.value())
+        else:
+            self._getters[key] = widget.text
         self._rows[key] = row
         rl.addWidget(widget, alignment=Qt.AlignRight | Qt.AlignVCenter)
 
         # Highlight row when value differs from original
-        def _on_change(_=None, _key=key, _row=row, _base=_base_style, _changed=_changed_style):
-            current = self._get_value(_key)
-            if current != self._original.get(_key, ""):
-                _row.setStyleSheet(_changed)
-            else:
-                _row.setStyleSheet(_base)
-
         if isinstance(widget, QComboBox):
-            widget.currentIndexChanged.connect(_on_change)
+            widget.currentIndexChanged.connect(self._on_widget_changed)
         elif isinstance(widget, QSpinBox):
-            widget.valueChanged.connect(_on_change)
+            widget.valueChanged.connect(self._on_widget_changed)
         elif isinstance(widget, QLineEdit):
-            widget.textChanged.connect(_on_change)
+            widget.textChanged.connect(self._on_text_changed)
 
         return row
 
+    def _on_widget_changed(self, _=None):
+        self._apply_highlight(self._widget_to_key[self.sender()])
+
+    def _on_text_changed(self, _=None):
+        # Coalesce keystrokes into one refresh
+        key = self._widget_to_key[self.sender()]
+        if self._pending_highlight.get(key):
+            return
+        self._pending_highlight[key] = True
+        QTimer.singleShot(120, self, lambda: self._apply_highlight(key))
+
+    def _apply_highlight(self, key: str):
+        self._pending_highlight[key] = False
+        row = self._rows[key]
+        changed = self._get_value(key) != self._original.get(key, "")
+        if row.property("changed") != changed:
+            row.setProperty("changed", changed)
+            row.style().unpolish(row)
+            row.style().polish(row)
+
     def _get_value(self, key: str) -> str:
-        w = self._widgets.get(key)
-        if isinstance(w, QComboBox):
-            return w.currentData() or ""
-        elif isinstance(w, QSpinBox):
-            return str(w.value())
-        elif isinstance(w, QLineEdit):
-            return w.text()
-        return ""
+        getter = self._getters.get(key)
+        return (getter() or "") if getter else ""
 
     def _on_save(self):
+        current = {key: self._get_value(key) for key in self._widgets}
         changes = {
-            key: self._get_value(key)
-            for key in self._widgets
-            if self._get_value(key) != self._original.get(key, "")
+            key: value
+            for key, value in current.items()
+            if value != self._original.get(key, "")
         }
         if not changes:
             self.accept()
             return
 
         # Build a readable before → after summary
-        lines = ["The following settings will be changed:\n"]
-        max_key_len = max(len(k) for k in changes)
-        for key, new_val in changes.items():
-            old_val = self._original.get(key, "")
-            lines.append(f"  {key.ljust(max_key_len)}  :  {old_val!r}  →  {new_val!r}")
-        lines.append("\nSave these changes?")
+        if len(changes) == 1:
+            key, new_val = next(iter(changes.items()))
+            msg = f"Change {key!r} from {self._original.get(key, '')!r} to {new_val!r}?"
+        else:
+            lines = ["The following settings will be changed:\n"]
+            max_key_len = max(len(k) for k in changes)
+            for key, new_val in changes.items():
+                old_val = self._original.get(key, "")
+                lines.append(f"  {key.ljust(max_key_len)}  :  {old_val!r}  →  {new_val!r}")
+            lines.append("\nSave these changes?")
+            msg = "\n".join(lines)
 
         reply = QMessageBox.question(
             self,
             "Confirm Changes",
-            "\n".join(lines),
+            msg,
             QMessageBox.Save | QMessageBox.Cancel,
             QMessageBox.Save,
         )
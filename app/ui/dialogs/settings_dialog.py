@@ -1,26 +1,72 @@
 """App-level settings dialog — Nexus account, ME3 path, preferences."""
 
 import os
+import re
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                                 QPushButton, QLineEdit, QCheckBox, QFileDialog,
-                                QGroupBox, QFormLayout, QDialogButtonBox)
-from PySide6.QtCore import Qt, Signal
+                                QFormLayout, QDialogButtonBox, QTabWidget,
+                                QWidget, QMessageBox, QSizePolicy,
+                                QProgressBar)
+from PySide6.QtCore import (Qt, Signal, Slot, QRunnable, QThreadPool,
+                            QMetaObject, Q_ARG, QTimer)
 from app.config.config_manager import ConfigManager, _DEFAULT_MODS_DIR
+from app.core.me2_migrator import (scan_me2_installation, scan_me3_profiles,
+                                   scan_game_folders, merge_scan_results)
+from app.core.me3_service import (find_me3_executable, get_me3_version,
+                                  get_latest_me3_release)
+from app.services.update_service import check_for_update, get_current_version
+from app.ui.dialogs.me2_migration_dialog import ME2MigrationDialog
+from app.ui.dialogs.me3_update_dialog import ME3UpdateDialog
+
+
+class _CheckRunnable(QRunnable):
+    """Runs a check on the shared pool and posts its dict result to a slot."""
+
+    def __init__(self, target: QDialog, slot: str, check):
+        super().__init__()
+        self._target = target
+        self._slot = slot
+        self._check = check
+
+    def run(self):
+        try:
+            result = self._check()
+        except Exception as e:
+            result = {"error": str(e)}
+        try:
+            QMetaObject.invokeMethod(self._target, self._slot,
+                                     Qt.QueuedConnection,
+                                     Q_ARG("QVariantMap", result))
+        except RuntimeError:
+            pass  # dialog deleted before the check finished
 
 
 class SettingsDialog(QDialog):
     settings_saved = Signal()
-    _update_checked = Signal(object)  # internal: update check result from bg thread
-    _me3_update_checked = Signal(object)  # internal: ME3 update check result
 
     def __init__(self, config: ConfigManager, parent=None):
         super().__init__(parent)
         self._config = config
+        # Widgets read by _save — None until their section is built
+        self._use_me3: QCheckBox | None = None
+        self._me3_path: QLineEdit | None = None
+        self._mods_dir: QLineEdit | None = None
+        # Pickers are created on first use and reused afterwards
+        self._file_dlg: QFileDialog | None = None
+        self._dir_dlg: QFileDialog | None = None
+        # Set once the dialog closes; late check results are dropped
+        self._closed = False
+        # (me3_path, empty message) for the import scan in flight
+        self._pending_import: tuple[str | None, str] | None = None
         self.setWindowTitle("Settings")
         self.setWindowFlag(Qt.WindowContextHelpButtonHint, False)
         self.setMinimumWidth(500)
-        self._build()
-        self._load()
+        # One layout/paint pass once everything is in place
+        self.setUpdatesEnabled(False)
+        try:
+            self._build()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _build(self):
         layout = QVBoxLayout(self)
@@ -28,278 +74,319 @@ class SettingsDialog(QDialog):
         layout.setContentsMargins(20, 20, 20, 20)
 
         title = QLabel("Settings")
-        title.setStyleSheet("font-size:16px;font-weight:700;color:#e0e0ec;")
+        title.setObjectName("settingsTitle")
         layout.addWidget(title)
 
-        # ── Nexus Mods ────────────────────────────────────────
-        nexus_group = QGroupBox("Nexus Mods")
-        nexus_layout = QFormLayout(nexus_group)
-        nexus_layout.setSpacing(10)
+        # Each section is built the first time its tab is shown
+        self._tabs = QTabWidget()
+        self._section_builders: dict[int, callable] = {}
+        for label, builder in (
+            ("Nexus Mods", self._build_nexus),
+            ("Mod Engine 3", self._build_me3),
+            ("Mod Storage", self._build_mods),
+            ("App Updates", self._build_updates),
+        ):
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(12, 12, 12, 12)
+            idx = self._tabs.addTab(page, label)
+            self._section_builders[idx] = builder
+        self._tabs.currentChanged.connect(self._ensure_section)
+        layout.addWidget(self._tabs)
 
+        # ── Buttons ───────────────────────────────────────────
+        btn_box = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
+        btn_box.accepted.connect(self._save)
+        btn_box.rejected.connect(self.reject)
+        layout.addWidget(btn_box)
+
+        self._ensure_section(self._tabs.currentIndex())
+
+    def _ensure_section(self, index: int):
+        """Build the section behind tab `index` if it hasn't been yet."""
+        builder = self._section_builders.pop(index, None)
+        if builder is None:
+            return
+        page = self._tabs.widget(index)
+        page.setUpdatesEnabled(False)
+        try:
+            form = QFormLayout()
+            form.setSpacing(10)
+            builder(form)
+            page.layout().addLayout(form)
+            page.layout().addStretch()
+        finally:
+            page.setUpdatesEnabled(True)
+            page.updateGeometry()
+
+    # ── Nexus Mods ────────────────────────────────────────────
+
+    def _build_nexus(self, form: QFormLayout):
         self._nexus_status_lbl = QLabel("Not connected")
-        self._nexus_status_lbl.setStyleSheet("font-size:12px;color:#8888aa;")
-        nexus_layout.addRow("Status:", self._nexus_status_lbl)
+        self._nexus_status_lbl.setObjectName("nexusStatus")
+        form.addRow("Status:", self._nexus_status_lbl)
 
         self._signout_btn = QPushButton("Sign Out")
-        self._signout_btn.setFixedWidth(80)
-        self._signout_btn.setStyleSheet(
-            "QPushButton{color:#e74c3c;font-size:11px;border:1px solid #e74c3c;"
-            "background:transparent;border-radius:4px;padding:4px 12px;}"
-            "QPushButton:hover{color:#fff;background:#e74c3c;}"
-        )
+        self._signout_btn.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
+        self._signout_btn.setObjectName("signoutBtn")
         self._signout_btn.clicked.connect(self._sign_out)
-        nexus_layout.addRow("", self._signout_btn)
+        form.addRow("", self._signout_btn)
 
-        layout.addWidget(nexus_group)
+        token = self._config.get_nexus_access_token()
+        user = self._config.get_nexus_user_info()
+        if token and user:
+            name = user.get("name", "Connected")
+            self._nexus_status_lbl.setText(f"Connected as {name}")
+            self._set_state(self._nexus_status_lbl, "ok")
+        self._signout_btn.setVisible(bool(token))
 
-        # ── ME3 ───────────────────────────────────────────────
-        me3_group = QGroupBox("Mod Engine 3 (ME3)")
-        me3_layout = QFormLayout(me3_group)
-        me3_layout.setSpacing(10)
+    # ── ME3 ───────────────────────────────────────────────────
 
+    def _build_me3(self, form: QFormLayout):
         self._use_me3 = QCheckBox("Use ME3 for launching games (recommended)")
-        me3_layout.addRow("", self._use_me3)
+        form.addRow("", self._use_me3)
 
-        me3_path_row = QHBoxLayout()
         self._me3_path = QLineEdit()
         self._me3_path.setPlaceholderText("Auto-detect or browse…")
         browse_btn = QPushButton("Browse")
-        browse_btn.setFixedWidth(70)
+        browse_btn.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
         browse_btn.clicked.connect(self._browse_me3)
-        me3_path_row.addWidget(self._me3_path)
-        me3_path_row.addWidget(browse_btn)
-        me3_layout.addRow("ME3 Path:", me3_path_row)
-
-        me2_import_btn = QPushButton("Import from Mod Engine 2...")
-        me2_import_btn.setObjectName("btn_blue")
-        me2_import_btn.clicked.connect(self._import_me2)
-        me3_layout.addRow("", me2_import_btn)
-
-        me3_import_btn = QPushButton("Import from ME3 Profiles...")
-        me3_import_btn.setObjectName("btn_blue")
-        me3_import_btn.clicked.connect(self._import_me3_profiles)
-        me3_layout.addRow("", me3_import_btn)
+        form.addRow("ME3 Path:", self._row(self._me3_path, browse_btn))
+
+        self._me2_import_btn = QPushButton("Import from Mod Engine 2...")
+        self._me2_import_btn.setObjectName("btn_blue")
+        self._me2_import_btn.clicked.connect(self._import_me2)
+        form.addRow("", self._me2_import_btn)
+
+        self._me3_import_btn = QPushButton("Import from ME3 Profiles...")
+        self._me3_import_btn.setObjectName("btn_blue")
+        self._me3_import_btn.clicked.connect(self._import_me3_profiles)
+        form.addRow("", self._me3_import_btn)
+
+        # Indeterminate bar shown while an import scan runs
+        self._import_progress = QProgressBar()
+        self._import_progress.setRange(0, 0)
+        self._import_progress.setFixedHeight(6)
+        self._import_progress.setTextVisible(False)
+        self._import_progress.setVisible(False)
+        form.addRow("", self._import_progress)
 
         # ME3 version + update check
-        me3_ver_row = QHBoxLayout()
         self._me3_ver_lbl = QLabel("")
-        self._me3_ver_lbl.setStyleSheet("font-size:12px;color:#e0e0ec;font-weight:600;")
-        me3_ver_row.addWidget(self._me3_ver_lbl)
-        me3_ver_row.addStretch()
-        me3_layout.addRow("Version:", me3_ver_row)
+        self._me3_ver_lbl.setObjectName("settingsValue")
+        form.addRow("Version:", self._me3_ver_lbl)
 
-        me3_check_row = QHBoxLayout()
         self._me3_check_btn = QPushButton("Check for ME3 Updates")
         self._me3_check_btn.setObjectName("btn_blue")
-        self._me3_check_btn.setFixedWidth(180)
+        self._me3_check_btn.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
         self._me3_check_btn.clicked.connect(self._check_me3_updates)
-        me3_check_row.addWidget(self._me3_check_btn)
         self._me3_update_lbl = QLabel("")
-        self._me3_update_lbl.setStyleSheet("font-size:11px;color:#8888aa;")
-        me3_check_row.addWidget(self._me3_update_lbl)
-        me3_check_row.addStretch()
-        me3_layout.addRow("", me3_check_row)
+        self._me3_update_lbl.setObjectName("me3UpdateStatus")
+        form.addRow("", self._row(self._me3_check_btn, self._me3_update_lbl,
+                                  stretch=True))
 
-        layout.addWidget(me3_group)
+        self._me3_path.setText(self._config.get_me3_path())
+        self._use_me3.setChecked(self._config.get_use_me3())
+        # Probing me3.exe runs a subprocess — let the page paint first
+        self._me3_ver_lbl.setText("…")
+        QTimer.singleShot(0, self, self._populate_me3_version)
 
-        # ── Mod Storage ───────────────────────────────────────
-        mods_group = QGroupBox("Mod Storage")
-        mods_layout = QFormLayout(mods_group)
-        mods_layout.setSpacing(10)
+    def _populate_me3_version(self):
+        me3_ver = get_me3_version(self._config.get_me3_path())
+        self._me3_ver_lbl.setText(me3_ver or "Not found")
+
+    # ── Mod Storage ───────────────────────────────────────────
 
-        mods_dir_row = QHBoxLayout()
+    def _build_mods(self, form: QFormLayout):
         self._mods_dir = QLineEdit()
         self._mods_dir.setPlaceholderText("Default: <app folder>/mods")
         browse_mods_btn = QPushButton("Browse")
-        browse_mods_btn.setFixedWidth(70)
+        browse_mods_btn.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
         browse_mods_btn.clicked.connect(self._browse_mods_dir)
         reset_mods_btn = QPushButton("Reset")
-        reset_mods_btn.setFixedWidth(60)
+        reset_mods_btn.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
         reset_mods_btn.clicked.connect(self._reset_mods_dir)
-        mods_dir_row.addWidget(self._mods_dir)
-        mods_dir_row.addWidget(browse_mods_btn)
-        mods_dir_row.addWidget(reset_mods_btn)
-        mods_layout.addRow("Directory:", mods_dir_row)
+        form.addRow("Directory:", self._row(self._mods_dir, browse_mods_btn,
+                                            reset_mods_btn))
 
         mods_help = QLabel("Extracted mod files for ME3-managed games are stored here.")
-        mods_help.setStyleSheet("font-size:11px;color:#8888aa;")
-        mods_layout.addRow("", mods_help)
-        layout.addWidget(mods_group)
+        mods_help.setObjectName("settingsHelp")
+        form.addRow("", mods_help)
+
+        self._mods_dir.setText(self._config.get_mods_dir())
 
-        # ── App Updates ────────────────────────────────────────
-        update_group = QGroupBox("App Updates")
-        update_layout = QFormLayout(update_group)
-        update_layout.setSpacing(10)
+    # ── App Updates ───────────────────────────────────────────
 
-        from app.services.update_service import get_current_version
-        version_lbl = QLabel(f"v{get_current_version()}")
-        version_lbl.setStyleSheet("font-size:12px;color:#e0e0ec;font-weight:600;")
-        update_layout.addRow("Current version:", version_lbl)
+    def _build_updates(self, form: QFormLayout):
+        version_lbl = QLabel("v…")
+        version_lbl.setObjectName("settingsValue")
+        form.addRow("Current version:", version_lbl)
+        QTimer.singleShot(0, version_lbl,
+                          lambda: version_lbl.setText(f"v{get_current_version()}"))
 
-        check_row = QHBoxLayout()
         self._check_update_btn = QPushButton("Check for Updates")
         self._check_update_btn.setObjectName("btn_blue")
-        self._check_update_btn.setFixedWidth(160)
+        self._check_update_btn.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
         self._check_update_btn.clicked.connect(self._check_for_updates)
-        check_row.addWidget(self._check_update_btn)
         self._update_status_lbl = QLabel("")
-        self._update_status_lbl.setStyleSheet("font-size:11px;color:#8888aa;")
-        check_row.addWidget(self._update_status_lbl)
-        check_row.addStretch()
-        update_layout.addRow("", check_row)
-
-        layout.addWidget(update_group)
-
-        # ── Buttons ───────────────────────────────────────────
-        btn_box = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
-        btn_box.accepted.connect(self._save)
-        btn_box.rejected.connect(self.reject)
-        layout.addWidget(btn_box)
-
-    def _load(self):
-        token = self._config.get_nexus_access_token()
-        user = self._config.get_nexus_user_info()
-        if token and user:
-            name = user.get("name", "Connected")
-            self._nexus_status_lbl.setText(f"Connected as {name}")
-            self._nexus_status_lbl.setStyleSheet("font-size:12px;color:#4ecca3;")
-        else:
-            self._nexus_status_lbl.setText("Not connected")
-            self._nexus_status_lbl.setStyleSheet("font-size:12px;color:#8888aa;")
-        self._signout_btn.setVisible(bool(token))
-        self._me3_path.setText(self._config.get_me3_path())
-        self._use_me3.setChecked(self._config.get_use_me3())
-        from app.core.me3_service import get_me3_version
-        me3_ver = get_me3_version(self._config.get_me3_path())
-        self._me3_ver_lbl.setText(me3_ver or "Not found")
-        self._mods_dir.setText(self._config.get_mods_dir())
+        self._update_status_lbl.setObjectName("updateStatus")
+        form.addRow("", self._row(self._check_update_btn, self._update_status_lbl,
+                                  stretch=True))
+
+    @staticmethod
+    def _row(*widgets: QWidget, stretch: bool = False) -> QWidget:
+        """Pack widgets side by side into one form-row container."""
+        row = QWidget()
+        hl = QHBoxLayout(row)
+        hl.setContentsMargins(0, 0, 0, 0)
+        for w in widgets:
+            hl.addWidget(w)
+        if stretch:
+            hl.addStretch()
+        return row
+
+    def _pick_directory(self, title: str, start_dir: str) -> str:
+        """Show the shared directory picker. Returns "" if cancelled."""
+        if self._dir_dlg is None:
+            self._dir_dlg = QFileDialog(self)
+            self._dir_dlg.setFileMode(QFileDialog.Directory)
+            self._dir_dlg.setOption(QFileDialog.ShowDirsOnly, True)
+            self._dir_dlg.setOption(QFileDialog.DontUseCustomDirectoryIcons, True)
+            self._dir_dlg.setOption(QFileDialog.DontResolveSymlinks, True)
+        self._dir_dlg.setWindowTitle(title)
+        self._dir_dlg.setDirectory(start_dir)
+        if not self._dir_dlg.exec():
+            return ""
+        return self._dir_dlg.selectedFiles()[0]
 
     def _browse_me3(self):
-        path, _ = QFileDialog.getOpenFileName(
-            self, "Select me3.exe", "", "Executables (*.exe)"
-        )
-        if path:
-            self._me3_path.setText(path)
+        if self._file_dlg is None:
+            self._file_dlg = QFileDialog(self, "Select me3.exe")
+            self._file_dlg.setFileMode(QFileDialog.ExistingFile)
+            self._file_dlg.setNameFilter("Executables (*.exe)")
+            self._file_dlg.setOption(QFileDialog.DontUseCustomDirectoryIcons, True)
+        if self._file_dlg.exec():
+            self._me3_path.setText(self._file_dlg.selectedFiles()[0])
 
     def _import_me2(self):
-        home = os.path.expanduser("~")
-        path = QFileDialog.getExistingDirectory(
-            self, "Select Mod Engine 2 Directory", home
-        )
+        path = self._pick_directory("Select Mod Engine 2 Directory",
+                                    os.path.expanduser("~"))
         if not path:
             return
-        from app.core.me2_migrator import (scan_me2_installation,
-                                           scan_game_folders,
-                                           merge_scan_results)
-        me2_results = scan_me2_installation(path)
-        game_results = scan_game_folders(self._config)
-        merged = merge_scan_results(me2_results, game_results)
-        if not merged:
-            from PySide6.QtWidgets import QMessageBox
-            QMessageBox.information(
-                self, "No Mods Found",
-                "No importable mods were found.\n"
-                "Make sure you selected a Mod Engine 2 folder with config_*.toml files."
-            )
-            return
-        from app.core.me3_service import find_me3_executable
-        from app.ui.dialogs.me2_migration_dialog import ME2MigrationDialog
-        me3_path = find_me3_executable(self._config.get_me3_path())
-        dlg = ME2MigrationDialog(merged, me3_path, self._config, parent=self)
-        dlg.exec()
+        self._run_import(
+            lambda: scan_me2_installation(path),
+            find_me3_executable(self._config.get_me3_path()),
+            "No importable mods were found.\n"
+            "Make sure you selected a Mod Engine 2 folder with config_*.toml files."
+        )
 
     def _import_me3_profiles(self):
-        from app.core.me3_service import find_me3_executable
         me3_path = find_me3_executable(self._config.get_me3_path())
         if not me3_path:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.warning(
                 self, "ME3 Not Found",
                 "Mod Engine 3 was not found. Please set the ME3 path first."
             )
             return
-        from app.core.me2_migrator import (scan_me3_profiles,
-                                           scan_game_folders,
-                                           merge_scan_results)
-        me3_results = scan_me3_profiles(me3_path)
-        game_results = scan_game_folders(self._config)
-        merged = merge_scan_results(me3_results, game_results)
+        self._run_import(
+            lambda: scan_me3_profiles(me3_path),
+            me3_path,
+            "No importable mods were found in existing ME3 profiles."
+        )
+
+    def _run_import(self, scan, me3_path: str | None, empty_message: str):
+        """Scan on the pool, then offer whatever was found for import."""
+        self._pending_import = (me3_path, empty_message)
+        self._me2_import_btn.setEnabled(False)
+        self._me3_import_btn.setEnabled(False)
+        self._import_progress.setVisible(True)
+        config = self._config
+
+        def _work():
+            return {"merged": merge_scan_results(scan(), scan_game_folders(config))}
+
+        QThreadPool.globalInstance().start(
+            _CheckRunnable(self, "_on_import_scanned", _work))
+
+    @Slot("QVariantMap")
+    def _on_import_scanned(self, result):
+        if self._closed:
+            return
+        self._import_progress.setVisible(False)
+        self._me2_import_btn.setEnabled(True)
+        self._me3_import_btn.setEnabled(True)
+        me3_path, empty_message = self._pending_import
+        if result.get("error"):
+            QMessageBox.warning(self, "Scan Failed",
+                                f"Could not scan for mods: {result['error']}")
+            return
+        merged = result.get("merged")
         if not merged:
-            from PySide6.QtWidgets import QMessageBox
-            QMessageBox.information(
-                self, "No Mods Found",
-                "No importable mods were found in existing ME3 profiles."
-            )
+            QMessageBox.information(self, "No Mods Found", empty_message)
             return
-        from app.ui.dialogs.me2_migration_dialog import ME2MigrationDialog
         dlg = ME2MigrationDialog(merged, me3_path, self._config, parent=self)
         dlg.exec()
 
     def _check_for_updates(self):
         self._check_update_btn.setEnabled(False)
         self._update_status_lbl.setText("Checking…")
-        self._update_status_lbl.setStyleSheet("font-size:11px;color:#8888aa;")
-        self._update_checked.connect(self._on_update_check_done)
-
-        import threading
-
-        def _work():
-            from app.services.update_service import check_for_update
-            result = check_for_update()
-            self._update_checked.emit(result)
-
-        threading.Thread(target=_work, daemon=True).start()
+        self._set_state(self._update_status_lbl, "")
+        QThreadPool.globalInstance().start(
+            _CheckRunnable(self, "_on_update_check_done", check_for_update))
 
+    @Slot("QVariantMap")
     def _on_update_check_done(self, result):
+        if self._closed:
+            return
         self._check_update_btn.setEnabled(True)
-        self._update_checked.disconnect(self._on_update_check_done)
         if result.get("error"):
             self._update_status_lbl.setText(f"Error: {result['error']}")
-            self._update_status_lbl.setStyleSheet("font-size:11px;color:#e74c3c;")
+            self._set_state(self._update_status_lbl, "error")
         elif result.get("has_update"):
             latest = result.get("latest", "?")
             self._update_status_lbl.setText(f"Update available: v{latest}")
-            self._update_status_lbl.setStyleSheet("font-size:11px;color:#b0d880;font-weight:600;")
+            self._set_state(self._update_status_lbl, "available")
         else:
             self._update_status_lbl.setText("Up to date")
-            self._update_status_lbl.setStyleSheet("font-size:11px;color:#4a6a2a;font-weight:600;")
+            self._set_state(self._update_status_lbl, "ok")
 
     def _check_me3_updates(self):
         self._me3_check_btn.setEnabled(False)
         self._me3_update_lbl.setText("Checking...")
-        self._me3_update_lbl.setStyleSheet("font-size:11px;color:#8888aa;")
-        self._me3_update_checked.connect(self._on_me3_update_done)
-
-        import threading
+        self._set_state(self._me3_update_lbl, "")
+        me3_path = self._config.get_me3_path()
 
         def _work():
-            from app.core.me3_service import get_me3_version, get_latest_me3_release
-            installed = get_me3_version(self._config.get_me3_path())
-            latest = get_latest_me3_release()
-            self._me3_update_checked.emit({
-                "installed": installed,
-                "latest": latest,
-            })
+            return {
+                "installed": get_me3_version(me3_path),
+                "latest": get_latest_me3_release(),
+            }
 
-        threading.Thread(target=_work, daemon=True).start()
+        QThreadPool.globalInstance().start(
+            _CheckRunnable(self, "_on_me3_update_done", _work))
 
+    @Slot("QVariantMap")
     def _on_me3_update_done(self, result):
-        import re
+        if self._closed:
+            return
         self._me3_check_btn.setEnabled(True)
-        self._me3_update_checked.disconnect(self._on_me3_update_done)
+        if result.get("error"):
+            self._me3_update_lbl.setText(f"Check failed: {result['error']}")
+            self._set_state(self._me3_update_lbl, "error")
+            return
 
         installed = result.get("installed")
         latest_info = result.get("latest")
 
         if not installed:
             self._me3_update_lbl.setText("ME3 not installed")
-            self._me3_update_lbl.setStyleSheet("font-size:11px;color:#e74c3c;")
+            self._set_state(self._me3_update_lbl, "error")
             return
 
         if not latest_info or latest_info.get("error"):
             err = latest_info.get("error", "Unknown error") if latest_info else "Network error"
             self._me3_update_lbl.setText(f"Check failed: {err}")
-            self._me3_update_lbl.setStyleSheet("font-size:11px;color:#e74c3c;")
+            self._set_state(self._me3_update_lbl, "error")
             return
 
         latest_ver = latest_info.get("version", "")
@@ -312,7 +399,7 @@ class SettingsDialog(QDialog):
 
         if inst_n == latest_n:
             self._me3_update_lbl.setText("Up to date")
-            self._me3_update_lbl.setStyleSheet("font-size:11px;color:#4ecca3;font-weight:600;")
+            self._set_state(self._me3_update_lbl, "ok")
             return
 
         try:
@@ -320,13 +407,13 @@ class SettingsDialog(QDialog):
             latest_parts = tuple(int(x) for x in latest_n.split("."))
             if inst_parts >= latest_parts:
                 self._me3_update_lbl.setText("Up to date")
-                self._me3_update_lbl.setStyleSheet("font-size:11px;color:#4ecca3;font-weight:600;")
+                self._set_state(self._me3_update_lbl, "ok")
                 return
         except ValueError:
             pass
 
         self._me3_update_lbl.setText(f"Update available: {latest_ver}")
-        self._me3_update_lbl.setStyleSheet("font-size:11px;color:#e94560;font-weight:600;")
+        self._set_state(self._me3_update_lbl, "available")
 
         # Replace check button with update button
         self._me3_check_btn.setText("Update ME3")
@@ -336,14 +423,12 @@ class SettingsDialog(QDialog):
         self._me3_check_btn.clicked.connect(lambda: self._run_me3_update(latest_ver))
 
     def _run_me3_update(self, latest_ver: str):
-        from app.ui.dialogs.me3_update_dialog import ME3UpdateDialog
         dlg = ME3UpdateDialog(self._config, latest_ver, parent=self)
         if dlg.exec():
-            from app.core.me3_service import get_me3_version
             ver = get_me3_version(self._config.get_me3_path())
             self._me3_ver_lbl.setText(ver or "Not found")
             self._me3_update_lbl.setText("Updated successfully!")
-            self._me3_update_lbl.setStyleSheet("font-size:11px;color:#4ecca3;font-weight:600;")
+            self._set_state(self._me3_update_lbl, "ok")
             self._me3_check_btn.setText("Check for ME3 Updates")
             self._me3_check_btn.setObjectName("btn_blue")
             self._me3_check_btn.setStyle(self._me3_check_btn.style())
@@ -351,9 +436,8 @@ class SettingsDialog(QDialog):
             self._me3_check_btn.clicked.connect(self._check_me3_updates)
 
     def _browse_mods_dir(self):
-        path = QFileDialog.getExistingDirectory(
-            self, "Select Mod Storage Directory", self._mods_dir.text() or ""
-        )
+        path = self._pick_directory("Select Mod Storage Directory",
+                                    self._mods_dir.text() or "")
         if path:
             self._mods_dir.setText(path)
 
@@ -363,15 +447,35 @@ class SettingsDialog(QDialog):
     def _sign_out(self):
         self._config.clear_nexus_auth()
         self._nexus_status_lbl.setText("Not connected")
-        self._nexus_status_lbl.setStyleSheet("font-size:12px;color:#8888aa;")
+        self._set_state(self._nexus_status_lbl, "")
         self._signout_btn.setVisible(False)
         self.settings_saved.emit()
 
+    def done(self, result: int):
+        self._closed = True
+        super().done(result)
+
+    @staticmethod
+    def _set_state(lbl: QLabel, state: str):
+        """Switch a status label's colour via its `state` QSS property."""
+        lbl.setProperty("state", state)
+        lbl.style().unpolish(lbl)
+        lbl.style().polish(lbl)
+
     def _save(self):
-        self._config.set_me3_path(self._me3_path.text().strip())
-        self._config.set_use_me3(self._use_me3.isChecked())
-        mods_dir = self._mods_dir.text().strip()
-        if mods_dir:
-            self._config.set_mods_dir(mods_dir)
+        # Sections that were never opened have nothing to save
+        changes = {}
+        if self._me3_path is not None:
+            me3_path = self._me3_path.text().strip()
+            if me3_path != self._config.get_me3_path():
+                changes["me3_path"] = me3_path
+            if self._use_me3.isChecked() != self._config.get_use_me3():
+                changes["use_me3"] = self._use_me3.isChecked()
+        if self._mods_dir is not None:
+            mods_dir = self._mods_dir.text().strip()
+            if mods_dir and mods_dir != self._config.get_mods_dir():
+                changes["mods_dir"] = mods_dir
+        if changes:
+            self._config.update(changes)
         self.settings_saved.emit()
         self.accept()
@@ -4,22 +4,62 @@ Per-game page with Mods / ME3 Profile / Saves tabs.
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                                 QPushButton, QTabWidget, QFrame)
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont, QIcon, QPixmap, QPainter, QColor
+from PySide6.QtCore import Qt, Signal, QPoint, QRect
+from PySide6.QtGui import QFont, QIcon, QIconEngine, QPixmap, QPainter, QColor
 from app.config.config_manager import ConfigManager
 
 _MDL2 = "Segoe MDL2 Assets"
 
+_ICON_CACHE: dict[tuple[str, str], QIcon] = {}
+_FONT_CACHE: dict[int, QFont] = {}
+_PEN_CACHE: dict[str, QColor] = {}
+
+
+class _Mdl2IconEngine(QIconEngine):
+    """Draws one MDL2 glyph at whatever size and pixel ratio Qt asks for."""
+
+    def __init__(self, char: str, color: str):
+        super().__init__()
+        self._char = char
+        self._color_name = color
+        pen = _PEN_CACHE.get(color)
+        if pen is None:
+            pen = _PEN_CACHE[color] = QColor(color)
+        self._color = pen
+
+    def paint(self, painter, rect, mode, state):
+        size = rect.height()
+        font = _FONT_CACHE.get(size)
+        if font is None:
+            font = _FONT_CACHE[size] = QFont(_MDL2, int(size * 0.75))
+        painter.setFont(font)
+        painter.setPen(self._color)
+        painter.drawText(rect, Qt.AlignCenter, self._char)
+
+    def pixmap(self, size, mode, state):
+        px = QPixmap(size)
+        px.fill(Qt.transparent)
+        p = QPainter(px)
+        self.paint(p, QRect(QPoint(0, 0), size), mode, state)
+        p.end()
+        return px
+
+    def scaledPixmap(self, size, mode, state, scale):
+        px = self.pixmap(size * scale, mode, state)
+        px.setDevicePixelRatio(scale)
+        return px
+
+    def clone(self):
+        return _Mdl2IconEngine(self._char, self._color_name)
+
+
+def _mdl2_icon(char: str, color: str = "#c0c0d8") -> QIcon:
+    key = (char, color)
+    ico = _ICON_CACHE.get(key)
+    if ico is None:
+        ico = _ICON_CACHE[key] = QIcon(_Mdl2IconEngine(char, color))
+    return ico
 
-def _mdl2_icon(char: str, size: int = 16, color: str = "#c0c0d8") -> QIcon:
-    px = QPixmap(size, size)
-    px.fill(QColor("transparent"))
-    p = QPainter(px)
-    p.setFont(QFont(_MDL2, int(size * 0.75)))
-    p.setPen(QColor(color))
-    p.drawText(px.rect(), Qt.AlignCenter, char)
-    p.end()
-    return QIcon(px)
 from app.core.me3_service import ME3_GAME_MAP
 from app.ui.tabs.settings_tab import ME3ProfileTab
 from app.ui.tabs.saves_tab import SavesTab
@@ -36,6 +76,8 @@ class GamePage(QWidget):
         self._game_id = game_id
         self._game_info = game_info
         self._config = config
+        # Set by mark_dirty() while the page is hidden; applied on next show
+        self._dirty = False
         self._build()
 
     def _build(self):
@@ -47,19 +89,20 @@ class GamePage(QWidget):
         self._tabs = QTabWidget()
         self._tabs.setDocumentMode(True)
 
+        # Mods is the visible tab; the others are built on first view
         self._mods_tab = ModsTab(self._game_id, self._game_info, self._config)
-        self._saves_tab = SavesTab(self._game_id, self._game_info, self._config)
-
-        self._tabs.addTab(self._mods_tab, _mdl2_icon("\uE7B8", 16), "Mods")
+        self._tabs.addTab(self._mods_tab, _mdl2_icon("\uE7B8"), "Mods")
+        self._tab_factories: dict[int, callable] = {}
 
         # ME3 Profile tab — only for ME3-supported games
         self._profile_tab = None
         if self._game_id in ME3_GAME_MAP:
-            self._profile_tab = ME3ProfileTab(self._game_id, self._game_info, self._config)
-            self._tabs.addTab(self._profile_tab, _mdl2_icon("\uE713", 16), "ME3 Profile")
-            self._profile_tab.log_message.connect(self.log_message)
+            idx = self._tabs.addTab(QWidget(), _mdl2_icon("\uE713"), "ME3 Profile")
+            self._tab_factories[idx] = self._create_profile_tab
 
-        self._tabs.addTab(self._saves_tab, _mdl2_icon("\uE74E", 16), "Saves")
+        self._saves_tab = None
+        idx = self._tabs.addTab(QWidget(), _mdl2_icon("\uE74E"), "Saves")
+        self._tab_factories[idx] = self._create_saves_tab
 
         self._tabs.currentChanged.connect(self._on_tab_changed)
 
@@ -67,19 +110,76 @@ class GamePage(QWidget):
 
         # Wire log signals
         self._mods_tab.log_message.connect(self.log_message)
-        self._saves_tab.log_message.connect(self.log_message)
 
-        self._mods_tab.mod_installed.connect(lambda: self.mod_installed.emit(self._game_id))
+        self._mods_tab.mod_installed.connect(self._emit_mod_installed)
         self._mods_tab.auth_changed.connect(self.auth_changed)
 
+    def _emit_mod_installed(self, *_):
+        self.mod_installed.emit(self._game_id)
+
+    def is_busy(self) -> bool:
+        """True while an install or update is running on this page."""
+        return self._mods_tab.is_busy()
+
+    def cleanup(self):
+        """Disconnect child tabs and schedule them for deletion."""
+        for tab in (self._mods_tab, self._profile_tab, self._saves_tab):
+            if tab is None:
+                continue
+            tab.log_message.disconnect()
+            tab.deleteLater()
+        self._mods_tab.mod_installed.disconnect()
+        self._mods_tab.auth_changed.disconnect()
+        self._profile_tab = None
+        self._saves_tab = None
+
+    def _create_profile_tab(self) -> QWidget:
+        self._profile_tab = ME3ProfileTab(self._game_id, self._game_info, self._config)
+        self._profile_tab.log_message.connect(self.log_message)
+        return self._profile_tab
+
+    def _create_saves_tab(self) -> QWidget:
+        self._saves_tab = SavesTab(self._game_id, self._game_info, self._config)
+        self._saves_tab.log_message.connect(self.log_message)
+        return self._saves_tab
+
+    def _realize_tab(self, index: int) -> bool:
+        """Swap the placeholder at `index` for its real tab. Returns True if built."""
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return False
+        placeholder = self._tabs.widget(index)
+        icon, label = self._tabs.tabIcon(index), self._tabs.tabText(index)
+        real = factory()
+        self._tabs.blockSignals(True)
+        self._tabs.removeTab(index)
+        self._tabs.insertTab(index, real, icon, label)
+        self._tabs.setCurrentIndex(index)
+        self._tabs.blockSignals(False)
+        placeholder.deleteLater()
+        return True
+
+    def mark_dirty(self, game_info: dict):
+        """Record new game info and defer the refresh until the page is shown."""
+        self._game_info = game_info
+        self._dirty = True
+
+    def refresh_if_dirty(self):
+        if self._dirty:
+            self.refresh(self._game_info)
+
     def refresh(self, game_info: dict):
+        self._dirty = False
         self._game_info = game_info
         self._mods_tab.refresh(game_info)
         if self._profile_tab:
             self._profile_tab.refresh(game_info)
-        self._saves_tab.refresh(game_info)
+        if self._saves_tab:
+            self._saves_tab.refresh(game_info)
 
     def _on_tab_changed(self, index: int):
+        if self._realize_tab(index):
+            return
         widget = self._tabs.widget(index)
         if widget is self._profile_tab and self._profile_tab:
             self._profile_tab._on_refresh()
@@ -0,0 +1,31 @@
+"""Coalesces bursts of log messages into one terminal update."""
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+class LogThrottler(QObject):
+    """Buffers (message, level) pairs and emits them together.
+
+    The first message after an idle period arms a single-shot timer;
+    everything that arrives before it fires goes out in one ``flushed``.
+    """
+    flushed = Signal(list)  # list[tuple[str, str]]
+
+    def __init__(self, timeout: int = 30, parent=None):
+        super().__init__(parent)
+        self._pending: list[tuple[str, str]] = []
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(timeout)
+        self._timer.timeout.connect(self.flush)
+
+    def trigger(self, message: str, level: str = "info"):
+        self._pending.append((message, level))
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        self._timer.stop()
+        if self._pending:
+            batch, self._pending = self._pending, []
+            self.flushed.emit(batch)
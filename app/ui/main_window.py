@@ -2,14 +2,19 @@
 Main application window — horizontal splitter: sidebar | content, terminal at bottom.
 """
 
+import logging
 import os
+import stat
 import threading
-import queue as _queue
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                                 QSplitter, QLabel, QPushButton, QFrame,
                                 QStackedWidget, QProgressDialog, QDialog,
-                                QApplication, QSizePolicy)
-from PySide6.QtCore import Qt, Signal, QThread, QObject, QTimer, QSize
+                                QApplication, QSizePolicy, QMessageBox)
+from PySide6.QtCore import (Qt, Signal, Slot, QThread, QObject, QTimer, QSize,
+                            QRunnable, QThreadPool, QMetaObject)
 from PySide6.QtGui import QPixmap, QShortcut, QKeySequence
 
 from PySide6.QtGui import QFont as _QFont, QIcon as _QIcon, QPixmap as _QPixmap, QPainter as _QPainter, QColor as _QColor
@@ -29,41 +34,236 @@ def _mdl2_icon(char: str, size: int = 16, color: str = "#c0c0d8") -> _QIcon:
     p.drawText(px.rect(), Qt.AlignCenter, char)
     p.end()
     return _QIcon(px)
-from app.core.game_scanner import scan_for_games
+from app.config.game_definitions import GAME_DEFINITIONS
+from app.core.game_scanner import scan_for_games, library_fingerprint
+from app.core.ini_parser import read_ini_value, save_ini_settings
+from app.core.me3_service import (find_me3_executable, write_me3_profile,
+                                  launch_game_with_me3, launch_game_direct,
+                                  ME3_GAME_MAP)
+from app.core.mod_updater import version_compare
+from app.services.nexus_service import NexusService
+from app.services.update_service import download_and_run_installer
 from app.ui.sidebar import Sidebar
 from app.ui.game_page import GamePage
 from app.ui.terminal_widget import TerminalWidget
+from app.ui.log_throttler import LogThrottler
 from app.ui.dialogs.settings_dialog import SettingsDialog
 from app.ui.dialogs.confirm_dialog import ConfirmDialog
+from app.ui.dialogs.coop_password_dialog import CoopPasswordDialog
+from app.ui.tabs.mods_tab import _find_native_dlls, _has_asset_content
+
+
+log = logging.getLogger(__name__)
+
+# Game pages kept alive at once; older ones are rebuilt on demand
+_MAX_CACHED_PAGES = 4
+
+# Window of Nexus' updated.json; cached versions older than this are refetched
+_UPDATED_PERIOD = "1m"
+_UPDATED_PERIOD_SECS = 28 * 24 * 3600
+
+# Per-game co-op mod fields used by _ensure_me3_profiles, resolved once
+_COOP_TEMPLATE: dict[str, SimpleNamespace] = {
+    game_id: SimpleNamespace(
+        marker_rel=gdef.get("mod_marker_relative", ""),
+        mod_name=gdef.get("mod_name", "Co-op Mod"),
+        nexus_domain=gdef.get("nexus_domain", ""),
+        nexus_mod_id=gdef.get("nexus_mod_id", 0),
+        coop_id=f"{game_id}-coop",
+        in_me3_map=game_id in ME3_GAME_MAP,
+    )
+    for game_id, gdef in GAME_DEFINITIONS.items()
+}
+
+
+class _Bridge(QObject):
+    """Carries results from worker threads back to the GUI thread."""
+    log = Signal(str, str)                   # message, level
+    update_check = Signal(str, str, dict)    # game_id, game_name, result
+    update_check_done = Signal(str, object)  # nexus domain, mod id
+    launch_result = Signal(str, bool, str)   # name, success, method
+    app_update = Signal(dict)
+    app_update_done = Signal(dict)
+    me3_profiles_resolved = Signal(str, list)  # me3_path, [(game_id, pkgs, dlls)]
+    scan_fingerprint = Signal(str)
+
+
+def _stat_many(root: str, rels) -> dict[str, os.stat_result | None]:
+    """Stat paths relative to *root*, listing each parent directory once.
+
+    Results come from the scandir entries, which on Windows already carry
+    the stat data, so several files in one folder cost a single listing.
+    """
+    by_parent: dict[str, list[str]] = {}
+    for rel in rels:
+        by_parent.setdefault(os.path.dirname(os.path.normpath(rel)), []).append(rel)
+    fold = os.path.normcase
+    out: dict[str, os.stat_result | None] = {}
+    for parent, group in by_parent.items():
+        try:
+            with os.scandir(os.path.join(root, parent)) as it:
+                entries = {fold(e.name): e for e in it}
+        except OSError:
+            entries = {}
+        for rel in group:
+            entry = entries.get(fold(os.path.basename(os.path.normpath(rel))))
+            try:
+                out[rel] = entry.stat() if entry else None
+            except OSError:
+                out[rel] = None
+    return out
+
+
+def _update_result(mod: dict, latest: str) -> dict:
+    installed = mod.get("version") or ""
+    has_update = False
+    if installed and latest:
+        has_update = version_compare(installed, latest) < 0
+    elif latest:
+        has_update = True
+    return {"has_update": has_update, "latest_version": latest}
+
+
+class _UpdateCheckTask(QRunnable):
+    """Compares one installed mod against its Nexus mod-page version."""
+
+    def __init__(self, svc, game_id: str, game_name: str, mod: dict, bridge: _Bridge):
+        super().__init__()
+        self._svc = svc
+        self._game_id = game_id
+        self._game_name = game_name
+        self._mod = mod
+        self._bridge = bridge
+
+    def run(self):
+        mod = self._mod
+        domain = mod.get("nexus_domain", "")
+        nid = mod.get("nexus_mod_id", 0)
+        try:
+            self._check(mod, domain, nid)
+        finally:
+            self._bridge.update_check_done.emit(domain, nid)
+
+    def _check(self, mod: dict, domain: str, nid: int):
+        if not domain or not nid:
+            return
+        checked_at = time.time()
+        # Use Nexus mod-page version as single source of truth
+        mod_info = self._svc.get_mod_info(domain, nid)
+        if "error" in mod_info:
+            return
+        latest = mod_info.get("version", "")
+        result = _update_result(mod, latest)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("update check: %s %s: installed=%r latest=%r has_update=%s",
+                      self._game_name, mod.get("name", ""), mod.get("version") or "",
+                      latest, result["has_update"])
+        # Lets MainWindow remember the version for _DomainUpdateTask
+        result["cache_key"] = f"{domain}:{nid}"
+        result["checked_at"] = checked_at
+        self._bridge.update_check.emit(self._game_id, self._game_name, result)
+
+
+class _DomainUpdateTask(QRunnable):
+    """Re-checks only the mods of one Nexus domain that changed recently.
+
+    One updated.json request lists every mod changed in the last month.
+    A mod whose cached version was fetched inside that window, and which
+    has not changed since, is answered from the cache; the rest get an
+    _UpdateCheckTask on the same pool.
+    """
+
+    def __init__(self, svc, domain: str, entries: list, cache: dict,
+                 pool: QThreadPool, bridge: _Bridge):
+        super().__init__()
+        self._svc = svc
+        self._domain = domain
+        self._entries = entries  # [(game_id, game_name, mod)]
+        self._cache = cache
+        self._pool = pool
+        self._bridge = bridge
+
+    def run(self):
+        pending = list(self._entries)
+        try:
+            changed = self._svc.get_updated_mods(self._domain, _UPDATED_PERIOD).get("updated")
+            now = time.time()
+            while pending:
+                game_id, game_name, mod = pending[0]
+                nid = mod["nexus_mod_id"]
+                cached = self._cache.get(f"{self._domain}:{nid}")
+                if (changed is not None and cached
+                        and now - cached["checked"] < _UPDATED_PERIOD_SECS
+                        and changed.get(int(nid), 0) <= cached["checked"]):
+                    self._bridge.update_check.emit(
+                        game_id, game_name, _update_result(mod, cached["version"]))
+                    self._bridge.update_check_done.emit(self._domain, nid)
+                else:
+                    self._pool.start(
+                        _UpdateCheckTask(self._svc, game_id, game_name, mod, self._bridge))
+                pending.pop(0)
+        except Exception:
+            log.exception("Batched update check for %s failed", self._domain)
+            # Anything left gets a full per-mod check, which always reports
+            # update_check_done and so clears the in-flight key
+            for game_id, game_name, mod in pending:
+                self._pool.start(
+                    _UpdateCheckTask(self._svc, game_id, game_name, mod, self._bridge))
 
 
 class _ScanWorker(QObject):
+    """Lives on MainWindow's scan thread for the app's lifetime; one run() per scan."""
     progress = Signal(str)
-    finished = Signal(dict)
+    scan_finished = Signal(dict, str)  # games, library fingerprint
 
+    @Slot()
     def run(self):
         def _cb(msg):
             self.progress.emit(msg)
         result = scan_for_games(progress_callback=_cb)
-        self.finished.emit(result)
+        self.scan_finished.emit(result, library_fingerprint())
+
+
+class _LazyPage(QWidget):
+    """Empty page that fills itself from ``build`` the first time it is shown."""
+
+    def __init__(self, build, parent=None):
+        super().__init__(parent)
+        self._build_fn = build
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+
+    def showEvent(self, event):
+        if self._build_fn is not None:
+            build, self._build_fn = self._build_fn, None
+            self._layout.addWidget(build())
+        super().showEvent(event)
 
 
 class MainWindow(QMainWindow):
     def __init__(self, config: ConfigManager):
         super().__init__()
         self._config = config
-        self._game_pages: dict[str, GamePage] = {}
+        # Least recently shown first; trimmed to _MAX_CACHED_PAGES
+        self._game_pages: OrderedDict[str, GamePage] = OrderedDict()
         self._games: dict = {}
         self._current_game_id: str | None = None
+        # Last inputs written per ME3 profile, to skip rewriting identical ones
+        self._me3_profile_hashes: dict[str, int] = {}
+        # (configured ME3 path, resolved me3.exe) from the last lookup
+        self._me3_exe: tuple[str, str] | None = None
+        # Latest Nexus versions by "domain:mod_id", saved after each batch
+        self._nexus_versions: dict[str, dict] = dict(config.get_nexus_version_cache())
+        self._nexus_versions_dirty = False
+        # (nexus domain, mod id) pairs with a check queued or running
+        self._inflight_checks: set[tuple[str, int]] = set()
 
         self.setWindowTitle("FromSoft Mod Manager")
         self.setMinimumSize(1000, 640)
         self.resize(1200, 760)
 
-        self._pending: _queue.SimpleQueue = _queue.SimpleQueue()
-        self._poll_timer = QTimer(self)
-        self._poll_timer.timeout.connect(self._poll_updates)
-        self._poll_timer.start(200)
+        # Created on the GUI thread so emits from workers arrive queued
+        self._bridge = _Bridge(self)
 
         self._build()
         self._load_games()
@@ -77,6 +277,12 @@ class MainWindow(QMainWindow):
             self._show_event_fired = True
             QTimer.singleShot(800, self._maybe_auto_auth)
 
+    def _on_about_to_quit(self):
+        # Drop queued update checks so shutdown only waits on running ones
+        self._update_pool.clear()
+        self._scan_thread.quit()
+        self._scan_thread.wait()
+
     def _maybe_auto_auth(self):
         """On first launch, prompt for Nexus auth if not already connected."""
         if self._config.get_nexus_access_token():
@@ -86,7 +292,6 @@ class MainWindow(QMainWindow):
         logged_in = self._sidebar.nexus_widget.prompt_login()
         self._config.set("nexus_auth_prompted", True)
         if not logged_in:
-            from PySide6.QtWidgets import QMessageBox
             msg = QMessageBox(self)
             msg.setIcon(QMessageBox.Information)
             msg.setWindowTitle("Nexus Mods Sign-In Skipped")
@@ -186,8 +391,8 @@ class MainWindow(QMainWindow):
         # Content area
         self._content_stack = QStackedWidget()
 
-        # Landing page
-        self._landing = self._build_landing()
+        # Landing page — returning users land on a game, so build it on first show
+        self._landing = _LazyPage(self._build_landing)
         self._content_stack.addWidget(self._landing)
 
         self._splitter.addWidget(self._content_stack)
@@ -201,10 +406,37 @@ class MainWindow(QMainWindow):
         self._terminal = TerminalWidget()
         self._terminal.setVisible(False)
         root.addWidget(self._terminal)
+        # Scans reuse one worker thread that idles in its event loop
+        self._scan_thread = QThread(self)
+        self._scan_worker = _ScanWorker()
+        self._scan_worker.moveToThread(self._scan_thread)
+        self._scan_worker.progress.connect(self._on_scan_progress)
+        self._scan_worker.scan_finished.connect(self._on_scan_done)
+        self._scan_thread.finished.connect(self._scan_worker.deleteLater)
+        self._scan_thread.start()
+        # Covers both closing the window and QApplication.quit()
+        QApplication.instance().aboutToQuit.connect(self._on_about_to_quit)
+
+        # Mod update checks share a small pool instead of a thread per mod
+        self._update_pool = QThreadPool(self)
+        self._update_pool.setMaxThreadCount(4)
+
+        # Bursts (scan progress, update checks) reach the terminal in one go
+        self._log_throttler = LogThrottler(30, self)
+        self._log_throttler.flushed.connect(self._terminal.log_batch)
 
         shortcut = QShortcut(QKeySequence("Ctrl+`"), self)
         shortcut.activated.connect(self._toggle_terminal)
 
+        self._bridge.log.connect(self._on_log)
+        self._bridge.update_check.connect(self._on_update_checked)
+        self._bridge.update_check_done.connect(self._on_update_check_done)
+        self._bridge.launch_result.connect(self._on_launch_result)
+        self._bridge.app_update.connect(self._on_app_update)
+        self._bridge.app_update_done.connect(self._on_app_update_done)
+        self._bridge.me3_profiles_resolved.connect(self._write_me3_profiles)
+        self._bridge.scan_fingerprint.connect(self._on_scan_fingerprint)
+
     def _toggle_terminal(self):
         self._terminal.setVisible(not self._terminal.isVisible())
 
@@ -255,7 +487,8 @@ class MainWindow(QMainWindow):
         games = self._config.get_games()
         if games:
             self._games = games
-            self._sidebar.populate_games(games)
+            with self._sidebar.batch():
+                self._sidebar.populate_games(games)
             self._ensure_me3_profiles()
             if games:
                 first_id = next(iter(games))
@@ -264,6 +497,8 @@ class MainWindow(QMainWindow):
         last_scan = self._config.get_last_scan()
         if last_scan:
             self._scan_status_lbl.setText(f"Scanned: {last_scan[:10]}")
+            # Cached games are shown already; rescan only if Steam changed
+            QTimer.singleShot(2000, self._on_scan_if_stale)
         else:
             # First launch — auto-scan for games
             QTimer.singleShot(300, self._on_scan)
@@ -281,8 +516,32 @@ class MainWindow(QMainWindow):
             page.auth_changed.connect(self._on_nexus_auth_from_install)
             self._game_pages[game_id] = page
             self._content_stack.addWidget(page)
+        else:
+            self._game_pages[game_id].refresh_if_dirty()
+            self._game_pages.move_to_end(game_id)
 
         self._content_stack.setCurrentWidget(self._game_pages[game_id])
+        self._evict_game_pages()
+
+    def _evict_game_pages(self):
+        """Drop the least recently shown pages beyond the cache limit.
+
+        Pages with an install or update running are kept; an evicted page
+        is rebuilt the next time its game is selected.
+        """
+        excess = len(self._game_pages) - _MAX_CACHED_PAGES
+        if excess <= 0:
+            return
+        for game_id, page in list(self._game_pages.items()):
+            if excess <= 0:
+                break
+            if game_id == self._current_game_id or page.is_busy():
+                continue
+            del self._game_pages[game_id]
+            self._content_stack.removeWidget(page)
+            page.cleanup()
+            page.deleteLater()
+            excess -= 1
 
     def _on_mod_installed(self, game_id: str):
         # Update sidebar state only — the ModsTab already updated its own cards
@@ -290,7 +549,8 @@ class MainWindow(QMainWindow):
         # and re-fire update checks, causing stale results and layout glitches.
         self._config.reload()
         self._games = self._config.get_games()
-        self._sidebar.populate_games(self._games)
+        with self._sidebar.batch():
+            self._sidebar.populate_games(self._games)
 
     def _ensure_me3_profiles(self):
         """Auto-detect co-op mods on disk and write ME3 profiles for all games.
@@ -299,66 +559,114 @@ class MainWindow(QMainWindow):
         1. Co-op mod not in config but exists on disk → register it
         2. Co-op mod in config but path is stale/invalid → repair to marker path
         3. Co-op mod in config with valid path → just write the ME3 profile
-        """
-        from app.core.me3_service import (find_me3_executable, write_me3_profile,
-                                          ME3_GAME_MAP)
-        from app.config.game_definitions import GAME_DEFINITIONS
-        from app.ui.tabs.mods_tab import _find_native_dlls, _has_asset_content
 
-        me3_path = find_me3_executable(self._config.get_me3_path())
+        Config repairs happen here; resolving each mod's DLLs and asset
+        content runs on a worker and the profiles are written from
+        ``_write_me3_profiles`` once it reports back.
+        """
+        me3_path = self._find_me3()
         if not me3_path:
             return
 
+        # One stat per path for the whole pass
+        dir_cache: dict[str, bool] = {}
+
+        def _isdir(p: str) -> bool:
+            r = dir_cache.get(p)
+            if r is None:
+                r = dir_cache[p] = os.path.isdir(p)
+            return r
+
+        profiles: list[tuple[str, list[str]]] = []
         for game_id, game_info in self._games.items():
-            if game_id not in ME3_GAME_MAP:
+            tpl = _COOP_TEMPLATE.get(game_id)
+            if tpl is None or not tpl.in_me3_map:
                 continue
-            gdef = GAME_DEFINITIONS.get(game_id, {})
-            marker_rel = gdef.get("mod_marker_relative", "")
+            marker_rel = tpl.marker_rel
             install_path = game_info.get("install_path", "")
-            marker_path = os.path.join(install_path, marker_rel) if marker_rel and install_path else ""
+            marker_path = ""
+            if marker_rel and install_path:
+                marker_path = os.path.join(install_path, marker_rel)
+                st = _stat_many(install_path, (marker_rel,))[marker_rel]
+                dir_cache[marker_path] = st is not None and stat.S_ISDIR(st.st_mode)
 
-            coop_id = f"{game_id}-coop"
+            coop_id = tpl.coop_id
             mods = self._config.get_game_mods(game_id)
             coop_mod = next((m for m in mods if m["id"] == coop_id), None)
 
             if coop_mod:
                 # Registered — repair stale path if needed
-                if not coop_mod.get("path") or not os.path.isdir(coop_mod["path"]):
-                    if marker_path and os.path.isdir(marker_path):
+                if not coop_mod.get("path") or not _isdir(coop_mod["path"]):
+                    if marker_path and _isdir(marker_path):
                         coop_mod["path"] = marker_path
                         self._config.add_or_update_game_mod(game_id, coop_mod)
                         mods = self._config.get_game_mods(game_id)
             else:
                 # Not registered — auto-detect from disk
-                if marker_path and os.path.isdir(marker_path):
+                if marker_path and _isdir(marker_path):
                     mod_dict = {
                         "id": coop_id,
-                        "name": gdef.get("mod_name", "Co-op Mod"),
+                        "name": tpl.mod_name,
                         "version": "",
                         "path": marker_path,
-                        "nexus_domain": gdef.get("nexus_domain", ""),
-                        "nexus_mod_id": gdef.get("nexus_mod_id", 0),
+                        "nexus_domain": tpl.nexus_domain,
+                        "nexus_mod_id": tpl.nexus_mod_id,
                         "enabled": True,
                     }
                     self._config.add_or_update_game_mod(game_id, mod_dict)
                     mods = self._config.get_game_mods(game_id)
 
-            # Write ME3 profile from current mod state
-            pkg_paths = []
-            native_paths = []
-            for m in mods:
-                if not m.get("enabled") or not m.get("path"):
-                    continue
-                p = m["path"]
-                if p.lower().endswith(".dll"):
-                    native_paths.append(p)
-                elif os.path.isdir(p):
-                    dlls = _find_native_dlls(p)
-                    if dlls:
+            profiles.append((game_id, [m["path"] for m in mods
+                                       if m.get("enabled") and m.get("path")]))
+
+        bridge = self._bridge
+
+        def _resolve():
+            dll_cache: dict[str, list[str]] = {}
+            asset_cache: dict[str, bool] = {}
+            resolved = []
+            for game_id, paths in profiles:
+                pkg_paths = []
+                native_paths = []
+                for p in paths:
+                    if p.lower().endswith(".dll"):
+                        native_paths.append(p)
+                    elif _isdir(p):
+                        dlls = dll_cache.get(p)
+                        if dlls is None:
+                            dlls = dll_cache[p] = _find_native_dlls(p)
                         native_paths.extend(dlls)
-                    if _has_asset_content(p):
-                        pkg_paths.append(p)
-            write_me3_profile(game_id, pkg_paths, me3_path, native_dlls=native_paths)
+                        has_assets = asset_cache.get(p)
+                        if has_assets is None:
+                            has_assets = asset_cache[p] = _has_asset_content(p)
+                        if has_assets:
+                            pkg_paths.append(p)
+                resolved.append((game_id, pkg_paths, native_paths))
+            bridge.me3_profiles_resolved.emit(me3_path, resolved)
+
+        threading.Thread(target=_resolve, daemon=True).start()
+
+    def _find_me3(self) -> str | None:
+        """find_me3_executable, reusing the last hit while it still exists."""
+        configured = self._config.get_me3_path()
+        if (self._me3_exe and self._me3_exe[0] == configured
+                and os.path.isfile(self._me3_exe[1])):
+            return self._me3_exe[1]
+        me3_path = find_me3_executable(configured)
+        self._me3_exe = (configured, me3_path) if me3_path else None
+        return me3_path
+
+    def _write_me3_profiles(self, me3_path: str, profiles: list):
+        """Write the ME3 profiles resolved by ``_ensure_me3_profiles``.
+
+        A profile whose inputs match the last write is left untouched.
+        """
+        for game_id, pkg_paths, native_paths in profiles:
+            h = hash((me3_path, tuple(pkg_paths), tuple(native_paths)))
+            if self._me3_profile_hashes.get(game_id) == h:
+                continue
+            if write_me3_profile(game_id, pkg_paths, me3_path, native_dlls=native_paths):
+                self._me3_profile_hashes[game_id] = h
 
     # ------------------------------------------------------------------
     # Scan
@@ -367,58 +675,59 @@ class MainWindow(QMainWindow):
         if getattr(self, '_scan_in_progress', False):
             return
         self._scan_in_progress = True
-        print("[SCAN] _on_scan started", flush=True)
+        log.debug("scan: started")
         self._scan_status_lbl.setText("Scanning…")
-        self._terminal.log("Scanning for games…")
+        self._on_log("Scanning for games…")
+        QMetaObject.invokeMethod(self._scan_worker, "run", Qt.QueuedConnection)
 
-        self._scan_thread = QThread()
-        self._scan_worker = _ScanWorker()
-        self._scan_worker.moveToThread(self._scan_thread)
-        self._scan_thread.started.connect(self._scan_worker.run)
-        self._scan_worker.progress.connect(self._on_scan_progress)
-        self._scan_worker.finished.connect(self._on_scan_done)
-        self._scan_worker.finished.connect(self._scan_thread.quit)
-        # Proper cleanup: schedule deletion after thread/worker have stopped
-        self._scan_worker.finished.connect(self._scan_worker.deleteLater)
-        self._scan_thread.finished.connect(self._scan_thread.deleteLater)
-        print("[SCAN] starting thread", flush=True)
-        self._scan_thread.start()
+    def _on_scan_if_stale(self):
+        """Fingerprint the Steam libraries in the background."""
+        bridge = self._bridge
+        threading.Thread(
+            target=lambda: bridge.scan_fingerprint.emit(library_fingerprint()),
+            daemon=True).start()
+
+    def _on_scan_fingerprint(self, fingerprint: str):
+        if fingerprint != self._config.get_scan_cache()["fingerprint"]:
+            self._on_scan()
 
     def _on_scan_progress(self, msg: str):
-        print(f"[SCAN] progress: {msg}", flush=True)
-        self._terminal.log(msg)
+        log.debug("scan: progress: %s", msg)
+        self._on_log(msg)
 
-    def _on_scan_done(self, games: dict):
-        print(f"[SCAN] _on_scan_done, found {len(games)} games", flush=True)
+    def _on_scan_done(self, games: dict, fingerprint: str = ""):
+        log.debug("scan: done, found %d games", len(games))
         self._scan_in_progress = False
-        self._config.set_games(games)
+        self._config.set_scan_cache(fingerprint, games)
         self._games = games
 
-        print("[SCAN] removing old pages", flush=True)
+        log.debug("scan: removing old pages")
         # Remove old game pages safely — deleteLater lets Qt clean up threads
         for page in list(self._game_pages.values()):
             self._content_stack.removeWidget(page)
+            page.cleanup()
             page.deleteLater()
         self._game_pages.clear()
 
-        print("[SCAN] switching to landing", flush=True)
+        log.debug("scan: switching to landing")
         # Landing was never removed; just switch back to it
         self._content_stack.setCurrentWidget(self._landing)
 
-        print("[SCAN] populating sidebar", flush=True)
-        self._sidebar.populate_games(games)
+        log.debug("scan: populating sidebar")
+        with self._sidebar.batch():
+            self._sidebar.populate_games(games)
 
         count = len(games)
         self._scan_status_lbl.setText(f"Found {count} game{'s' if count != 1 else ''}")
-        self._terminal.log_success(f"Scan complete — found {count} game(s)")
+        self._on_log(f"Scan complete — found {count} game(s)", "success")
 
         if games:
             # Restore the previously selected game, or fall back to the first
             restore_id = self._current_game_id if self._current_game_id in games else next(iter(games))
-            print(f"[SCAN] selecting game: {restore_id}", flush=True)
+            log.debug("scan: selecting game %s", restore_id)
             self._on_game_selected(restore_id)
         self._ensure_me3_profiles()
-        print("[SCAN] _on_scan_done complete", flush=True)
+        log.debug("scan: complete")
         self._check_all_mod_updates()
 
     # ------------------------------------------------------------------
@@ -431,9 +740,7 @@ class MainWindow(QMainWindow):
 
     def _on_nexus_auth_changed(self, api_key: str):
         """Refresh game pages when Nexus auth changes (login/logout via sidebar)."""
-        for page in self._game_pages.values():
-            game_info = self._games.get(page._game_id, {})
-            page.refresh(game_info)
+        self._refresh_pages()
         if api_key:
             self._check_all_mod_updates()
 
@@ -442,21 +749,25 @@ class MainWindow(QMainWindow):
         self._sidebar.nexus_widget._refresh()
 
     def _on_settings_saved(self):
-        self._terminal.log("Settings saved", "success")
+        self._on_log("Settings saved", "success")
         # Refresh Nexus widget (picks up sign-out / key changes)
         self._sidebar.nexus_widget._refresh()
         # Refresh game pages to pick up ME3 changes
-        for page in self._game_pages.values():
-            game_info = self._games.get(page._game_id, {})
-            page.refresh(game_info)
+        self._refresh_pages()
+
+    def _refresh_pages(self):
+        """Refresh the visible game page; hidden ones refresh when next shown."""
+        for game_id, page in self._game_pages.items():
+            game_info = self._games.get(game_id, {})
+            if game_id == self._current_game_id:
+                page.refresh(game_info)
+            else:
+                page.mark_dirty(game_info)
 
     # ------------------------------------------------------------------
     # Launch
     # ------------------------------------------------------------------
     def _on_launch_game(self, game_id: str):
-        import threading
-        from app.core.me3_service import (find_me3_executable, launch_game_with_me3,
-                                          launch_game_direct, ME3_GAME_MAP)
         game_info = self._games.get(game_id, {})
         name = game_info.get("name", game_id)
 
@@ -468,12 +779,12 @@ class MainWindow(QMainWindow):
         me3_path = find_me3_executable(self._config.get_me3_path())
         launcher_path = game_info.get("launcher_path", "")
         me3_supported = ME3_GAME_MAP.get(game_id) is not None
-        pending = self._pending
+        bridge = self._bridge
 
-        self._terminal.log(f"Launching {name}…", "info")
+        self._on_log(f"Launching {name}…", "info")
 
         def _terminal_cb(msg):
-            pending.put(("log", msg, "info"))
+            bridge.log.emit(msg, "info")
 
         def _launch():
             proc = None
@@ -487,13 +798,13 @@ class MainWindow(QMainWindow):
                 else:
                     # ME3 failed — it may have started the game process already,
                     # so don't try to launch again via direct launcher.
-                    pending.put(("launch_result", name, False, "ME3 attach failed — close the game and try again"))
+                    bridge.launch_result.emit(name, False, "ME3 attach failed — close the game and try again")
                     return
             if not proc and launcher_path:
                 proc = launch_game_direct(launcher_path, terminal_callback=_terminal_cb)
                 if not method:
                     method = "direct"
-            pending.put(("launch_result", name, proc is not None, method))
+            bridge.launch_result.emit(name, proc is not None, method)
 
         threading.Thread(target=_launch, daemon=True).start()
 
@@ -513,9 +824,9 @@ class MainWindow(QMainWindow):
         config_rel = gdef.get("config_relative", "")
         install_path = game_info.get("install_path", "")
         if config_rel and install_path:
-            candidate = os.path.join(install_path, config_rel)
-            if os.path.isfile(candidate):
-                return candidate
+            st = _stat_many(install_path, (config_rel,))[config_rel]
+            if st is not None and stat.S_ISREG(st.st_mode):
+                return os.path.join(install_path, config_rel)
         return None
 
     def _check_coop_password(self, game_id: str, game_info: dict) -> bool:
@@ -523,7 +834,6 @@ class MainWindow(QMainWindow):
 
         Returns True to proceed with launch, False to abort.
         """
-        from app.config.game_definitions import GAME_DEFINITIONS
         gdef = GAME_DEFINITIONS.get(game_id, {})
         if "cooppassword" not in gdef.get("defaults", {}):
             return True
@@ -532,146 +842,136 @@ class MainWindow(QMainWindow):
         if not ini_path:
             return True
 
-        from app.core.ini_parser import read_ini_value
         password = read_ini_value(ini_path, "cooppassword")
         if password:
             return True
 
         # Password is empty — prompt the user
-        from app.ui.dialogs.coop_password_dialog import CoopPasswordDialog
         dlg = CoopPasswordDialog(game_info.get("name", game_id), parent=self)
         if dlg.exec() != QDialog.Accepted:
             return False
 
-        from app.core.ini_parser import save_ini_settings
         save_ini_settings(ini_path, {"cooppassword": dlg.password})
-        self._terminal.log(f"Co-op password saved for {game_info.get('name', game_id)}", "info")
+        self._on_log(f"Co-op password saved for {game_info.get('name', game_id)}", "info")
         return True
 
     # ------------------------------------------------------------------
     # Logging
     # ------------------------------------------------------------------
-    def _on_log(self, message: str, level: str):
-        self._terminal.log(message, level)
+    def _on_log(self, message: str, level: str = "info"):
+        self._log_throttler.trigger(message, level)
 
     # ------------------------------------------------------------------
     # Background update checks
     # ------------------------------------------------------------------
-    def _poll_updates(self):
-        try:
-            while True:
-                item = self._pending.get_nowait()
-                tag = item[0]
-                if tag == "log":
-                    _, msg, level = item
-                    self._terminal.log(msg, level)
-                elif tag == "update_check":
-                    _, game_id, game_name, result = item
-                    self._on_update_checked(game_id, game_name, result)
-                elif tag == "app_update":
-                    _, result = item
-                    latest = result.get("latest", "")
-                    self._update_download_url = result.get("download_url", "")
-                    self._update_lbl.setText(f"Update available: v{latest}")
-                    self._update_banner.setVisible(True)
-                    self._terminal.log(f"App update available: v{latest}", "warn")
-                elif tag == "app_update_done":
-                    _, result = item
-                    if result.get("success"):
-                        self._terminal.log("Installer launched — closing app…", "success")
-                        QApplication.quit()
-                    else:
-                        self._terminal.log(f"Update failed: {result.get('message', 'unknown error')}", "error")
-                        self._update_now_btn.setEnabled(True)
-                        self._update_now_btn.setText("Update Now")
-                elif tag == "launch_result":
-                    _, name, success, method = item
-                    if success:
-                        msg = f"Launched {name}"
-                        if method:
-                            msg += f" ({method})"
-                        self._terminal.log(msg, "success")
-                    elif method and "ME3 failed" in method:
-                        self._terminal.log(f"{name}: {method}", "warning")
-                    else:
-                        self._terminal.log(f"Failed to launch {name}", "error")
-        except _queue.Empty:
-            pass
+    def _on_launch_result(self, name: str, success: bool, method: str):
+        if success:
+            msg = f"Launched {name}"
+            if method:
+                msg += f" ({method})"
+            self._on_log(msg, "success")
+        elif method and "ME3 failed" in method:
+            self._on_log(f"{name}: {method}", "warning")
+        else:
+            self._on_log(f"Failed to launch {name}", "error")
+
+    def _on_update_check_done(self, domain: str, nid):
+        self._inflight_checks.discard((domain, nid))
+        if not self._inflight_checks and self._nexus_versions_dirty:
+            # Batch finished — persist the versions it fetched in one write
+            self._nexus_versions_dirty = False
+            self._config.set_nexus_version_cache(dict(self._nexus_versions))
 
     def _on_update_checked(self, game_id: str, game_name: str, result: dict):
         if "error" in result:
             return
+        if "cache_key" in result:
+            self._nexus_versions[result["cache_key"]] = {
+                "version": result["latest_version"],
+                "checked": result["checked_at"],
+            }
+            self._nexus_versions_dirty = True
         if result.get("has_update"):
             latest = result.get("latest_version", "?")
-            self._terminal.log(f"{game_name}: update available → v{latest}", "warning")
-            self._sidebar.set_update_badge(game_id, True)
+            self._on_log(f"{game_name}: update available → v{latest}", "warning")
+            # One mod is enough to light the badge; skip repeat repaints
+            if not self._sidebar.has_update_badge(game_id):
+                self._sidebar.set_update_badge(game_id, True)
 
     # ------------------------------------------------------------------
     # App self-update
     # ------------------------------------------------------------------
+    def _on_app_update(self, result: dict):
+        latest = result.get("latest", "")
+        self._update_download_url = result.get("download_url", "")
+        self._update_lbl.setText(f"Update available: v{latest}")
+        self._update_banner.setVisible(True)
+        self._on_log(f"App update available: v{latest}", "warn")
+
+    def _on_app_update_done(self, result: dict):
+        if result.get("success"):
+            self._on_log("Installer launched — closing app…", "success")
+            self._log_throttler.flush()
+            QApplication.quit()
+        else:
+            self._on_log(f"Update failed: {result.get('message', 'unknown error')}", "error")
+            self._update_now_btn.setEnabled(True)
+            self._update_now_btn.setText("Update Now")
+
     def _on_update_now(self):
         """Download the latest installer and launch it."""
         url = self._update_download_url
         if not url:
-            self._terminal.log("No download URL available", "error")
+            self._on_log("No download URL available", "error")
             return
 
         self._update_now_btn.setEnabled(False)
         self._update_now_btn.setText("Downloading…")
         self._terminal.setVisible(True)
-        self._terminal.log("Downloading app update…", "info")
-        pending = self._pending
+        self._on_log("Downloading app update…", "info")
+        bridge = self._bridge
 
         def _download():
-            from app.services.update_service import download_and_run_installer
-
             def _progress(msg, pct):
-                pending.put(("log", msg, "info"))
+                bridge.log.emit(msg, "info")
 
             result = download_and_run_installer(url, progress_callback=_progress)
-            pending.put(("app_update_done", result))
+            bridge.app_update_done.emit(result)
 
         threading.Thread(target=_download, daemon=True).start()
 
     def _check_all_mod_updates(self):
-        """Fire background update checks for all installed mods across all games."""
+        """Queue background update checks for all installed mods across all games.
+
+        Mods are grouped by Nexus domain so each domain costs one
+        updated.json request plus a mod-info request per changed mod.
+        """
         access_token = self._config.get_nexus_access_token()
         if not access_token:
             return
-        pending = self._pending
-        config = self._config
-
-        for game_id, game_info in self._games.items():
-            mods = self._config.get_game_mods(game_id)
-            if not mods:
-                continue
-            gname = game_info.get("name", game_id)
-
+        # One service for the batch so a token refresh is shared by every check
+        svc = NexusService(access_token, config=self._config)
+
+        # Copy the Nexus-linked mods once; the config's own dicts stay on
+        # the GUI thread while the copies go to the workers
+        snapshot = [
+            (game_id, game_info.get("name", game_id),
+             tuple(dict(m) for m in self._config.get_game_mods(game_id)
+                   if m.get("nexus_domain") and m.get("nexus_mod_id")))
+            for game_id, game_info in self._games.items()
+        ]
+
+        by_domain: dict[str, list] = {}
+        for game_id, gname, mods in snapshot:
             for mod in mods:
-                if not mod.get("nexus_mod_id"):
+                domain = mod["nexus_domain"]
+                key = (domain, mod["nexus_mod_id"])
+                if key in self._inflight_checks:
                     continue
+                self._inflight_checks.add(key)
+                by_domain.setdefault(domain, []).append((game_id, gname, mod))
 
-                def _work(game_id=game_id, game_name=gname, mod=dict(mod)):
-                    from app.services.nexus_service import NexusService
-                    from app.core.mod_updater import version_compare
-                    svc = NexusService(access_token, config=config)
-                    domain = mod.get("nexus_domain", "")
-                    nid = mod.get("nexus_mod_id", 0)
-                    if not domain or not nid:
-                        return
-                    # Use Nexus mod-page version as single source of truth
-                    mod_info = svc.get_mod_info(domain, nid)
-                    if "error" in mod_info:
-                        return
-                    latest = mod_info.get("version", "")
-                    installed = mod.get("version") or ""
-                    has_update = False
-                    if installed and latest:
-                        has_update = version_compare(installed, latest) < 0
-                    elif latest:
-                        has_update = True
-                    print(f"[UPDATE CHECK] {game_name} {mod.get('name','')}: installed={installed!r} latest={latest!r} has_update={has_update}", flush=True)
-                    result = {"has_update": has_update, "latest_version": latest}
-                    pending.put(("update_check", game_id, game_name, result))
-
-                threading.Thread(target=_work, daemon=True).start()
+        cache = dict(self._nexus_versions)
+        for domain, entries in by_domain.items():
+            self._update_pool.start(_DomainUpdateTask(
+                svc, domain, entries, cache, self._update_pool, self._bridge))
@@ -1,31 +1,110 @@
 """Nexus Mods authentication widget — shows login button or user info."""
 
+import json
+import logging
+import os
+import urllib.request
 import time
-import threading
+import hashlib
+from functools import lru_cache
 from PySide6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QLabel,
                                 QPushButton, QDialog, QDialogButtonBox)
-from PySide6.QtCore import Qt, Signal, QTimer, QThread, QObject
-from PySide6.QtGui import QPixmap, QFont, QPainter, QColor
+from PySide6.QtCore import Qt, Signal, QTimer, QObject, QRunnable, QThreadPool, QUrl
+from PySide6.QtGui import QPixmap, QFont, QPainter, QColor, QImage, QPainterPath
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from app.config.config_manager import ConfigManager
 from app.services.nexus_service import NexusService
-from app.services.nexus_oauth import NexusOAuthClient, refresh_access_token
+from app.services.nexus_oauth import (NexusOAuthClient, refresh_access_token,
+                                      extract_user_info, decode_jwt_payload)
+
+log = logging.getLogger(__name__)
+
+# Seconds a successful token validation is trusted across app starts
+_REVALIDATE_AFTER = 24 * 3600
+
+# Masked avatars on disk, refetched after a week; in-memory copies by URL
+_AVATAR_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "resources", "avatars"
+)
+_AVATAR_TTL = 7 * 24 * 3600
+_AVATAR_CACHE: dict[str, QPixmap] = {}
+
+
+def _set_state(lbl: QLabel, state: str):
+    """Switch a status label's colour via its `state` QSS property."""
+    lbl.setProperty("state", state)
+    lbl.style().unpolish(lbl)
+    lbl.style().polish(lbl)
+
+
+@lru_cache(maxsize=1)
+def _default_avatar() -> QPixmap:
+    """Person icon used when there's no profile photo, rendered once."""
+    px = QPixmap(32, 32)
+    px.fill(QColor("transparent"))
+    p = QPainter(px)
+    p.setFont(QFont("Segoe MDL2 Assets", 16))
+    p.setPen(QColor("#8888aa"))
+    p.drawText(px.rect(), Qt.AlignCenter, "\uE77B")  # Contact icon
+    p.end()
+    return px
+
+
+def _avatar_path(url: str) -> str:
+    key = hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+    return os.path.join(_AVATAR_DIR, f"{key}.png")
+
+
+def _render_avatar(data: bytes, size: int = 32) -> QImage:
+    """Decode, center-crop and circle-mask an avatar image.
+
+    Works on QImage only, so it is safe to call off the GUI thread.
+    Returns a null QImage if the data can't be decoded.
+    """
+    img = QImage.fromData(data)
+    if img.isNull():
+        return img
+    scaled = img.scaled(size, size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+    # Crop to center size x size if needed
+    if scaled.width() > size or scaled.height() > size:
+        x = (scaled.width() - size) // 2
+        y = (scaled.height() - size) // 2
+        scaled = scaled.copy(x, y, size, size)
+    # Apply circular mask
+    circle = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    circle.fill(Qt.transparent)
+    p = QPainter(circle)
+    p.setRenderHint(QPainter.Antialiasing)
+    path = QPainterPath()
+    path.addEllipse(0, 0, size, size)
+    p.setClipPath(path)
+    p.drawImage(0, 0, scaled)
+    p.end()
+    return circle
+
+
+class _TaskSignals(QObject):
+    """Signals for a pooled task; created on the GUI thread so results queue back."""
+    finished = Signal(dict)
 
 
-class _RefreshWorker(QObject):
-    """Background worker to refresh an OAuth token."""
-    finished = Signal(dict)
+class _RefreshRunnable(QRunnable):
+    """Pooled task that refreshes an OAuth token."""
 
     def __init__(self, refresh_token: str):
         super().__init__()
         self._refresh_token = refresh_token
+        self.signals = _TaskSignals()
 
     def run(self):
         result = refresh_access_token(self._refresh_token)
-        self.finished.emit(result)
+        self.signals.finished.emit(result)
 
 
 class NexusAuthDialog(QDialog):
     """Dialog for Nexus OAuth 2.0 PKCE authorization."""
+    _oauth_done = Signal(object, object)  # tokens dict | None, error | None
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -34,7 +113,7 @@ class NexusAuthDialog(QDialog):
         self.setMinimumWidth(440)
         self.tokens = None  # dict with access_token, refresh_token, expires_at, user
         self._oauth_client = None
-        self._poll_timer = None
+        self._oauth_done.connect(self._on_oauth_done)
         self._build()
 
     def _build(self):
@@ -62,7 +141,7 @@ class NexusAuthDialog(QDialog):
 
         # Status label (hidden initially)
         self._status_lbl = QLabel("")
-        self._status_lbl.setStyleSheet("color:#8888aa;font-size:11px;")
+        self._status_lbl.setObjectName("nexus_auth_status")
         self._status_lbl.setWordWrap(True)
         self._status_lbl.setVisible(False)
         layout.addWidget(self._status_lbl)
@@ -81,33 +160,27 @@ class NexusAuthDialog(QDialog):
         self._status_lbl.setText(
             "Your browser has been opened. Approve the request to continue."
         )
-        self._status_lbl.setStyleSheet("color:#8888aa;font-size:11px;")
+        _set_state(self._status_lbl, "")
         self._status_lbl.setVisible(True)
 
-        self._oauth_client = NexusOAuthClient()
+        # Emitted from the callback server thread; delivered queued
+        self._oauth_client = NexusOAuthClient(self._oauth_done.emit)
         self._oauth_client.start()
 
         # Check for error from server startup
         _, err = self._oauth_client.poll()
         if err:
             self._status_lbl.setText(f"Failed to start: {err}")
-            self._status_lbl.setStyleSheet("color:#e74c3c;font-size:11px;")
+            _set_state(self._status_lbl, "error")
             self._auth_btn.setText("  Authorize with Nexus Mods")
             self._auth_btn.setEnabled(True)
             self._oauth_client = None
-            return
 
-        self._poll_timer = QTimer(self)
-        self._poll_timer.timeout.connect(self._poll_oauth)
-        self._poll_timer.start(500)
-
-    def _poll_oauth(self):
-        """Check if OAuth has returned tokens or error."""
+    def _on_oauth_done(self, tokens, err):
+        """OAuth returned tokens or an error."""
         if not self._oauth_client:
             return
 
-        tokens, err = self._oauth_client.poll()
-
         if tokens:
             self._stop_oauth()
             self.tokens = tokens
@@ -115,15 +188,12 @@ class NexusAuthDialog(QDialog):
         elif err:
             self._stop_oauth()
             self._status_lbl.setText(f"Authorization failed: {err}")
-            self._status_lbl.setStyleSheet("color:#e74c3c;font-size:11px;")
+            _set_state(self._status_lbl, "error")
             self._auth_btn.setText("  Authorize with Nexus Mods")
             self._auth_btn.setEnabled(True)
 
     def _stop_oauth(self):
-        """Clean up OAuth client and timer."""
-        if self._poll_timer:
-            self._poll_timer.stop()
-            self._poll_timer = None
+        """Clean up the OAuth client."""
         if self._oauth_client:
             self._oauth_client.stop()
             self._oauth_client = None
@@ -132,6 +202,11 @@ class NexusAuthDialog(QDialog):
         self._stop_oauth()
         self.reject()
 
+    def done(self, result):
+        # Escape / accept also end the flow, not just Cancel and close
+        self._stop_oauth()
+        super().done(result)
+
     def closeEvent(self, event):
         self._stop_oauth()
         super().closeEvent(event)
@@ -140,18 +215,22 @@ class NexusAuthDialog(QDialog):
 class NexusWidget(QWidget):
     """Top of sidebar — shows login button or logged-in user."""
     auth_changed = Signal(str)  # emits access_token on change
-    _avatar_ready = Signal(bytes)  # internal: avatar image data from bg thread
+    _avatar_ready = Signal(str, QImage)  # internal: url, masked avatar from bg thread
 
     def __init__(self, config: ConfigManager, parent=None):
         super().__init__(parent)
         self._config = config
-        self._thread = None
-        self._worker = None
+        self._bg_busy = False
+        # One manager for all avatar fetches so connections are reused
+        self._nam = QNetworkAccessManager(self)
         self._build()
         self._refresh()
-        # Try to refresh token in background to catch revoked tokens
+        # Try to refresh token in background to catch revoked tokens;
+        # skipped when this token already checked out recently
         if self._config.get_nexus_access_token():
-            QTimer.singleShot(500, self._revalidate_token)
+            age = time.time() - self._config.get_nexus_last_validated()
+            if age > _REVALIDATE_AFTER or self._config.is_nexus_token_expired():
+                QTimer.singleShot(500, self._revalidate_token)
         # Silent renew: check token every 5 minutes, refresh if near expiry
         self._renew_timer = QTimer(self)
         self._renew_timer.setInterval(5 * 60 * 1000)  # 5 minutes
@@ -217,7 +296,7 @@ class NexusWidget(QWidget):
         self._name_lbl = QLabel("User")
         self._name_lbl.setStyleSheet("font-size:12px;font-weight:700;color:#e0e0ec;")
         self._status_lbl = QLabel("Premium")
-        self._status_lbl.setStyleSheet("font-size:10px;color:#4ecca3;")
+        self._status_lbl.setObjectName("nexus_tier")
         user_info.addWidget(self._name_lbl)
         user_info.addWidget(self._status_lbl)
         ul.addLayout(user_info)
@@ -226,15 +305,8 @@ class NexusWidget(QWidget):
         self._layout.addWidget(self._user_widget)
 
     def _set_default_avatar(self):
-        """Render a person icon as the default avatar."""
-        px = QPixmap(32, 32)
-        px.fill(QColor("transparent"))
-        p = QPainter(px)
-        p.setFont(QFont("Segoe MDL2 Assets", 16))
-        p.setPen(QColor("#8888aa"))
-        p.drawText(px.rect(), Qt.AlignCenter, "\uE77B")  # Contact icon
-        p.end()
-        self._avatar_lbl.setPixmap(px)
+        """Show the person icon as the default avatar."""
+        self._avatar_lbl.setPixmap(_default_avatar())
 
     def _refresh(self):
         token = self._config.get_nexus_access_token()
@@ -248,69 +320,80 @@ class NexusWidget(QWidget):
             self._name_lbl.setText(user.get("name", "User"))
             is_premium = user.get("is_premium", False) or user.get("is_supporter", False)
             self._status_lbl.setText("Premium" if is_premium else "Free")
-            self._status_lbl.setStyleSheet(
-                "font-size:10px;color:#4ecca3;" if is_premium else "font-size:10px;color:#8888aa;"
-            )
+            _set_state(self._status_lbl, "premium" if is_premium else "")
             # Fetch profile photo in background
             profile_url = user.get("profile_url", "")
             if profile_url:
-                self._fetch_avatar(profile_url)
+                self._show_avatar(profile_url)
         else:
             self._set_default_avatar()
 
-    def _fetch_avatar(self, url: str):
-        """Download the Nexus profile image in the background."""
-        import urllib.request
+    def _show_avatar(self, url: str):
+        """Show the avatar from memory or disk, downloading it if missing or stale."""
+        px = _AVATAR_CACHE.get(url)
+        if px is not None:
+            self._avatar_lbl.setPixmap(px)
+            return
+        path = _avatar_path(url)
+        try:
+            fresh = time.time() - os.path.getmtime(path) < _AVATAR_TTL
+        except OSError:
+            fresh = False
+        if fresh:
+            px = QPixmap(path)
+            if not px.isNull():
+                _AVATAR_CACHE[url] = px
+                self._avatar_lbl.setPixmap(px)
+                return
+        self._fetch_avatar(url, path)
+
+    def _fetch_avatar(self, url: str, path: str):
+        """Download the Nexus profile image and cache it at path."""
+        req = QNetworkRequest(QUrl(url))
+        req.setHeader(QNetworkRequest.UserAgentHeader, "FromSoftModManager/2.0")
+        req.setTransferTimeout(10000)
+        reply = self._nam.get(req)
+        reply.finished.connect(lambda: self._on_avatar_downloaded(reply, url, path))
+
+    def _on_avatar_downloaded(self, reply: QNetworkReply, url: str, path: str):
+        reply.deleteLater()
+        if reply.error() != QNetworkReply.NoError:
+            return
+        data = reply.readAll().data()
+        ready = self._avatar_ready
 
         def _work():
+            # Decode, mask and save off the GUI thread
+            img = _render_avatar(data)
+            if img.isNull():
+                return
             try:
-                req = urllib.request.Request(url, headers={"User-Agent": "FromSoftModManager/2.0"})
-                with urllib.request.urlopen(req, timeout=10) as resp:
-                    self._avatar_ready.emit(resp.read())
-            except Exception:
+                os.makedirs(_AVATAR_DIR, exist_ok=True)
+                img.save(path, "PNG")
+            except OSError:
                 pass
+            ready.emit(url, img)
+
+        QThreadPool.globalInstance().start(_work)
 
-        threading.Thread(target=_work, daemon=True).start()
-
-    def _on_avatar_ready(self, data: bytes):
-        px = QPixmap()
-        px.loadFromData(data)
-        if not px.isNull():
-            scaled = px.scaled(32, 32, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-            # Crop to center 32x32 if needed
-            if scaled.width() > 32 or scaled.height() > 32:
-                x = (scaled.width() - 32) // 2
-                y = (scaled.height() - 32) // 2
-                scaled = scaled.copy(x, y, 32, 32)
-            # Apply circular mask
-            from PySide6.QtGui import QPainterPath
-            circle = QPixmap(32, 32)
-            circle.fill(QColor("transparent"))
-            p = QPainter(circle)
-            p.setRenderHint(QPainter.Antialiasing)
-            path = QPainterPath()
-            path.addEllipse(0, 0, 32, 32)
-            p.setClipPath(path)
-            p.drawPixmap(0, 0, scaled)
-            p.end()
-            self._avatar_lbl.setPixmap(circle)
-
-    def _start_bg_work(self, worker, on_finished):
-        """Safely start a background QThread, cleaning up any previous one."""
-        if self._thread is not None:
-            self._thread.quit()
-            self._thread.wait()
-        self._thread = QThread()
-        self._worker = worker
-        self._worker.moveToThread(self._thread)
-        self._thread.started.connect(self._worker.run)
-        self._worker.finished.connect(on_finished)
-        self._worker.finished.connect(self._thread.quit)
-        self._thread.start()
+    def _on_avatar_ready(self, url: str, img: QImage):
+        px = QPixmap.fromImage(img)
+        _AVATAR_CACHE[url] = px
+        self._avatar_lbl.setPixmap(px)
+
+    def _start_bg_work(self, runnable, on_finished):
+        """Run a token task on the shared thread pool, one at a time."""
+        self._bg_busy = True
+        runnable.signals.finished.connect(self._on_bg_finished)
+        runnable.signals.finished.connect(on_finished)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_bg_finished(self, _result: dict):
+        self._bg_busy = False
 
     def _silent_renew(self):
         """Periodically refresh the token before it expires."""
-        if self._thread is not None and self._thread.isRunning():
+        if self._bg_busy:
             return
         tokens = self._config.get_nexus_tokens()
         if not tokens.get("refresh_token"):
@@ -318,15 +401,15 @@ class NexusWidget(QWidget):
         expires_at = tokens.get("expires_at", 0)
         # Refresh if token expires within the next 10 minutes
         if time.time() >= expires_at - 600:
-            print("[NEXUS] Silent renew: token near expiry, refreshing", flush=True)
+            log.info("Silent renew: token near expiry, refreshing")
             self._start_bg_work(
-                _RefreshWorker(tokens["refresh_token"]),
+                _RefreshRunnable(tokens["refresh_token"]),
                 self._on_token_refreshed,
             )
 
     def _revalidate_token(self):
         """Background check that the stored token is still valid."""
-        if self._thread is not None and self._thread.isRunning():
+        if self._bg_busy:
             return
         tokens = self._config.get_nexus_tokens()
         refresh_token = tokens.get("refresh_token", "")
@@ -336,29 +419,29 @@ class NexusWidget(QWidget):
         if not self._config.is_nexus_token_expired():
             token = tokens.get("access_token", "")
             self._start_bg_work(
-                _ValidateWorker(token, self._config),
+                _ValidateRunnable(token),
                 self._on_revalidated,
             )
         else:
             # Token expired — try refresh
             self._start_bg_work(
-                _RefreshWorker(refresh_token),
+                _RefreshRunnable(refresh_token),
                 self._on_token_refreshed,
             )
 
     def _on_token_refreshed(self, result: dict):
         if "error" in result:
-            print("[NEXUS] Token refresh failed, clearing auth", flush=True)
+            log.warning("Token refresh failed, clearing auth")
             self._config.clear_nexus_auth()
             self._refresh()
             self.auth_changed.emit("")
         else:
             self._config.set_nexus_tokens(result)
             # Update user info from JWT
-            from app.services.nexus_oauth import extract_user_info
             user_info = extract_user_info(result.get("access_token", ""))
             if user_info.get("name"):
                 self._config.set_nexus_user_info(user_info)
+            self._config.set_nexus_last_validated(time.time())
             self._refresh()
 
     def _on_revalidated(self, result: dict):
@@ -368,11 +451,11 @@ class NexusWidget(QWidget):
             refresh_token = tokens.get("refresh_token", "")
             if refresh_token:
                 QTimer.singleShot(0, lambda: self._start_bg_work(
-                    _RefreshWorker(refresh_token),
+                    _RefreshRunnable(refresh_token),
                     self._on_token_refreshed,
                 ))
             else:
-                print("[NEXUS] Stored token is invalid, clearing auth", flush=True)
+                log.warning("Stored token is invalid, clearing auth")
                 self._config.clear_nexus_auth()
                 self._refresh()
                 self.auth_changed.emit("")
@@ -384,6 +467,7 @@ class NexusWidget(QWidget):
             if result.get("name"):
                 existing["name"] = result["name"]
             self._config.set_nexus_user_info(existing)
+            self._config.set_nexus_last_validated(time.time())
             self._refresh()
 
     def prompt_login(self) -> bool:
@@ -418,23 +502,18 @@ class NexusWidget(QWidget):
         self.auth_changed.emit("")
 
 
-class _ValidateWorker(QObject):
-    """Background worker to validate a token via the Nexus API."""
-    finished = Signal(dict)
+class _ValidateRunnable(QRunnable):
+    """Pooled task that validates a token via the Nexus API."""
 
-    def __init__(self, access_token: str, config=None):
+    def __init__(self, access_token: str):
         super().__init__()
         self._token = access_token
-        self._config = config
+        self.signals = _TaskSignals()
 
     def run(self):
-        import json
-        import urllib.request
-        import urllib.error
         # Use Nexus v2 GraphQL API (supports OAuth Bearer tokens)
         try:
             # Get user ID from JWT to query their profile
-            from app.services.nexus_oauth import decode_jwt_payload
             jwt_user = decode_jwt_payload(self._token).get("user", {})
             user_id = jwt_user.get("id", 0)
             query = json.dumps({"query": f'{{ user(id: {user_id}) {{ avatar, name, memberId }} }}'})
@@ -451,8 +530,8 @@ class _ValidateWorker(QObject):
             with urllib.request.urlopen(req, timeout=10) as resp:
                 result = json.loads(resp.read().decode())
                 user_data = result.get("data", {}).get("user", {})
-                self.finished.emit(user_data if user_data else {"error": "No user data"})
+                self.signals.finished.emit(user_data if user_data else {"error": "No user data"})
                 return
         except Exception:
             pass
-        self.finished.emit({"error": "Could not fetch user info"})
+        self.signals.finished.emit({"error": "Could not fetch user info"})
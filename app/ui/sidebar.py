@@ -3,32 +3,88 @@ Left sidebar — Nexus widget, game list, management buttons.
 """
 
 import os
+import re
+import time
 import threading
-import queue as _queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                                 QPushButton, QFrame, QScrollArea, QSizePolicy,
-                                QSpacerItem)
-from PySide6.QtCore import Qt, Signal, QSize, QTimer
+                                QSpacerItem, QApplication)
+from PySide6.QtCore import Qt, Signal, QSize, QTimer, QSignalBlocker, QObject
 from PySide6.QtGui import QPixmap, QIcon, QFont, QPainter, QColor
 
 from app.config.config_manager import ConfigManager
+from app.core.me3_service import get_me3_version, get_latest_me3_release
+from app.services.steam_service import get_player_count, download_logo, PLAYER_COUNT_TTL
+from app.services.update_service import check_for_update
+from app.ui.dialogs.me3_update_dialog import ME3UpdateDialog
 
 # Windows 11 native icon font
 _MDL2 = "Segoe MDL2 Assets"
 
+# Concurrent Steam requests per player-count refresh; small to stay polite
+_STEAM_WORKERS = 4
+
+# Player counts refresh this often (ms) while the app is active
+_PLAYER_COUNT_INTERVAL = 60000
+
+
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_LOGOS_DIR = os.path.join(_APP_ROOT, "resources", "logos")
+
+# Logos already scaled for GameButton, by (path, mtime); least recent dropped first
+_SCALED_LOGO_MAX = 64
+_SCALED_LOGO_CACHE: OrderedDict[tuple[str, float], QPixmap] = OrderedDict()
+
+
+def _read_version() -> str:
+    version_file = os.path.join(_APP_ROOT, "VERSION")
+    try:
+        with open(version_file) as f:
+            return f.read().strip()
+    except Exception:
+        return "2.0.0"
+
+
+_APP_VERSION = _read_version()
+
+
+_ICON_CACHE: dict[tuple[str, int, str], QIcon] = {}
+_FONT_CACHE: dict[int, QFont] = {}
+
 
 def _mdl2_icon(char: str, size: int = 16, color: str = "#c0c0d8") -> QIcon:
+    key = (char, size, color)
+    icon = _ICON_CACHE.get(key)
+    if icon is not None:
+        return icon
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = QFont(_MDL2, int(size * 0.75))
     px = QPixmap(size, size)
     px.fill(QColor("transparent"))
     p = QPainter(px)
-    p.setFont(QFont(_MDL2, int(size * 0.75)))
+    p.setFont(font)
     p.setPen(QColor(color))
     p.drawText(px.rect(), Qt.AlignCenter, char)
     p.end()
-    return QIcon(px)
+    icon = _ICON_CACHE[key] = QIcon(px)
+    return icon
 from app.ui.nexus_widget import NexusWidget
 
 
+class _SidebarBridge(QObject):
+    """Carries background fetch results back to the GUI thread."""
+    me3_ready = Signal(str)              # installed version, "" if not found
+    me3_update = Signal(str, str)        # installed, latest
+    logo_ready = Signal(str, str)        # game_id, logo path
+    player_count = Signal(str, object)   # game_id, count or None
+    counts_fetched = Signal(object)      # games signature of a completed fetch
+    app_update = Signal(dict)
+
+
 class GameButton(QPushButton):
     """Sidebar game button with logo + player count + play button + optional update badge."""
 
@@ -38,6 +94,8 @@ class GameButton(QPushButton):
         super().__init__(parent)
         self._game_id = game_id
         self._game_info = game_info
+        app_id = game_info.get("steam_app_id")
+        self._logo_path = os.path.join(_LOGOS_DIR, f"{app_id}.png") if app_id else ""
         self.setObjectName("sidebar_btn")
         self.setCheckable(True)
         self.setFixedHeight(60)
@@ -57,11 +115,11 @@ class GameButton(QPushButton):
         self._logo_lbl = QLabel()
         self._logo_lbl.setFixedHeight(32)
         self._logo_lbl.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        self._logo_lbl.setStyleSheet("background:transparent;")
+        self._logo_lbl.setObjectName("game_logo")
         left_col.addWidget(self._logo_lbl)
 
         self._players_lbl = QLabel()
-        self._players_lbl.setStyleSheet("font-size:9px;color:#555577;background:transparent;")
+        self._players_lbl.setObjectName("game_players")
         self._players_lbl.setVisible(False)
         left_col.addWidget(self._players_lbl)
 
@@ -71,7 +129,7 @@ class GameButton(QPushButton):
         # Update dot
         self._update_dot = QLabel("●")
         self._update_dot.setFixedSize(10, 10)
-        self._update_dot.setStyleSheet("color:#ff9800;font-size:7px;background:transparent;")
+        self._update_dot.setObjectName("game_update_dot")
         self._update_dot.setVisible(False)
         layout.addWidget(self._update_dot)
 
@@ -82,13 +140,7 @@ class GameButton(QPushButton):
         self._play_btn.setFlat(True)
         self._play_btn.setToolTip("Launch game")
         self._play_btn.setCursor(Qt.PointingHandCursor)
-        self._play_btn.setStyleSheet(
-            "QPushButton{color:#4ecca3;font-size:10px;font-weight:700;"
-            "border:1px solid #4ecca3;background:transparent;border-radius:4px;"
-            "padding:0 6px;}"
-            "QPushButton:hover{color:#fff;background:#4ecca3;}"
-            "QPushButton:pressed{background:#3dbb92;border-color:#3dbb92;}"
-        )
+        self._play_btn.setObjectName("game_play_btn")
         self._play_btn.clicked.connect(lambda: self.launch_requested.emit(self._game_id))
         layout.addWidget(self._play_btn)
 
@@ -99,20 +151,36 @@ class GameButton(QPushButton):
         else:
             self._players_lbl.setVisible(False)
 
+    def set_game_info(self, game_info: dict):
+        self._game_info = game_info
+
     def set_update_available(self, available: bool):
         self._update_dot.setVisible(available)
 
     def load_icon(self, icon_path: str):
-        if os.path.isfile(icon_path):
-            pix = QPixmap(icon_path)
+        try:
+            key = (icon_path, os.path.getmtime(icon_path))
+        except OSError:
+            return
+        pix = _SCALED_LOGO_CACHE.get(key)
+        if pix is None:
             # Scale to fit: max 120px wide, 32px tall
-            pix = pix.scaled(120, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self._logo_lbl.setPixmap(pix)
+            pix = QPixmap(icon_path).scaled(120, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            _SCALED_LOGO_CACHE[key] = pix
+            if len(_SCALED_LOGO_CACHE) > _SCALED_LOGO_MAX:
+                _SCALED_LOGO_CACHE.popitem(last=False)
+        else:
+            _SCALED_LOGO_CACHE.move_to_end(key)
+        self._logo_lbl.setPixmap(pix)
 
     @property
     def game_id(self):
         return self._game_id
 
+    @property
+    def logo_path(self) -> str:
+        return self._logo_path
+
 
 class Sidebar(QWidget):
     game_selected = Signal(str)   # game_id
@@ -126,17 +194,38 @@ class Sidebar(QWidget):
         self._game_buttons: dict[str, GameButton] = {}
         self._current_game: str | None = None
         self._games: dict = {}
-        self._fetching_counts = False
-        self._pending: _queue.SimpleQueue = _queue.SimpleQueue()
+        # Held by the player-count worker; a non-blocking acquire picks one winner
+        self._fetch_lock = threading.Lock()
+        # Games signature and time of the last completed fetch
+        self._last_counts_sig = None
+        self._last_counts_at = 0.0
+        self._bridge = _SidebarBridge(self)
+        self._bridge.me3_ready.connect(self._on_me3_version)
+        self._bridge.me3_update.connect(self._check_me3_update)
+        self._bridge.logo_ready.connect(self._on_logo_ready)
+        self._bridge.player_count.connect(self._on_player_count)
+        self._bridge.counts_fetched.connect(self._on_counts_fetched)
+        self._bridge.app_update.connect(self._on_app_update)
+        # Update badges by game_id; survive populate_games rebuilding buttons
+        self._badges: dict[str, bool] = {}
+        self._batch_depth = 0
+        self._badge_buffer: dict[str, bool] = {}
         self.setObjectName("sidebar_frame")
         self.setFixedWidth(220)
         self._build()
-        self._poll_timer = QTimer(self)
-        self._poll_timer.timeout.connect(self._poll_updates)
-        self._poll_timer.start(200)
         self._player_count_timer = QTimer(self)
+        self._player_count_timer.setInterval(_PLAYER_COUNT_INTERVAL)
         self._player_count_timer.timeout.connect(self._refresh_player_counts)
-        self._player_count_timer.start(60000)
+        self._player_count_timer.start()
+        self._counts_fetched_at = 0.0
+        # No refresh wakeups while the app is in the background
+        QApplication.instance().applicationStateChanged.connect(self._on_app_state)
+        # Refresh requests within the window collapse into one fetch
+        self._fetch_logos = False
+        self._refresh_debounce = QTimer(self)
+        self._refresh_debounce.setSingleShot(True)
+        self._refresh_debounce.setInterval(300)
+        self._refresh_debounce.timeout.connect(self._do_refresh_player_counts)
         self._start_me3_version_check()
 
     def _build(self):
@@ -206,23 +295,12 @@ class Sidebar(QWidget):
         layout.addWidget(mgmt)
 
         # ── Version footer ─────────────────────────────────────
-        try:
-            version_file = os.path.join(os.path.dirname(os.path.dirname(
-                os.path.dirname(os.path.abspath(__file__)))), "VERSION")
-            version = open(version_file).read().strip() if os.path.isfile(version_file) else "2.0.0"
-        except Exception:
-            version = "2.0.0"
-
-        self._version_lbl = QLabel(f"v{version}")
-        self._version_lbl.setStyleSheet(
-            "font-size:10px;color:#3a3a5a;padding:6px 14px 2px 14px;"
-        )
+        self._version_lbl = QLabel(f"v{_APP_VERSION}")
+        self._version_lbl.setObjectName("app_version")
         layout.addWidget(self._version_lbl)
 
         self._me3_lbl = QLabel("ME3: checking…")
-        self._me3_lbl.setStyleSheet(
-            "font-size:10px;color:#3a3a5a;padding:0px 14px 2px 14px;"
-        )
+        self._me3_lbl.setObjectName("me3_version")
         layout.addWidget(self._me3_lbl)
 
         # ME3 update button (hidden until update detected)
@@ -238,35 +316,72 @@ class Sidebar(QWidget):
         self._me3_update_btn.setVisible(False)
         layout.addWidget(self._me3_update_btn)
 
+    @contextmanager
+    def batch(self):
+        """Group several sidebar changes into one layout/paint pass.
+
+        Signals are blocked and badge changes are buffered (last one per
+        game wins) until the outermost batch exits.
+        """
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self)
+        try:
+            yield self
+        finally:
+            blocker.unblock()
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                buffered, self._badge_buffer = self._badge_buffer, {}
+                for game_id, available in buffered.items():
+                    self._apply_update_badge(game_id, available)
+                self.setUpdatesEnabled(True)
+
     def populate_games(self, games: dict):
-        """Rebuild the game button list."""
-        # Clear existing buttons
-        while self._games_layout.count():
-            item = self._games_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        self._game_buttons.clear()
-
-        self._no_games_lbl.setVisible(not games)
-
-        for game_id, game_info in games.items():
-            btn = GameButton(game_id, game_info)
-            btn.clicked.connect(lambda checked, gid=game_id: self._on_game_clicked(gid))
-            btn.launch_requested.connect(lambda gid=game_id: self.launch_game.emit(gid))
-
-            # Load logo icon from cache
-            app_id = game_info.get("steam_app_id")
-            if app_id:
-                resources_dir = os.path.join(
-                    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-                    "resources", "logos"
-                )
-                logo_path = os.path.join(resources_dir, f"{app_id}.png")
-                if os.path.isfile(logo_path):
-                    btn.load_icon(logo_path)
-
-            self._games_layout.addWidget(btn)
-            self._game_buttons[game_id] = btn
+        """Sync the game button list with games, reusing existing buttons."""
+        # One layout pass and repaint for all adds/removes/moves; inside
+        # batch() the whole sidebar is frozen already, so leave it alone
+        container = self._games_container
+        freeze = container.updatesEnabled()
+        if freeze:
+            container.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(container)
+        try:
+            for game_id in set(self._game_buttons) - set(games):
+                btn = self._game_buttons.pop(game_id)
+                self._games_layout.removeWidget(btn)
+                btn.deleteLater()
+
+            self._no_games_lbl.setVisible(not games)
+
+            for index, (game_id, game_info) in enumerate(games.items()):
+                btn = self._game_buttons.get(game_id)
+                if btn is not None:
+                    btn.set_game_info(game_info)
+                    if self._games_layout.indexOf(btn) != index:
+                        self._games_layout.removeWidget(btn)
+                        self._games_layout.insertWidget(index, btn)
+                    continue
+
+                btn = GameButton(game_id, game_info)
+                btn.clicked.connect(lambda checked, gid=game_id: self._on_game_clicked(gid))
+                btn.launch_requested.connect(lambda gid=game_id: self.launch_game.emit(gid))
+
+                # Load logo icon from cache
+                if btn.logo_path:
+                    btn.load_icon(btn.logo_path)
+
+                if self._badges.get(game_id):
+                    btn.set_update_available(True)
+
+                self._games_layout.insertWidget(index, btn)
+                self._game_buttons[game_id] = btn
+        finally:
+            blocker.unblock()
+            if freeze:
+                container.setUpdatesEnabled(True)
+                container.update()
 
         # Re-select current game if still present
         if self._current_game and self._current_game in self._game_buttons:
@@ -276,7 +391,7 @@ class Sidebar(QWidget):
         self._games = games
 
         # Fetch player counts in background
-        self._fetch_player_counts(games)
+        self._schedule_player_counts(logos=True)
 
     def _on_game_clicked(self, game_id: str):
         for gid, btn in self._game_buttons.items():
@@ -288,108 +403,138 @@ class Sidebar(QWidget):
         self._on_game_clicked(game_id)
 
     def set_update_badge(self, game_id: str, available: bool):
+        if self._batch_depth:
+            self._badge_buffer[game_id] = available
+        else:
+            self._apply_update_badge(game_id, available)
+
+    def has_update_badge(self, game_id: str) -> bool:
+        """True if the game's update badge is shown or queued to be shown."""
+        return self._badge_buffer.get(game_id, self._badges.get(game_id, False))
+
+    def _apply_update_badge(self, game_id: str, available: bool):
+        self._badges[game_id] = available
         if game_id in self._game_buttons:
             self._game_buttons[game_id].set_update_available(available)
 
+    def _on_app_state(self, state):
+        if state != Qt.ApplicationActive:
+            self._player_count_timer.stop()
+            return
+        if self._player_count_timer.isActive():
+            return
+        self._player_count_timer.start()
+        # Catch up if a refresh came due while in the background
+        if time.time() - self._counts_fetched_at >= _PLAYER_COUNT_INTERVAL / 1000:
+            self._refresh_player_counts()
+
     def _refresh_player_counts(self):
         """Called by recurring timer — re-fetch counts if games are loaded."""
-        if self._games and not self._fetching_counts:
-            self._fetch_player_counts(self._games, logos=False)
+        self._schedule_player_counts(logos=False)
+
+    def _schedule_player_counts(self, logos: bool):
+        """Restart the debounce; the fetch runs once requests stop arriving."""
+        self._fetch_logos = self._fetch_logos or logos
+        self._refresh_debounce.start()
+
+    def _do_refresh_player_counts(self):
+        logos, self._fetch_logos = self._fetch_logos, False
+        self._counts_fetched_at = time.time()
+        if self._games:
+            self._fetch_player_counts(self._games, logos=logos)
 
     def _fetch_player_counts(self, games: dict, logos: bool = True):
         """Fetch Steam player counts (and optionally missing logos) in background."""
-        if self._fetching_counts:
+        sig = tuple(sorted(games))
+        # Same games fetched moments ago — every count would come from the TTL cache
+        if (sig == self._last_counts_sig
+                and time.time() - self._last_counts_at < PLAYER_COUNT_TTL):
             return
-        self._fetching_counts = True
-        pending = self._pending
-        resources_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-            "resources", "logos"
-        )
+        if not self._fetch_lock.acquire(blocking=False):
+            return
+        bridge = self._bridge
+        fetch_lock = self._fetch_lock
+
+        def _fetch_logo(game_id, app_id, logo_path):
+            if download_logo(app_id, logo_path):
+                bridge.logo_ready.emit(game_id, logo_path)
+
+        def _fetch_count(game_id, app_id):
+            # steam_service caches fresh counts and shares in-flight requests
+            bridge.player_count.emit(game_id, get_player_count(app_id))
 
         def _work():
             try:
-                from app.services.steam_service import get_player_count, download_logo
-                for game_id, game_info in games.items():
-                    app_id = game_info.get("steam_app_id")
-                    if app_id:
+                # Requests overlap; each emits as soon as it completes
+                with ThreadPoolExecutor(max_workers=_STEAM_WORKERS) as ex:
+                    for game_id, game_info in games.items():
+                        app_id = game_info.get("steam_app_id")
+                        if not app_id:
+                            continue
                         # Download logo if missing (only on first call)
                         if logos:
-                            logo_path = os.path.join(resources_dir, f"{app_id}.png")
+                            logo_path = os.path.join(_LOGOS_DIR, f"{app_id}.png")
                             if not os.path.isfile(logo_path):
-                                if download_logo(app_id, logo_path):
-                                    pending.put(("logo_ready", game_id, logo_path))
-                        # Fetch player count
-                        count = get_player_count(app_id)
-                        pending.put(("player_count", game_id, count))
+                                ex.submit(_fetch_logo, game_id, app_id, logo_path)
+                        ex.submit(_fetch_count, game_id, app_id)
+                bridge.counts_fetched.emit(sig)
             finally:
-                pending.put(("fetch_counts_done",))
+                fetch_lock.release()
 
         threading.Thread(target=_work, daemon=True).start()
 
     def _start_me3_version_check(self):
         config = self._config
-        pending = self._pending
+        bridge = self._bridge
 
         def _work():
-            from app.core.me3_service import get_me3_version, get_latest_me3_release
             ver = get_me3_version(config.get_me3_path())
-            pending.put(("me3_ver", ver))
+            bridge.me3_ready.emit(ver or "")
             # Check for ME3 updates
             if ver:
                 latest = get_latest_me3_release()
                 if latest and not latest.get("error") and latest.get("version"):
-                    pending.put(("me3_update", ver, latest["version"]))
+                    bridge.me3_update.emit(ver, latest["version"])
             # Check for app updates
-            from app.services.update_service import check_for_update
             app_result = check_for_update()
-            pending.put(("app_update", app_result))
+            bridge.app_update.emit(app_result)
 
         threading.Thread(target=_work, daemon=True).start()
 
-    def _poll_updates(self):
-        try:
-            while True:
-                item = self._pending.get_nowait()
-                if item[0] == "me3_ver":
-                    import re as _re_mod
-                    ver = item[1]
-                    if ver:
-                        display = _re_mod.sub(r'^me3\s+', '', ver)
-                        self._me3_lbl.setText(f"ME3: {display}")
-                        self._me3_lbl.setStyleSheet(
-                            "font-size:10px;color:#3a3a5a;padding:0px 14px 2px 14px;"
-                        )
-                    else:
-                        self._me3_lbl.setText("ME3: not found")
-                        self._me3_lbl.setStyleSheet(
-                            "font-size:10px;color:#e74c3c;padding:0px 14px 2px 14px;"
-                        )
-                elif item[0] == "me3_update":
-                    installed_ver, latest_ver = item[1], item[2]
-                    self._check_me3_update(installed_ver, latest_ver)
-                elif item[0] == "logo_ready":
-                    game_id, path = item[1], item[2]
-                    if game_id in self._game_buttons:
-                        self._game_buttons[game_id].load_icon(path)
-                elif item[0] == "player_count":
-                    game_id, count = item[1], item[2]
-                    if game_id in self._game_buttons:
-                        self._game_buttons[game_id].set_player_count(count)
-                elif item[0] == "fetch_counts_done":
-                    self._fetching_counts = False
-                elif item[0] == "app_update":
-                    result = item[1]
-                    if not result.get("has_update"):
-                        self._version_lbl.setStyleSheet(
-                            "font-size:10px;color:#4ecca3;padding:6px 14px 2px 14px;"
-                        )
-        except _queue.Empty:
-            pass
+    def _on_me3_version(self, ver: str):
+        if ver:
+            display = re.sub(r'^me3\s+', '', ver)
+            self._me3_lbl.setText(f"ME3: {display}")
+            self._set_state(self._me3_lbl, "")
+        else:
+            self._me3_lbl.setText("ME3: not found")
+            self._set_state(self._me3_lbl, "error")
+
+    @staticmethod
+    def _set_state(lbl: QLabel, state: str):
+        """Switch a footer label's colour via its `state` QSS property."""
+        lbl.setProperty("state", state)
+        lbl.style().unpolish(lbl)
+        lbl.style().polish(lbl)
+
+    def _on_logo_ready(self, game_id: str, path: str):
+        if game_id in self._game_buttons:
+            self._game_buttons[game_id].load_icon(path)
+
+    def _on_player_count(self, game_id: str, count):
+        if game_id in self._game_buttons:
+            self._game_buttons[game_id].set_player_count(count)
+
+    def _on_counts_fetched(self, sig: tuple):
+        self._last_counts_sig = sig
+        self._last_counts_at = time.time()
+
+    def _on_app_update(self, result: dict):
+        if not result.get("has_update"):
+            self._set_state(self._version_lbl, "ok")
 
     def _check_me3_update(self, installed_ver: str, latest_ver: str):
         """Compare installed and latest ME3 versions, prompt update if newer."""
-        import re
         def _norm(v: str) -> str:
             # Strip prefixes like "me3 " or "v"
             v = re.sub(r'^(me3\s+|[vV])', '', v.strip())
@@ -398,9 +543,7 @@ class Sidebar(QWidget):
         inst = _norm(installed_ver)
         latest = _norm(latest_ver)
         if inst == latest:
-            self._me3_lbl.setStyleSheet(
-                "font-size:10px;color:#4ecca3;padding:0px 14px 2px 14px;"
-            )
+            self._set_state(self._me3_lbl, "ok")
             return
 
         # Simple version comparison via tuple
@@ -408,9 +551,7 @@ class Sidebar(QWidget):
             inst_parts = tuple(int(x) for x in inst.split("."))
             latest_parts = tuple(int(x) for x in latest.split("."))
             if inst_parts >= latest_parts:
-                self._me3_lbl.setStyleSheet(
-                    "font-size:10px;color:#4ecca3;padding:0px 14px 2px 14px;"
-                )
+                self._set_state(self._me3_lbl, "ok")
                 return
         except ValueError:
             # Non-numeric version, fall back to string comparison
@@ -418,25 +559,18 @@ class Sidebar(QWidget):
                 return
 
         self._me3_lbl.setText(f"ME3: {inst}")
-        self._me3_lbl.setStyleSheet(
-            "font-size:10px;color:#3a3a5a;padding:0px 14px 2px 14px;"
-        )
+        self._set_state(self._me3_lbl, "")
         self._me3_update_btn.setText(f"Update to {latest_ver}")
         self._me3_update_btn.setVisible(True)
         self._me3_update_btn.clicked.connect(lambda: self._prompt_me3_update(latest_ver))
 
     def _prompt_me3_update(self, latest_ver: str):
-        from app.ui.dialogs.me3_update_dialog import ME3UpdateDialog
         dlg = ME3UpdateDialog(self._config, latest_ver, parent=self.window())
         if dlg.exec():
-            from app.core.me3_service import get_me3_version
-            import re
             ver = get_me3_version(self._config.get_me3_path())
             display = re.sub(r'^me3\s+', '', ver) if ver else "updated"
             self._me3_lbl.setText(f"ME3: {display}")
-            self._me3_lbl.setStyleSheet(
-                "font-size:10px;color:#4ecca3;padding:0px 14px 2px 14px;"
-            )
+            self._set_state(self._me3_lbl, "ok")
             self._me3_update_btn.setVisible(False)
 
     @property
@@ -4,18 +4,103 @@ Launch tab — launch game via ME3 or direct, desktop shortcut, player count.
 
 import os
 import subprocess
-import threading
-import queue as _queue
+import weakref
+from shiboken6 import isValid
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                                QPushButton, QFrame, QSizePolicy)
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QPixmap, QFont
+                                QPushButton, QFrame, QSizePolicy, QDialog)
+from PySide6.QtCore import (Qt, Signal, Slot, QTimer, QSize, QBuffer, QByteArray,
+                            QIODevice, QUrl, QFileSystemWatcher)
+from PySide6.QtGui import QPixmap, QFont, QImage, QImageReader
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from app.config.config_manager import ConfigManager
 from app.config.game_definitions import GAME_DEFINITIONS
+from app.core.ini_parser import read_ini_value, save_ini_settings
 from app.core.me3_service import (launch_game_with_me3, launch_game_direct,
                                   find_me3_executable, create_desktop_shortcut,
                                   ME3_GAME_MAP)
-from app.services.steam_service import get_player_count, download_cover_art
+from app.services.steam_service import (get_player_count_async, get_fresh_player_count,
+                                        player_counts_suspended,
+                                        get_cover_art_url)
+from app.services import cover_cache
+from app.ui import bg_scheduler
+from app.ui.dialogs.coop_password_dialog import CoopPasswordDialog
+
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+_COVERS_DIR = os.path.join(_APP_ROOT, "resources", "covers")
+
+# One timer refreshes the player count of every visible tab
+_PLAYER_COUNT_INTERVAL = 60000
+_live_tabs: "weakref.WeakSet[LaunchTab]" = weakref.WeakSet()
+_player_timer: QTimer | None = None
+
+# Final 160x240 cover pixmaps by Steam app id, shared by every tab
+_COVER_SIZE = QSize(160, 240)
+_COVER_PIXMAPS: dict[int, QPixmap] = {}
+
+# Cover downloads from every tab share one connection pool
+_cover_nam: QNetworkAccessManager | None = None
+
+
+def _cover_network() -> QNetworkAccessManager:
+    global _cover_nam
+    if _cover_nam is None:
+        _cover_nam = QNetworkAccessManager()
+    return _cover_nam
+
+
+def _decode_cover(data: bytes) -> QImage | None:
+    """Decode cover bytes at (roughly) the label size and centre-crop them.
+
+    Setting the scaled size before read() lets the JPEG plugin scale
+    during decoding instead of expanding the full 600x900 image first.
+    Safe to call from a worker thread.
+    """
+    buf = QBuffer()
+    buf.setData(QByteArray(data))
+    buf.open(QIODevice.ReadOnly)
+    reader = QImageReader(buf)
+    reader.setAutoTransform(True)
+    src = reader.size()
+    if src.isValid():
+        reader.setScaledSize(src.scaled(_COVER_SIZE, Qt.KeepAspectRatioByExpanding))
+    img = reader.read()
+    if img.isNull():
+        return None
+    if img.width() < _COVER_SIZE.width() or img.height() < _COVER_SIZE.height():
+        img = img.scaled(_COVER_SIZE, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+    x = max(0, (img.width() - _COVER_SIZE.width()) // 2)
+    y = max(0, (img.height() - _COVER_SIZE.height()) // 2)
+    return img.copy(x, y, _COVER_SIZE.width(), _COVER_SIZE.height())
+
+
+def _refresh_live_tabs():
+    for tab in list(_live_tabs):
+        if isValid(tab):
+            tab._fetch_player_count()
+        else:
+            _live_tabs.discard(tab)
+
+
+def _register_for_refresh(tab: "LaunchTab"):
+    global _player_timer
+    if _player_timer is None:
+        _player_timer = QTimer()
+        _player_timer.timeout.connect(_refresh_live_tabs)
+    _live_tabs.add(tab)
+    if not _player_timer.isActive():
+        _player_timer.start(_PLAYER_COUNT_INTERVAL)
+
+
+def _unregister_for_refresh(tab: "LaunchTab"):
+    _live_tabs.discard(tab)
+    if not _live_tabs and _player_timer is not None:
+        _player_timer.stop()
+
+
+def _player_count_text(count: int | None) -> str:
+    if count is None:
+        return "👥 Player count unavailable"
+    return f"👥 {count:,} players online now"
 
 
 class LaunchTab(QWidget):
@@ -29,41 +114,30 @@ class LaunchTab(QWidget):
         self._gdef = GAME_DEFINITIONS.get(game_id, {})
         self._process = None
         self._fetching_count = False
-
-        # Thread-safe queue: daemon threads POST results here, never touch self
-        self._pending: _queue.SimpleQueue = _queue.SimpleQueue()
-
-        # Drain the queue on the main thread every 100 ms
-        self._poll_timer = QTimer(self)
-        self._poll_timer.timeout.connect(self._poll_updates)
-        self._poll_timer.start(100)
+        self._cover_app_id = None
+        self._cover_requested = False
+        self._me3_exe: tuple[str, str] | None = None  # (configured path, found exe)
+        self._me3_cache: tuple[bool, str | None, bool] | None = None
+        # Co-op INI last seen with a password; forgotten when the file changes
+        self._coop_pw_ini: str | None = None
+        self._coop_watcher: QFileSystemWatcher | None = None
 
         self._build()
 
-        # Delay thread start until the event loop is running
-        QTimer.singleShot(0, self._load_cover_async)
-        QTimer.singleShot(0, self._fetch_player_count)
-
-        # Recurring player count refresh every 5 seconds
-        self._player_timer = QTimer(self)
-        self._player_timer.timeout.connect(self._fetch_player_count)
-        self._player_timer.start(60000)
-
     # ------------------------------------------------------------------
-    # Main-thread queue drain (safe — QTimer stops when widget deleted)
+    # Visibility — hidden tabs neither load covers nor poll Steam
     # ------------------------------------------------------------------
-    def _poll_updates(self):
-        try:
-            while True:
-                tag, data = self._pending.get_nowait()
-                if tag == "cover":
-                    self._apply_cover(data)
-                elif tag == "count":
-                    self._apply_player_count(data)
-                elif tag == "count_done":
-                    self._fetching_count = False
-        except _queue.Empty:
-            pass
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._cover_requested:
+            self._cover_requested = True
+            QTimer.singleShot(0, self._load_cover_async)
+        QTimer.singleShot(0, self._fetch_player_count)
+        _register_for_refresh(self)
+
+    def hideEvent(self, event):
+        _unregister_for_refresh(self)
+        super().hideEvent(event)
 
     # ------------------------------------------------------------------
     # UI build
@@ -128,7 +202,7 @@ class LaunchTab(QWidget):
         self._launch_btn.setObjectName("btn_launch")
         self._launch_btn.setFixedHeight(48)
         self._launch_btn.setFixedWidth(220)
-        self._launch_btn.setEnabled(launcher_exists or bool(ME3_GAME_MAP.get(self._game_id)))
+        self._launch_btn.setEnabled(launcher_exists or self._me3_state()[2])
         self._launch_btn.clicked.connect(self._on_launch)
         center_layout.addWidget(self._launch_btn, alignment=Qt.AlignHCenter)
 
@@ -150,10 +224,25 @@ class LaunchTab(QWidget):
         layout.addWidget(center, alignment=Qt.AlignHCenter)
         layout.addStretch()
 
+    def _find_me3(self) -> str | None:
+        """find_me3_executable, reusing the last hit while it still exists."""
+        configured = self._config.get_me3_path()
+        if (self._me3_exe and self._me3_exe[0] == configured
+                and os.path.isfile(self._me3_exe[1])):
+            return self._me3_exe[1]
+        me3_path = find_me3_executable(configured)
+        self._me3_exe = (configured, me3_path) if me3_path else None
+        return me3_path
+
+    def _me3_state(self) -> tuple[bool, str | None, bool]:
+        """(use ME3, ME3 exe, game has ME3 support), cached until refresh()."""
+        if self._me3_cache is None:
+            self._me3_cache = (self._config.get_use_me3(), self._find_me3(),
+                               bool(ME3_GAME_MAP.get(self._game_id)))
+        return self._me3_cache
+
     def _update_mode_label(self):
-        use_me3 = self._config.get_use_me3()
-        me3_path = find_me3_executable(self._config.get_me3_path())
-        has_me3_support = bool(ME3_GAME_MAP.get(self._game_id))
+        use_me3, me3_path, has_me3_support = self._me3_state()
 
         if use_me3 and me3_path and has_me3_support:
             self._mode_lbl.setText("via Mod Engine 3")
@@ -173,9 +262,10 @@ class LaunchTab(QWidget):
         self._launch_btn.setEnabled(False)
         self._launch_btn.setText("Launching…")
 
-        use_me3 = self._config.get_use_me3()
-        me3_path = find_me3_executable(self._config.get_me3_path())
-        has_me3_support = bool(ME3_GAME_MAP.get(self._game_id))
+        use_me3, me3_path, has_me3_support = self._me3_state()
+        if me3_path and not os.path.isfile(me3_path):
+            self._me3_cache = None
+            use_me3, me3_path, has_me3_support = self._me3_state()
 
         def _cb(msg):
             self.log_message.emit(msg, "info")
@@ -223,14 +313,14 @@ class LaunchTab(QWidget):
         ini_path = self._find_coop_ini()
         if not ini_path:
             return True
+        if ini_path == self._coop_pw_ini:
+            return True
 
-        from app.core.ini_parser import read_ini_value, save_ini_settings
         password = read_ini_value(ini_path, "cooppassword")
         if password:
+            self._watch_coop_ini(ini_path)
             return True
 
-        from PySide6.QtWidgets import QDialog
-        from app.ui.dialogs.coop_password_dialog import CoopPasswordDialog
         dlg = CoopPasswordDialog(self._game_info.get("name", self._game_id), parent=self)
         if dlg.exec() != QDialog.Accepted:
             return False
@@ -239,33 +329,89 @@ class LaunchTab(QWidget):
         self.log_message.emit(f"Co-op password saved", "info")
         return True
 
+    def _watch_coop_ini(self, ini_path: str):
+        """Skip re-reading ini_path until it changes on disk."""
+        if self._coop_watcher is None:
+            self._coop_watcher = QFileSystemWatcher(self)
+            self._coop_watcher.fileChanged.connect(self._on_coop_ini_changed)
+        if ini_path not in self._coop_watcher.files():
+            self._coop_watcher.addPath(ini_path)
+        self._coop_pw_ini = ini_path
+
+    def _on_coop_ini_changed(self, path: str):
+        if path == self._coop_pw_ini:
+            self._coop_pw_ini = None
+        self._coop_watcher.removePath(path)
+
     def _on_shortcut(self):
         launcher = self._game_info.get("launcher_path", "")
-        result = create_desktop_shortcut(self._game_info["name"], launcher)
+        name = self._game_info["name"]
+        self._shortcut_btn.setEnabled(False)
+        bg_scheduler.submit(lambda: create_desktop_shortcut(name, launcher),
+                            self, "_on_shortcut_done")
+
+    @Slot("QVariant")
+    def _on_shortcut_done(self, result: dict | None):
+        self._shortcut_btn.setEnabled(True)
+        if result is None:
+            result = {"success": False, "message": "Failed to create desktop shortcut"}
         level = "success" if result["success"] else "error"
         self.log_message.emit(result["message"], level)
 
     # ------------------------------------------------------------------
-    # Background loaders — capture only the queue, never self
+    # Background loaders — run on the shared pool, never touch self
     # ------------------------------------------------------------------
     def _load_cover_async(self):
         app_id = self._game_info.get("steam_app_id")
         if not app_id:
             return
+        if app_id in _COVER_PIXMAPS:
+            self._set_cover(app_id, _COVER_PIXMAPS[app_id])
+            return
 
-        cache_dir = os.path.join(os.path.dirname(os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))), "resources", "covers")
-        os.makedirs(cache_dir, exist_ok=True)
-        cover_path = os.path.join(cache_dir, f"{app_id}.jpg")
-        pending = self._pending  # capture queue object, NOT self
+        bundled_path = os.path.join(_COVERS_DIR, f"{app_id}.jpg")
 
         def _load():
-            if not os.path.isfile(cover_path):
-                download_cover_art(app_id, cover_path)
-            if os.path.isfile(cover_path):
-                pending.put(("cover", cover_path))
+            # Covers shipped in resources/covers win; everything else is
+            # downloaded once into the size-capped cover cache.
+            if os.path.isfile(bundled_path):
+                with open(bundled_path, "rb") as f:
+                    return _decode_cover(f.read())
+            data = cover_cache.get(app_id)
+            if data is None:
+                bg_scheduler.post(self, "_download_cover", app_id)
+                return None
+            if data is cover_cache.NEGATIVE:
+                return None
+            return _decode_cover(data)
+
+        bg_scheduler.submit(_load, self, "_apply_cover")
+
+    @Slot("QVariant")
+    def _download_cover(self, app_id: int):
+        req = QNetworkRequest(QUrl(get_cover_art_url(app_id)))
+        req.setHeader(QNetworkRequest.UserAgentHeader, "FromSoftModManager/2.0")
+        req.setTransferTimeout(10000)
+        reply = _cover_network().get(req)
+        reply.finished.connect(lambda: self._on_cover_downloaded(reply, app_id))
+
+    def _on_cover_downloaded(self, reply: QNetworkReply, app_id: int):
+        reply.deleteLater()
+        if not isValid(self):
+            return
+        status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+        if reply.error() != QNetworkReply.NoError:
+            if status == 404:
+                bg_scheduler.submit(lambda: cover_cache.put(app_id, None, status=404),
+                                    self, "_apply_cover")
+            return
+        data = reply.readAll().data()
+
+        def _store():
+            cover_cache.put(app_id, data)
+            return _decode_cover(data)
 
-        threading.Thread(target=_load, daemon=True).start()
+        bg_scheduler.submit(_store, self, "_apply_cover")
 
     def _fetch_player_count(self):
         app_id = self._game_info.get("steam_app_id")
@@ -274,40 +420,46 @@ class LaunchTab(QWidget):
             return
         if self._fetching_count:
             return
+        fresh = get_fresh_player_count(app_id)
+        if fresh is not None:
+            self._apply_player_count(_player_count_text(fresh))
+            return
+        if player_counts_suspended():
+            # Steam is failing; keep the network quiet until the backoff ends
+            self._apply_player_count(_player_count_text(None))
+            return
         self._fetching_count = True
-        pending = self._pending  # capture queue object, NOT self
-
-        def _work():
-            try:
-                count = get_player_count(app_id)
-                text = (
-                    f"👥 {count:,} players online now" if count is not None
-                    else "👥 Player count unavailable"
-                )
-                pending.put(("count", text))
-            finally:
-                pending.put(("count_done", None))
-
-        threading.Thread(target=_work, daemon=True).start()
+        get_player_count_async(app_id, lambda count: bg_scheduler.post(
+            self, "_apply_player_count", _player_count_text(count)))
 
     # ------------------------------------------------------------------
-    # UI update slots (always called on main thread via _poll_updates)
+    # UI update slots (always called on main thread via bg_scheduler)
     # ------------------------------------------------------------------
-    def _apply_cover(self, cover_path: str):
-        if cover_path and os.path.isfile(cover_path):
-            pix = QPixmap(cover_path).scaled(
-                160, 240, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation
-            )
-            x = max(0, (pix.width() - 160) // 2)
-            y = max(0, (pix.height() - 240) // 2)
-            pix = pix.copy(x, y, 160, 240)
-            self._cover.setPixmap(pix)
-            self._cover.setText("")
-            self._cover.setStyleSheet("border:1px solid #2a2a4a;border-radius:8px;")
-
-    def _apply_player_count(self, text: str):
-        self._players_lbl.setText(text)
+    @Slot("QVariant")
+    def _apply_cover(self, image: QImage | None):
+        app_id = self._game_info.get("steam_app_id")
+        pix = _COVER_PIXMAPS.get(app_id)
+        if pix is None:
+            if image is None:
+                return
+            pix = _COVER_PIXMAPS[app_id] = QPixmap.fromImage(image)
+        self._set_cover(app_id, pix)
+
+    def _set_cover(self, app_id: int, pix: QPixmap):
+        if self._cover_app_id == app_id:
+            return
+        self._cover_app_id = app_id
+        self._cover.setPixmap(pix)
+        self._cover.setText("")
+        self._cover.setStyleSheet("border:1px solid #2a2a4a;border-radius:8px;")
+
+    @Slot("QVariant")
+    def _apply_player_count(self, text: str | None):
+        self._fetching_count = False
+        if text is not None:
+            self._players_lbl.setText(text)
 
     def refresh(self, game_info: dict):
         self._game_info = game_info
+        self._me3_cache = None
         self._update_mode_label()
@@ -94,6 +94,7 @@ class _ModCard(QFrame):
         self._virtual = bool(mod.get("_virtual"))   # not yet installed
         self._has_update = False
         self._latest_version = ""
+        self._installing = False
         self.setObjectName("card")
         self._build()
 
@@ -335,6 +336,7 @@ class _ModCard(QFrame):
             self._status_lbl.setStyleSheet("font-size:11px;color:#4ecca3;")
 
     def set_installing(self, visible: bool, pct: int = 0, msg: str = ""):
+        self._installing = visible
         self._progress.setVisible(visible)
         if visible:
             self._progress.setValue(pct)
@@ -1402,6 +1404,12 @@ class ModsTab(QWidget):
                     pkg_paths.append(p)
         write_me3_profile(self._game_id, pkg_paths, me3_path, native_dlls=native_paths)
 
+    def is_busy(self) -> bool:
+        """True while any card, installed or trending, is installing or updating."""
+        return any(card._installing
+                   for cards in (self._cards, self._trending_cards)
+                   for card in cards.values())
+
     # ------------------------------------------------------------------
     # Refresh (called after scan / settings saved)
     # ------------------------------------------------------------------
@@ -57,6 +57,10 @@ class TerminalWidget(QWidget):
 
     def log(self, message: str, level: str = "info"):
         """Append a timestamped message. level: 'info'|'success'|'warn'|'error'"""
+        self.log_batch([(message, level)])
+
+    def log_batch(self, entries: list[tuple[str, str]]):
+        """Append several (message, level) pairs with a single repaint."""
         ts = datetime.now().strftime("%H:%M:%S")
         colors = {
             "info": "#8888aa",
@@ -64,9 +68,14 @@ class TerminalWidget(QWidget):
             "warn": "#f0c040",
             "error": "#e94560",
         }
-        color = colors.get(level, "#8888aa")
-        html = f'<span style="color:#555577">[{ts}]</span> <span style="color:{color}">{message}</span>'
-        self._text.appendHtml(html)
+        self._text.setUpdatesEnabled(False)
+        try:
+            for message, level in entries:
+                color = colors.get(level, "#8888aa")
+                html = f'<span style="color:#555577">[{ts}]</span> <span style="color:{color}">{message}</span>'
+                self._text.appendHtml(html)
+        finally:
+            self._text.setUpdatesEnabled(True)
         self._text.moveCursor(QTextCursor.End)
 
     def log_success(self, msg: str): self.log(msg, "success")
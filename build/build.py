@@ -32,6 +32,7 @@ cmd = [
     "--hidden-import", "PySide6.QtCore",
     "--hidden-import", "PySide6.QtGui",
     "--hidden-import", "PySide6.QtWidgets",
+    "--hidden-import", "PySide6.QtNetwork",
     "--hidden-import", "app.config.game_definitions",
     "--hidden-import", "app.config.config_manager",
     "--hidden-import", "app.core.game_scanner",
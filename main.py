@@ -8,7 +8,10 @@ import sys
 import faulthandler
 if sys.stderr is not None:
     faulthandler.enable()
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 # Ensure the app directory is on the path when running from PyInstaller
 if getattr(sys, 'frozen', False):
@@ -32,6 +35,16 @@ logging.basicConfig(
     format='%(asctime)s [%(levelname)s] %(name)s: %(message)s'
 )
 
+# Loggers only enqueue records; the configured handlers write from a
+# listener thread so the GUI thread never blocks on stderr
+_log_queue = queue.SimpleQueue()
+_root_logger = logging.getLogger()
+_log_listener = QueueListener(_log_queue, *_root_logger.handlers,
+                              respect_handler_level=True)
+_root_logger.handlers = [QueueHandler(_log_queue)]
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 
 def main():
     from PySide6.QtWidgets import QApplication
@@ -76,6 +89,9 @@ def main():
     # Config
     from app.config.config_manager import ConfigManager
     config = ConfigManager()
+    # Debug diagnostics (scan, update checks) are off unless config asks
+    level = str(config.get("log_level", "INFO")).upper()
+    logging.getLogger().setLevel(getattr(logging, level, logging.INFO))
 
     # ME3 is mandatory — prompt to install if missing
     from app.core.me3_service import find_me3_executable
@@ -130,7 +146,7 @@ def main():
     def _check_app_update():
         result = check_for_update()
         if result.get("has_update"):
-            window._pending.put(("app_update", result))
+            window._bridge.app_update.emit(result)
 
     threading.Thread(target=_check_app_update, daemon=True).start()
 